@@ -23,34 +23,139 @@ if "bpy" in locals():
         importlib.reload(properties)
     if "utils" in locals():
         importlib.reload(utils)
+    if "lazy_register" in locals():
+        importlib.reload(lazy_register)
+    if "api" in locals():
+        importlib.reload(api)
 
-from . import operators, ui, properties, utils
+from . import properties, utils, lazy_register
+
+# The API, operator and UI modules are imported at registration, or on first
+# use when lazy registration is enabled (see lazy_register.py)
+if not lazy_register.is_lazy_registration_enabled():
+    from . import api, operators, ui
+
+
+def register_operators_and_ui():
+    """Import and register the operator and UI modules"""
+    from . import api, operators, ui
+
+    operators.register()
+    ui.register()
+
+
+def unregister_operators_and_ui():
+    """Unregister the operator and UI modules"""
+    from . import operators, ui
+
+    ui.unregister()
+    operators.unregister()
 
-modules = [
-    properties,
-    operators,
-    ui,
-]
 
 def register():
-    # Load custom icons first
-    utils.load_icons()
+    # Register properties (custom icons are loaded on first use)
+    properties.register()
 
-    # Register modules
-    for module in modules:
-        module.register()
+    # Register operators and UI, or stubs that register them on first use
+    if lazy_register.is_lazy_registration_enabled():
+        lazy_register.register_stubs(register_operators_and_ui)
+        if bpy.app.background and lazy_register.LOAD_IN_BACKGROUND:
+            lazy_register.load_now()
+    else:
+        register_operators_and_ui()
 
-    # Register file load handler to refresh icons
+    # Register file load handler to refresh changed icons
     bpy.app.handlers.load_post.append(utils.load_icons_on_file_load)
 
+    # Register handlers that keep the keyframe index in sync
+    bpy.app.handlers.depsgraph_update_post.append(utils.invalidate_keyframe_index_on_update)
+    bpy.app.handlers.load_post.append(utils.invalidate_keyframe_index_on_reload)
+    bpy.app.handlers.undo_post.append(utils.invalidate_keyframe_index_on_reload)
+    bpy.app.handlers.redo_post.append(utils.invalidate_keyframe_index_on_reload)
+
+    # Register handlers that keep the layer name index in sync
+    bpy.app.handlers.depsgraph_update_post.append(utils.invalidate_layer_index_on_update)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        handlers.append(utils.invalidate_layer_index_on_reload)
+
+    # Register handlers that drop cached layer solo states
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        handlers.append(utils.clear_solo_cache_on_reload)
+
+    # Subscribe to layer changes, renewed on every file load
+    utils.subscribe_layer_updates()
+    bpy.app.handlers.load_post.append(utils.resubscribe_layer_updates_on_file_load)
+
+    # Register handlers that keep the keyframe mover layer list in sync
+    bpy.app.handlers.depsgraph_update_post.append(utils.sync_layer_settings_on_update)
+    bpy.app.handlers.load_post.append(utils.sync_layer_settings_on_file_load)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        handlers.append(utils.invalidate_layer_settings_on_reload)
+
+    # Count depsgraph evaluations for the operator timings
+    bpy.app.handlers.depsgraph_update_post.append(utils.count_depsgraph_update)
+
+    # Stop running jobs before another file loads
+    bpy.app.handlers.load_pre.append(utils.cancel_jobs_on_file_load)
+
 def unregister():
+    # Unregister job handler and stop running jobs
+    if utils.cancel_jobs_on_file_load in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(utils.cancel_jobs_on_file_load)
+    utils.cancel_all_jobs()
+
+    # Unregister operator timing handler
+    if utils.count_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(utils.count_depsgraph_update)
+
+    # Unregister layer settings sync handlers
+    if utils.sync_layer_settings_on_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(utils.sync_layer_settings_on_update)
+    if utils.sync_layer_settings_on_file_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(utils.sync_layer_settings_on_file_load)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if utils.invalidate_layer_settings_on_reload in handlers:
+            handlers.remove(utils.invalidate_layer_settings_on_reload)
+
+    # Remove layer change subscriptions
+    if utils.resubscribe_layer_updates_on_file_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(utils.resubscribe_layer_updates_on_file_load)
+    utils.unsubscribe_layer_updates()
+
+    # Unregister layer solo handlers
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if utils.clear_solo_cache_on_reload in handlers:
+            handlers.remove(utils.clear_solo_cache_on_reload)
+    utils.clear_solo_cache()
+
+    # Unregister layer name index handlers
+    if utils.invalidate_layer_index_on_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(utils.invalidate_layer_index_on_update)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if utils.invalidate_layer_index_on_reload in handlers:
+            handlers.remove(utils.invalidate_layer_index_on_reload)
+    utils.invalidate_layer_index()
+
+    # Unregister keyframe index handlers
+    if utils.invalidate_keyframe_index_on_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(utils.invalidate_keyframe_index_on_update)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.undo_post, bpy.app.handlers.redo_post):
+        if utils.invalidate_keyframe_index_on_reload in handlers:
+            handlers.remove(utils.invalidate_keyframe_index_on_reload)
+    utils.invalidate_keyframe_index()
+
     # Unregister file load handler
     if utils.load_icons_on_file_load in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(utils.load_icons_on_file_load)
 
-    # Unregister modules
-    for module in reversed(modules):
-        module.unregister()
+    # Unregister operators and UI (or their stubs if they were never used)
+    if lazy_register.is_lazy_registration_enabled() and not lazy_register.is_loaded():
+        lazy_register.cancel_pending_load()
+        lazy_register.unregister_stubs()
+    else:
+        unregister_operators_and_ui()
+
+    properties.unregister()
 
     # Unload custom icons
     utils.unload_icons()
@@ -0,0 +1,622 @@
+"""
+API - Context-free functions behind the GP Helper operators
+
+Every timing operation is available as a plain function taking explicit
+objects, layers and parameters, instead of reading the scene settings, the
+selection and the editor from the context. They edit the data directly
+(frames.move/copy, foreach_get/foreach_set on F-curves), without the Dope
+Sheet or bpy.ops, so pipeline scripts and background Blender can run them
+in bulk:
+
+    from gp_helper import api
+    api.move_keys([obj], frame=24, offset=4)
+    api.apply_marker_spacing(scene, spacing_method='FIXED', fixed_spacing=6)
+
+The operators are thin wrappers around these functions: they gather the
+targets from the context and the settings from the scene, then report.
+
+The long operations also come as *_steps() generators, the same work split
+into units with progress, that operators run as chunked jobs (utils/jobs.py).
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .utils import (
+    find_layer,
+    find_layers,
+    plan_keyframe_spacing,
+    apply_frame_plan,
+    shift_frames,
+    calculate_safe_backward_offset,
+    calculate_spacing_to_add,
+    run_steps
+)
+from .utils.dissolve import compute_dissolve_keys, compute_chain_keys
+from .utils.fade_profiles import DEFAULT_LUT, expand_fade_keys
+from .utils.fcurve_utils import write_keyframes, shift_keyframes, add_cycles_modifier, ensure_action, remove_fcurves
+from .utils.light_table import create_reference_objects, disable_all_light_tables
+from .utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Timeline markers named with this prefix are marker spacing markers
+SPACING_MARKER_PREFIX = "GP_"
+
+# Keys this close to a marker are used to detect the spacing around it
+SPACING_SEARCH_RANGE = 50
+
+MarkerSpacingResult = namedtuple(
+    "MarkerSpacingResult",
+    ["keys_moved", "frames_added", "markers_processed", "markers_removed"],
+)
+
+
+# ---------------------------------------------------------------------------
+# Targets
+# ---------------------------------------------------------------------------
+
+def get_gp_objects(objects):
+    """Keep the Grease Pencil objects (with data) of an iterable of objects"""
+    return [obj for obj in objects if obj and obj.type == 'GREASEPENCIL' and obj.data]
+
+
+def _target_layers(gp_data, layer_names):
+    """Named layers, or every unlocked layer (hidden ones included)"""
+    if layer_names is not None:
+        return find_layers(gp_data, layer_names)
+    return [layer for layer in gp_data.layers if not layer.lock]
+
+
+def _actions(obj, include_materials):
+    """Actions animating a GP object: object, data and (optionally) materials"""
+    id_blocks = [obj, obj.data]
+    if include_materials:
+        id_blocks.extend(material for material in obj.data.materials if material)
+
+    for id_data in id_blocks:
+        animation_data = id_data.animation_data
+        if animation_data and animation_data.action:
+            yield animation_data.action
+
+
+def _layer_prefixes(names):
+    return tuple(f'layers["{name}"]' for name in names)
+
+
+def _target_fcurves(obj, layer_names, seen):
+    """
+    F-curves in scope, each action visited once across calls sharing `seen`.
+
+    Without layer names, every F-curve of the object, data and material
+    actions except those of locked layers, the same scope as
+    _target_layers(). With layer names, only the F-curves of those layers.
+    """
+    if layer_names is not None:
+        prefixes = _layer_prefixes(layer_names)
+        skipped = ()
+    else:
+        prefixes = None
+        skipped = _layer_prefixes(layer.name for layer in obj.data.layers if layer.lock)
+
+    for action in _actions(obj, include_materials=prefixes is None):
+        pointer = action.as_pointer()
+        if pointer in seen:
+            continue
+        seen.add(pointer)
+
+        for fcurve in action.fcurves:
+            if prefixes is not None and not fcurve.data_path.startswith(prefixes):
+                continue
+            if skipped and fcurve.data_path.startswith(skipped):
+                continue
+            yield fcurve
+
+
+def get_key_frames(objects, layer_names=None):
+    """
+    Get every key frame of some GP objects, drawings and F-curves.
+
+    Args:
+        objects: Objects (non-GP objects are ignored)
+        layer_names: Only the drawings and attribute keys of these layers,
+            or None for every unlocked layer, hidden or not, and every F-curve
+            except those of locked layers
+
+    Returns:
+        set: Frame numbers (F-curve keys truncated to int)
+    """
+    frames = set()
+    seen = set()
+
+    for obj in get_gp_objects(objects):
+        gp_data = obj.data
+        if gp_data.as_pointer() not in seen:
+            seen.add(gp_data.as_pointer())
+            for layer in _target_layers(gp_data, layer_names):
+                frames.update(gp_frame.frame_number for gp_frame in layer.frames)
+
+        for fcurve in _target_fcurves(obj, layer_names, seen):
+            points = fcurve.keyframe_points
+            if not len(points):
+                continue
+            co = np.empty(len(points) * 2, dtype=np.float32)
+            points.foreach_get("co", co)
+            frames.update(co[0::2].astype(np.int64).tolist())
+
+    return frames
+
+
+# ---------------------------------------------------------------------------
+# Moving keys
+# ---------------------------------------------------------------------------
+
+def _move_object_keys(obj, frame, offset, layer_names, seen):
+    """Move the keys of one GP object, skipping data and actions in `seen`"""
+    moved = 0
+
+    gp_data = obj.data
+    if gp_data.as_pointer() not in seen:
+        seen.add(gp_data.as_pointer())
+        for layer in _target_layers(gp_data, layer_names):
+            frame_numbers = [gp_frame.frame_number for gp_frame in layer.frames if gp_frame.frame_number >= frame]
+            moved += shift_frames(layer, frame_numbers, offset)
+
+    for fcurve in _target_fcurves(obj, layer_names, seen):
+        moved += shift_keyframes(fcurve, frame, offset)
+
+    return moved
+
+
+def move_keys(objects, frame, offset, layer_names=None):
+    """
+    Move every key from a frame onward, like selecting to the right of the
+    playhead in the Dope Sheet and moving the selection.
+
+    Drawing frames and F-curve keys on `frame` move too. Data and actions
+    shared between the objects are moved once.
+
+    Args:
+        objects: Objects (non-GP objects are ignored)
+        frame: First frame to move
+        offset: Frames to move by (negative moves left)
+        layer_names: Only move the drawings and attribute keys of these
+            layers, or None for every unlocked layer, hidden or not, and every F-curve
+            except those of locked layers
+
+    Returns:
+        int: Number of drawing frames and F-curve keys moved
+    """
+    if not offset:
+        return 0
+
+    seen = set()
+    moved = sum(_move_object_keys(obj, frame, offset, layer_names, seen) for obj in get_gp_objects(objects))
+
+    log.debug("Moved %d keys from frame %d by %d", moved, frame, offset)
+    return moved
+
+
+def safe_backward_offset(objects, frame, offset, layer_names=None):
+    """
+    Get the offset move_keys() can move left by without reaching `frame`.
+
+    Args:
+        objects: Objects (non-GP objects are ignored)
+        frame: Playhead frame
+        offset: Requested offset (positive, towards the left)
+        layer_names: Same scope as move_keys()
+
+    Returns:
+        int: Offset to use, 0 if a key sits on `frame` or no key can move
+    """
+    key_frames = get_key_frames(objects, layer_names)
+    if frame in key_frames:
+        return 0
+
+    affected = [key_frame for key_frame in key_frames if key_frame > frame]
+    return calculate_safe_backward_offset(frame, offset, affected)
+
+
+# ---------------------------------------------------------------------------
+# Keyframe spacing
+# ---------------------------------------------------------------------------
+
+def get_selected_frames(layer):
+    """Get the sorted frame numbers of the selected drawing frames of a layer"""
+    return sorted(gp_frame.frame_number for gp_frame in layer.frames if gp_frame.select)
+
+
+def space_keys_steps(layers, spacing, frames=None):
+    """Steps of space_keys(), one per layer (see utils/jobs.py)"""
+    layers = list(layers)
+    wanted = set(frames) if frames is not None else None
+    layers_spaced = 0
+    collisions = 0
+
+    for index, layer in enumerate(layers):
+        all_frames = sorted(gp_frame.frame_number for gp_frame in layer.frames)
+        if wanted is None:
+            selected_frames = get_selected_frames(layer)
+        else:
+            selected_frames = [frame_number for frame_number in all_frames if frame_number in wanted]
+
+        if len(selected_frames) >= 2:
+            plan = plan_keyframe_spacing(all_frames, selected_frames, spacing)
+            layer_collisions = apply_frame_plan(layer, plan)
+            if layer_collisions:
+                log.warning("%d collision(s) on layer %s, duplicates removed", layer_collisions, layer.name)
+
+            collisions += layer_collisions
+            layers_spaced += 1
+
+        yield index + 1, len(layers)
+
+    return layers_spaced, collisions
+
+
+def space_keys(layers, spacing, frames=None):
+    """
+    Evenly space drawing frames, layer by layer.
+
+    The spaced frames are laid out every `spacing` frames from the first
+    one; the other frames of the layer follow (see plan_keyframe_spacing).
+
+    Args:
+        layers: GP layers
+        spacing: Frame interval between the spaced frames
+        frames: Frame numbers to space on every layer, or None for the
+            selected frames of each layer
+
+    Returns:
+        tuple: (layers spaced, frames lost to collisions)
+    """
+    return run_steps(space_keys_steps(layers, spacing, frames))
+
+
+# ---------------------------------------------------------------------------
+# Marker spacing
+# ---------------------------------------------------------------------------
+
+def get_spacing_markers(scene):
+    """Get the marker spacing markers of a scene (names starting with GP_)"""
+    return [marker for marker in scene.timeline_markers if marker.name.startswith(SPACING_MARKER_PREFIX)]
+
+
+def apply_marker_spacing_steps(
+    scene,
+    objects=None,
+    marker_frames=None,
+    spacing_method='MULTIPLIER',
+    fixed_spacing=20,
+    spacing_multiplier=2.0,
+    auto_detect_spacing=True,
+    remove_markers=False,
+):
+    """Steps of apply_marker_spacing(), one per marker and object (see utils/jobs.py)"""
+    if objects is None:
+        objects = scene.objects
+    objects = get_gp_objects(objects)
+
+    if marker_frames is None:
+        marker_frames = [marker.frame for marker in get_spacing_markers(scene)]
+    marker_frames = sorted(set(marker_frames), reverse=True)
+
+    total = len(marker_frames) * len(objects)
+    done = 0
+
+    # Collected once, then shifted along with the keys
+    key_frames = None
+    if spacing_method != 'FIXED' and auto_detect_spacing:
+        key_frames = np.array(sorted(get_key_frames(objects)), dtype=np.int64)
+
+    keys_moved = 0
+    frames_added = 0
+    for marker_frame in marker_frames:
+        nearby_keyframes = []
+        if key_frames is not None:
+            nearby = key_frames[np.abs(key_frames - marker_frame) <= SPACING_SEARCH_RANGE]
+            nearby_keyframes = np.unique(nearby).tolist()
+
+        spacing_to_add = calculate_spacing_to_add(
+            marker_frame,
+            nearby_keyframes,
+            spacing_method=spacing_method,
+            fixed_spacing=fixed_spacing,
+            spacing_multiplier=spacing_multiplier,
+            auto_detect_spacing=auto_detect_spacing,
+        )
+        log.debug("Marker at frame %d: adding %d frames", marker_frame, spacing_to_add)
+
+        if spacing_to_add <= 0:
+            done += len(objects)
+            yield done, total
+            continue
+
+        # Data shared between the objects moves once per marker
+        seen = set()
+        for obj in objects:
+            keys_moved += _move_object_keys(obj, marker_frame, spacing_to_add, None, seen)
+            done += 1
+            yield done, total
+
+        frames_added += spacing_to_add
+
+        if key_frames is not None:
+            key_frames[key_frames >= marker_frame] += spacing_to_add
+
+    markers_removed = 0
+    if remove_markers and keys_moved:
+        processed = set(marker_frames)
+        for marker in get_spacing_markers(scene):
+            if marker.frame in processed:
+                scene.timeline_markers.remove(marker)
+                markers_removed += 1
+
+    return MarkerSpacingResult(keys_moved, frames_added, len(marker_frames), markers_removed)
+
+
+def apply_marker_spacing(scene, objects=None, marker_frames=None, **settings):
+    """
+    Insert frames at markers, moving every key from each marker onward.
+
+    Markers are processed right to left so the earlier ones stay in place.
+    The spacing detected around a marker uses the keys of the objects
+    within SPACING_SEARCH_RANGE frames, drawings included.
+
+    Args:
+        scene: Scene holding the markers
+        objects: Objects to retime, or None for every GP object of the scene
+        marker_frames: Frames to insert at, or None for the spacing markers
+        spacing_method: 'FIXED' or 'MULTIPLIER' (default)
+        fixed_spacing: Frames to add with the FIXED method (default 20)
+        spacing_multiplier: Factor applied to the existing spacing (default 2)
+        auto_detect_spacing: Detect the existing spacing from the keys (default True)
+        remove_markers: Remove the spacing markers once keys were moved (default False)
+
+    Returns:
+        MarkerSpacingResult
+    """
+    return run_steps(apply_marker_spacing_steps(scene, objects, marker_frames, **settings))
+
+
+# ---------------------------------------------------------------------------
+# Breakdowns
+# ---------------------------------------------------------------------------
+
+def get_breakdown_frame(first_frame, last_frame, position=0.5, custom_offset=None):
+    """
+    Get the breakdown frame between two keys.
+
+    Returns:
+        int or None: Breakdown frame, None if it doesn't fall strictly between them
+    """
+    if custom_offset is not None:
+        breakdown_frame = first_frame + custom_offset
+    else:
+        breakdown_frame = first_frame + int((last_frame - first_frame) * position)
+
+    if not first_frame < breakdown_frame < last_frame:
+        return None
+    return breakdown_frame
+
+
+def add_breakdowns(layers, position=0.5, custom_offset=None, copy_mode='FIRST', frames=None):
+    """
+    Add a breakdown between each pair of consecutive frames, layer by layer.
+
+    Args:
+        layers: GP layers
+        position: Breakdown position between the two keys (0-1)
+        custom_offset: Frames after the first key instead of `position`
+        copy_mode: 'FIRST' or 'LAST' copy that key's drawing, 'BLANK' and
+            'INTERPOLATE' add an empty drawing
+        frames: Frame numbers to add breakdowns between on every layer, or
+            None for the selected frames of each layer
+
+    Returns:
+        tuple: (breakdowns created, layers with breakdowns)
+    """
+    wanted = set(frames) if frames is not None else None
+    created = 0
+    layers_processed = 0
+
+    for layer in layers:
+        existing = {gp_frame.frame_number for gp_frame in layer.frames}
+        if wanted is None:
+            keys = get_selected_frames(layer)
+        else:
+            keys = sorted(existing & wanted)
+
+        layer_created = 0
+        for first_frame, last_frame in zip(keys, keys[1:]):
+            breakdown_frame = get_breakdown_frame(first_frame, last_frame, position, custom_offset)
+            if breakdown_frame is None:
+                continue
+
+            if breakdown_frame in existing:
+                log.debug("Frame %d already exists on %s", breakdown_frame, layer.name)
+                continue
+
+            if copy_mode == 'FIRST':
+                layer.frames.copy(first_frame, breakdown_frame)
+            elif copy_mode == 'LAST':
+                layer.frames.copy(last_frame, breakdown_frame)
+            else:
+                # INTERPOLATE isn't implemented yet, it starts from a blank drawing too
+                layer.frames.new(breakdown_frame)
+
+            existing.add(breakdown_frame)
+            layer_created += 1
+            log.debug("Created breakdown on %s: %d -> %d -> %d", layer.name, first_frame, breakdown_frame, last_frame)
+
+        if layer_created:
+            created += layer_created
+            layers_processed += 1
+
+    return created, layers_processed
+
+
+# ---------------------------------------------------------------------------
+# Dissolves
+# ---------------------------------------------------------------------------
+
+def _check_layers(gp_data, layer_names):
+    missing = [name for name in layer_names if find_layer(gp_data, name) is None]
+    if missing:
+        raise ValueError(f"Could not find layer(s): {', '.join(missing)}")
+
+
+def _write_opacity_steps(gp_data, data_paths, frames, values, interpolation, easing, use_cycles_modifier, total_frames):
+    """Replace the opacity F-curves of the layers, one step per F-curve"""
+    action = ensure_action(gp_data, "GPencilDissolveAction")
+    remove_fcurves(action, set(data_paths))
+
+    for index, (data_path, layer_values) in enumerate(zip(data_paths, values)):
+        fcurve = action.fcurves.new(data_path=data_path)
+        write_keyframes(fcurve, frames, layer_values, interpolation, easing)
+
+        if use_cycles_modifier:
+            add_cycles_modifier(fcurve, 0, total_frames)
+
+        yield index + 1, len(data_paths)
+
+    return len(frames)
+
+
+def setup_dissolve_steps(
+    gp_data,
+    layer1_name,
+    layer2_name,
+    total_frames=90,
+    cycle_length=10,
+    use_cycles_modifier=False,
+    fade_curve='LINEAR',
+    lut=DEFAULT_LUT,
+):
+    """Steps of setup_dissolve(), one per layer (see utils/jobs.py)"""
+    _check_layers(gp_data, (layer1_name, layer2_name))
+
+    # Key one cycle only when the Cycles modifier repeats it
+    key_frames = cycle_length if use_cycles_modifier else total_frames
+    frames, layer1_values, layer2_values = compute_dissolve_keys(key_frames, cycle_length)
+
+    frames, values, interpolation, easing = expand_fade_keys(
+        frames, (layer1_values, layer2_values), fade_curve, lut
+    )
+
+    data_paths = (f'layers["{layer1_name}"].opacity', f'layers["{layer2_name}"].opacity')
+    return (yield from _write_opacity_steps(
+        gp_data, data_paths, frames, values, interpolation, easing, use_cycles_modifier, total_frames
+    ))
+
+
+def setup_dissolve(gp_data, layer1_name, layer2_name, **settings):
+    """
+    Key the opacity of two layers so the first dissolves into the second every cycle.
+
+    Args:
+        gp_data: Grease Pencil data block
+        layer1_name: Dissolve layer (fades out)
+        layer2_name: Base layer (fades in)
+        total_frames: Last frame to key
+        cycle_length: Frames per dissolve cycle
+        use_cycles_modifier: Key one cycle and repeat it with a Cycles modifier
+        fade_curve: Fade profile (see utils/fade_profiles.py)
+        lut: Fade values for the CUSTOM profile
+
+    Returns:
+        int: Keys written per layer
+
+    Raises:
+        ValueError: If a layer doesn't exist
+    """
+    return run_steps(setup_dissolve_steps(gp_data, layer1_name, layer2_name, **settings))
+
+
+def setup_dissolve_chain_steps(
+    gp_data,
+    layer_names,
+    total_frames=90,
+    cycle_length=10,
+    use_cycles_modifier=False,
+    fade_curve='LINEAR',
+    lut=DEFAULT_LUT,
+):
+    """Steps of setup_dissolve_chain(), one per layer (see utils/jobs.py)"""
+    if len(layer_names) < 2:
+        raise ValueError("A dissolve chain needs at least 2 layers")
+    _check_layers(gp_data, layer_names)
+
+    layer_count = len(layer_names)
+
+    # Key one full rotation only when the Cycles modifier repeats it
+    key_frames = layer_count * cycle_length if use_cycles_modifier else total_frames
+    frames, values = compute_chain_keys(layer_count, key_frames, cycle_length)
+
+    frames, values, interpolation, easing = expand_fade_keys(frames, values, fade_curve, lut)
+
+    data_paths = [f'layers["{name}"].opacity' for name in layer_names]
+    return (yield from _write_opacity_steps(
+        gp_data, data_paths, frames, values, interpolation, easing, use_cycles_modifier, total_frames
+    ))
+
+
+def setup_dissolve_chain(gp_data, layer_names, **settings):
+    """
+    Key the opacity of a chain of layers to crossfade through them in order.
+
+    Args:
+        gp_data: Grease Pencil data block
+        layer_names: Layers of the chain, in order (at least 2)
+        total_frames, cycle_length, use_cycles_modifier, fade_curve, lut:
+            Same as setup_dissolve()
+
+    Returns:
+        int: Keys written per layer
+
+    Raises:
+        ValueError: With fewer than 2 layers, or if a layer doesn't exist
+    """
+    return run_steps(setup_dissolve_chain_steps(gp_data, layer_names, **settings))
+
+
+# ---------------------------------------------------------------------------
+# Light table
+# ---------------------------------------------------------------------------
+
+def light_table_enable(scene, objects, reference_frame=None):
+    """
+    Show GP objects locked to a reference frame, using the scene's light table settings.
+
+    Args:
+        scene: Scene holding the light table settings
+        objects: Source GP objects
+        reference_frame: Frame to lock the references to, or None to keep
+            the scene's reference frame
+
+    Returns:
+        int: Number of reference objects created
+    """
+    props = scene.gph_light_table_props
+    if reference_frame is not None:
+        props.reference_frame = reference_frame
+
+    created = create_reference_objects(scene, get_gp_objects(objects))
+    if created:
+        props.enabled = True
+
+    return created
+
+
+def light_table_disable(scene):
+    """
+    Remove every light table reference object.
+
+    Returns:
+        int: Number of reference objects removed
+    """
+    removed = disable_all_light_tables()
+    scene.gph_light_table_props.enabled = False
+    return removed
@@ -0,0 +1,167 @@
+"""
+Micro-benchmark of the Dope Sheet header draw callback
+
+Times draw_gp_helper_header against the previous implementation (kept below
+as legacy_draw_gp_helper_header) with a recording stand-in for the layout, so
+only the Python cost of the callback is measured.
+
+Usage:
+    blender --background --factory-startup --python benchmarks/bench_header_draw.py -- --iterations 20000
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from common import import_addon, script_args
+
+
+class FakeLayout:
+    """Layout stand-in that accepts the calls of a header draw"""
+
+    def __init__(self):
+        self.scale_x = 1.0
+        self.alert = False
+        self.calls = 0
+
+    def row(self, align=False):
+        self.calls += 1
+        return self
+
+    def separator(self):
+        self.calls += 1
+
+    def operator(self, idname, **kwargs):
+        self.calls += 1
+        return SimpleNamespace()
+
+    def prop(self, data, prop, **kwargs):
+        self.calls += 1
+
+    def menu(self, idname, **kwargs):
+        self.calls += 1
+
+
+# Set once the add-on is imported
+get_icon = None
+
+
+def legacy_draw_gp_helper_header(self, context):
+    """Header draw before the icon cache (for comparison only)"""
+    layout = self.layout
+    obj = context.active_object
+    if not obj or obj.type != 'GREASEPENCIL':
+        return
+
+    layout.separator()
+
+    kf_props = context.scene.gph_keyframe_props
+    row = layout.row(align=True)
+    backward_icon = get_icon("gph_move_backward")
+    forward_icon = get_icon("gph_move_forward")
+    if backward_icon and backward_icon > 0:
+        row.operator("gph.keyframe_mover_backward", text="", icon_value=backward_icon)
+    else:
+        row.operator("gph.keyframe_mover_backward", text="", icon='BACK')
+    if forward_icon and forward_icon > 0:
+        row.operator("gph.keyframe_mover_forward", text="", icon_value=forward_icon)
+    else:
+        row.operator("gph.keyframe_mover_forward", text="", icon='FORWARD')
+    sub = row.row(align=True)
+    sub.scale_x = 0.5
+    sub.prop(kf_props, "frame_offset", text="")
+
+    props = context.scene.gph_flip_flop_props
+    row = layout.row(align=True)
+    flip_flop_custom_icon = get_icon("gph_flip_flop")
+    if flip_flop_custom_icon and flip_flop_custom_icon > 0:
+        row.operator("gph.flip_flop_toggle", text="", icon_value=flip_flop_custom_icon, depress=props.is_flopped)
+    else:
+        flip_icon = 'LOOP_BACK' if props.is_flopped else 'LOOP_FORWARDS'
+        row.operator("gph.flip_flop_toggle", text="", icon=flip_icon, depress=props.is_flopped)
+    sub = row.row(align=True)
+    sub.scale_x = 0.6
+    sub.prop(props, "stored_frame", text="")
+    row.operator("gph.set_flip_frame", text="", icon_value=get_icon("gph_picker"))
+
+    lt_props = context.scene.gph_light_table_props
+    row = layout.row(align=True)
+    light_table_custom_icon = get_icon("gph_light_table")
+    if light_table_custom_icon and light_table_custom_icon > 0:
+        if lt_props.enabled:
+            row.alert = True
+        row.operator("gph.toggle_light_table", text="", icon_value=light_table_custom_icon, depress=lt_props.enabled)
+    else:
+        if lt_props.enabled:
+            row.alert = True
+            icon = 'OUTLINER_OB_LIGHT'
+        else:
+            icon = 'LIGHT'
+        row.operator("gph.toggle_light_table", text="LT", icon=icon, depress=lt_props.enabled)
+    sub = row.row(align=True)
+    sub.scale_x = 0.6
+    sub.prop(lt_props, "reference_frame", text="")
+    row.operator("gph.set_reference_frame", text="", icon_value=get_icon("gph_picker"))
+
+    spacing_props = context.scene.gph_keyframe_spacing_props
+    row = layout.row(align=True)
+    sub = row.row(align=True)
+    sub.scale_x = 0.6
+    sub.prop(spacing_props, "spacing_frames", text="")
+    spacing_icon = get_icon("gph_space")
+    op_row = row.row(align=True)
+    if spacing_icon and spacing_icon > 0:
+        op = op_row.operator("gph.keyframe_spacing", text="", icon_value=spacing_icon)
+    else:
+        op = op_row.operator("gph.keyframe_spacing", text="", icon='KEYFRAME')
+    op.spacing_frames = spacing_props.spacing_frames
+    op.ripple_edit = spacing_props.ripple_edit
+
+    layout.menu("DOPESHEET_MT_gp_helper_tools", text="", icon='DOWNARROW_HLT')
+
+
+def time_draw(draw, context, iterations):
+    """Get the mean cost of one draw call in microseconds"""
+    header = SimpleNamespace(layout=FakeLayout())
+    seconds = timeit.timeit(lambda: draw(header, context), number=iterations)
+    return seconds / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args(script_args())
+
+    import bpy
+
+    global get_icon
+
+    addon = import_addon()
+    addon.register()
+
+    try:
+        from gp_helper.ui.GPH_header import draw_gp_helper_header
+        get_icon = addon.utils.get_icon
+
+        scene = bpy.context.scene
+        contexts = {
+            "grease pencil": SimpleNamespace(active_object=SimpleNamespace(type='GREASEPENCIL'), scene=scene),
+            "other object": SimpleNamespace(active_object=SimpleNamespace(type='MESH'), scene=scene),
+        }
+
+        print(f"Header draw, {args.iterations} iterations (microseconds per draw)")
+        for label, context in contexts.items():
+            before = time_draw(legacy_draw_gp_helper_header, context, args.iterations)
+            after = time_draw(draw_gp_helper_header, context, args.iterations)
+            print(f"  {label:<14} before {before:8.2f}  after {after:8.2f}  speedup x{before / after:.2f}")
+
+    finally:
+        addon.unregister()
+
+
+if __name__ == "__main__":
+    main()
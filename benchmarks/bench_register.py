@@ -0,0 +1,103 @@
+"""
+Startup benchmark of the add-on import + register()
+
+Each measurement runs in a fresh Blender process, once with eager
+registration and once with lazy registration (GP_HELPER_LAZY_REGISTER=1).
+For the lazy mode, the cost of the deferred registration on first use is
+reported separately.
+
+Usage:
+    blender --background --factory-startup --python benchmarks/bench_register.py -- --repeat 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from common import import_addon, script_args
+
+RESULT_PREFIX = "GPH_BENCH_RESULT "
+
+MODES = {
+    "eager": "",
+    "lazy": "1",
+}
+
+
+def measure():
+    """Time import + register in this process and print the result"""
+    start = time.perf_counter()
+    addon = import_addon()
+    imported = time.perf_counter()
+    # Time the stubs alone, the deferred load is measured below
+    addon.lazy_register.LOAD_IN_BACKGROUND = False
+    addon.register()
+    registered = time.perf_counter()
+
+    result = {
+        "import_ms": (imported - start) * 1000.0,
+        "register_ms": (registered - imported) * 1000.0,
+        "first_use_ms": 0.0,
+    }
+
+    if addon.lazy_register.is_lazy_registration_enabled():
+        start = time.perf_counter()
+        addon.lazy_register.load_now()
+        result["first_use_ms"] = (time.perf_counter() - start) * 1000.0
+
+    addon.unregister()
+
+    print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+
+def run_child(blender, mode):
+    """Run one measurement in a fresh Blender process"""
+    env = dict(os.environ)
+    env["GP_HELPER_LAZY_REGISTER"] = MODES[mode]
+
+    output = subprocess.run(
+        [blender, "--background", "--factory-startup", "--python", __file__, "--", "--child"],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout
+
+    for line in output.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+
+    raise RuntimeError(f"No result in Blender output:\n{output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--blender", help="Blender executable (defaults to the running one)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(script_args())
+
+    if args.child:
+        measure()
+        return
+
+    import bpy
+    blender = args.blender or bpy.app.binary_path
+
+    print(f"import + register(), median of {args.repeat} runs (ms)")
+    for mode in MODES:
+        runs = [run_child(blender, mode) for _ in range(args.repeat)]
+        medians = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+        startup = medians["import_ms"] + medians["register_ms"]
+        print(
+            f"  {mode:<6} import {medians['import_ms']:7.1f}  register {medians['register_ms']:7.1f}"
+            f"  startup {startup:7.1f}  first use {medians['first_use_ms']:7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Shared helpers for the GP Helper benchmarks
+
+The benchmarks run inside Blender:
+    blender --background --factory-startup --python benchmarks/<script>.py -- [options]
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+ADDON_DIR = Path(__file__).resolve().parent.parent
+ADDON_NAME = "gp_helper"
+
+
+def script_args():
+    """Get the command line arguments passed after '--'"""
+    return sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+
+def import_addon():
+    """Import the add-on package from the repository"""
+    if ADDON_NAME in sys.modules:
+        return sys.modules[ADDON_NAME]
+
+    spec = importlib.util.spec_from_file_location(
+        ADDON_NAME, ADDON_DIR / "__init__.py", submodule_search_locations=[str(ADDON_DIR)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[ADDON_NAME] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,473 @@
+"""
+Pure-Python stand-in for bpy
+
+Lets the add-on be imported in plain CPython, and provides a minimal Grease
+Pencil data model (objects, layers, frames, actions, F-curves, keyframe
+points with foreach_get/foreach_set, markers) that the timing algorithms in
+utils/timing.py and utils/keyframe_utils.py can run against. This is meant
+for parameter sweeps and profiling, not for checking Blender behaviour:
+only the parts of the API those algorithms touch are modelled.
+
+Usage:
+    import fake_bpy
+    fake_bpy.install()          # before importing the add-on
+    obj = fake_bpy.make_gp_object(layers=10, frames=100)
+"""
+
+import sys
+import types
+from types import SimpleNamespace
+
+
+# ---------------------------------------------------------------------------
+# Data model
+# ---------------------------------------------------------------------------
+
+# Raw values of the keyframe enums, as foreach_get/foreach_set see them
+KEYFRAME_ENUMS = {
+    "interpolation": (
+        'CONSTANT', 'LINEAR', 'BEZIER', 'BACK', 'BOUNCE', 'CIRC', 'CUBIC',
+        'ELASTIC', 'EXPO', 'QUAD', 'QUART', 'QUINT', 'SINE',
+    ),
+    "easing": ('AUTO', 'EASE_IN', 'EASE_OUT', 'EASE_IN_OUT'),
+}
+
+
+class Keyframe:
+    """Keyframe point, vectors are mutable lists like bpy_prop_array"""
+
+    def __init__(self, frame=0.0, value=0.0):
+        self.co = [float(frame), float(value)]
+        self.handle_left = [float(frame) - 1.0, float(value)]
+        self.handle_right = [float(frame) + 1.0, float(value)]
+        self.handle_left_type = 0
+        self.handle_right_type = 0
+        self.interpolation = 'BEZIER'
+        self.easing = 'AUTO'
+        self.select_control_point = False
+
+
+class KeyframePoints(list):
+    """FCurve.keyframe_points"""
+
+    def add(self, count):
+        self.extend(Keyframe() for _ in range(count))
+
+    def insert(self, frame, value, options=None):
+        for keyframe in self:
+            if keyframe.co[0] == frame:
+                keyframe.co[1] = value
+                return keyframe
+        keyframe = Keyframe(frame, value)
+        self.append(keyframe)
+        self.sort(key=lambda item: item.co[0])
+        return keyframe
+
+    def foreach_get(self, attr, seq):
+        index = 0
+        for keyframe in self:
+            value = getattr(keyframe, attr)
+            if isinstance(value, list):
+                seq[index:index + len(value)] = value
+                index += len(value)
+            elif attr in KEYFRAME_ENUMS:
+                seq[index] = KEYFRAME_ENUMS[attr].index(value)
+                index += 1
+            else:
+                seq[index] = value
+                index += 1
+
+    def foreach_set(self, attr, seq):
+        index = 0
+        for keyframe in self:
+            value = getattr(keyframe, attr)
+            if isinstance(value, list):
+                size = len(value)
+                setattr(keyframe, attr, [float(item) for item in seq[index:index + size]])
+                index += size
+            elif attr in KEYFRAME_ENUMS:
+                setattr(keyframe, attr, KEYFRAME_ENUMS[attr][int(seq[index])])
+                index += 1
+            else:
+                setattr(keyframe, attr, type(value)(seq[index]))
+                index += 1
+
+
+class FCurve:
+    def __init__(self, data_path, index=0, action_group=""):
+        self.data_path = data_path
+        self.array_index = index
+        self.group = action_group or None
+        self.keyframe_points = KeyframePoints()
+        self.modifiers = []
+
+    def update(self):
+        self.keyframe_points.sort(key=lambda item: item.co[0])
+
+    def evaluate(self, frame):
+        """Step evaluation, enough for planning code that samples a curve"""
+        value = 0.0
+        for keyframe in self.keyframe_points:
+            if keyframe.co[0] > frame:
+                break
+            value = keyframe.co[1]
+        return value
+
+
+class FCurves(list):
+    def new(self, data_path, index=0, action_group=""):
+        if self.find(data_path, index=index):
+            raise RuntimeError(f"F-Curve '{data_path}[{index}]' already exists in action")
+        fcurve = FCurve(data_path, index, action_group)
+        self.append(fcurve)
+        return fcurve
+
+    def find(self, data_path, index=0):
+        for fcurve in self:
+            if fcurve.data_path == data_path and fcurve.array_index == index:
+                return fcurve
+        return None
+
+
+class ID:
+    """Data-block with animation data"""
+
+    def __init__(self, name):
+        self.name = name
+        self.animation_data = None
+
+    def animation_data_create(self):
+        if self.animation_data is None:
+            self.animation_data = SimpleNamespace(action=None)
+        return self.animation_data
+
+    def as_pointer(self):
+        return id(self)
+
+    @property
+    def original(self):
+        return self
+
+
+class Action(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.fcurves = FCurves()
+
+
+class Drawing:
+    def __init__(self):
+        self.strokes = []
+
+
+class Frame:
+    def __init__(self, frame_number, drawing=None):
+        self.frame_number = frame_number
+        self.drawing = drawing or Drawing()
+        self.select = False
+        self.keyframe_type = 'KEYFRAME'
+
+
+class Frames(list):
+    """GreasePencilLayer.frames, addressed by frame number"""
+
+    def get(self, frame_number):
+        for gp_frame in self:
+            if gp_frame.frame_number == frame_number:
+                return gp_frame
+        return None
+
+    def new(self, frame_number):
+        if self.get(frame_number) is not None:
+            raise RuntimeError(f"Frame {frame_number} already exists")
+        gp_frame = Frame(frame_number)
+        self.append(gp_frame)
+        return gp_frame
+
+    def remove(self, frame_number):
+        gp_frame = self.get(frame_number)
+        if gp_frame is None:
+            raise RuntimeError(f"Frame {frame_number} not found")
+        list.remove(self, gp_frame)
+
+    def copy(self, from_frame_number, to_frame_number, instance_drawing=False):
+        source = self.get(from_frame_number)
+        if source is None:
+            raise RuntimeError(f"Frame {from_frame_number} not found")
+        if self.get(to_frame_number) is not None:
+            raise RuntimeError(f"Frame {to_frame_number} already exists")
+        drawing = source.drawing if instance_drawing else Drawing()
+        gp_frame = Frame(to_frame_number, drawing)
+        gp_frame.keyframe_type = source.keyframe_type
+        self.append(gp_frame)
+        return gp_frame
+
+    def move(self, from_frame_number, to_frame_number):
+        gp_frame = self.get(from_frame_number)
+        if gp_frame is None:
+            raise RuntimeError(f"Frame {from_frame_number} not found")
+        if self.get(to_frame_number) is not None:
+            raise RuntimeError(f"Frame {to_frame_number} already exists")
+        gp_frame.frame_number = to_frame_number
+        return gp_frame
+
+
+class Layer:
+    def __init__(self, name):
+        self.name = name
+        self.lock = False
+        self.hide = False
+        self.opacity = 1.0
+        self.parent_group = None
+        self.frames = Frames()
+
+
+class Layers(list):
+    def __init__(self):
+        super().__init__()
+        self.active = None
+
+    def new(self, name, set_active=True, layer_group=None):
+        layer = Layer(name)
+        layer.parent_group = layer_group
+        self.append(layer)
+        if set_active:
+            self.active = layer
+        return layer
+
+    def remove(self, layer):
+        list.remove(self, layer)
+        if self.active is layer:
+            self.active = self[-1] if self else None
+
+    def get(self, name):
+        for layer in self:
+            if layer.name == name:
+                return layer
+        return None
+
+
+class GreasePencil(ID):
+    def __init__(self, name):
+        super().__init__(name)
+        self.layers = Layers()
+        self.materials = []
+
+
+class Object(ID):
+    def __init__(self, name, data, type='GREASEPENCIL'):
+        super().__init__(name)
+        self.data = data
+        self.type = type
+        self.modifiers = []
+        self.shader_effects = []
+        self._select = False
+
+    def select_get(self):
+        return self._select
+
+    def select_set(self, state):
+        self._select = bool(state)
+
+
+class Marker:
+    def __init__(self, name, frame):
+        self.name = name
+        self.frame = frame
+        self.select = False
+
+
+class TimelineMarkers(list):
+    def new(self, name, frame=0):
+        marker = Marker(name, frame)
+        self.append(marker)
+        return marker
+
+
+class Scene(ID):
+    def __init__(self, name="Scene"):
+        super().__init__(name)
+        self.objects = []
+        self.timeline_markers = TimelineMarkers()
+        self.frame_start = 1
+        self.frame_end = 250
+        self.frame_current = 1
+
+    def frame_set(self, frame):
+        self.frame_current = frame
+
+
+def make_gp_object(layers=10, frames=50, frame_step=2, fcurves=True, scene=None):
+    """
+    Build a fake GP object, laid out like benchmarks/scene_gen.py.
+
+    Args:
+        layers: Number of layers ("Layer_000", ...)
+        frames: Drawing keys per layer, at 1, 1 + frame_step, ...
+        frame_step: Frames between keys
+        fcurves: Key every layer's opacity on the same frames
+        scene: Optional Scene to link the object to
+
+    Returns:
+        Object: GP object
+    """
+    gp_data = GreasePencil("GPH_Bench")
+    obj = Object("GPH_Bench", gp_data)
+    frame_numbers = [1 + index * frame_step for index in range(frames)]
+
+    for layer_index in range(layers):
+        layer = gp_data.layers.new(f"Layer_{layer_index:03d}")
+        layer.frames.extend(Frame(frame_number) for frame_number in frame_numbers)
+
+    if fcurves and frame_numbers:
+        action = Action("GPH_Bench_Action")
+        gp_data.animation_data_create().action = action
+        for layer in gp_data.layers:
+            fcurve = action.fcurves.new(f'layers["{layer.name}"].opacity')
+            fcurve.keyframe_points.extend(Keyframe(frame_number, 1.0) for frame_number in frame_numbers)
+
+    if scene is not None:
+        scene.objects.append(obj)
+        scene.frame_end = max(scene.frame_end, frame_numbers[-1] if frame_numbers else 1)
+
+    return obj
+
+
+# ---------------------------------------------------------------------------
+# bpy module
+# ---------------------------------------------------------------------------
+
+class _TypesModule(types.ModuleType):
+    """bpy.types: every attribute is an empty base class"""
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        # append/prepend/remove accept draw callbacks, like header and menu types
+        callback = classmethod(lambda cls, function: None)
+        cls = type(name, (), {
+            "is_registered": False,
+            "append": callback,
+            "prepend": callback,
+            "remove": callback,
+        })
+        setattr(self, name, cls)
+        return cls
+
+
+class _PropsModule(types.ModuleType):
+    """bpy.props: property functions return a description of the property"""
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        def make_property(**kwargs):
+            return SimpleNamespace(function=name, keywords=kwargs)
+
+        make_property.__name__ = name
+        setattr(self, name, make_property)
+        return make_property
+
+
+class _HandlersModule(types.ModuleType):
+    """bpy.app.handlers: every handler list starts empty"""
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        handlers = []
+        setattr(self, name, handlers)
+        return handlers
+
+
+class _OperatorCategory:
+    def __init__(self, category):
+        self._category = category
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        def run_operator(*args, **kwargs):
+            raise RuntimeError(f"bpy.ops.{self._category}.{name} can't run outside Blender")
+
+        return run_operator
+
+
+class _OpsModule(types.ModuleType):
+    """bpy.ops: operators can be looked up but not run"""
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _OperatorCategory(name)
+
+
+class _Previews(dict):
+    def load(self, name, path, path_type):
+        preview = SimpleNamespace(icon_id=len(self) + 1)
+        self[name] = preview
+        return preview
+
+
+def _module(name, module_type=types.ModuleType):
+    module = module_type(name)
+    sys.modules[name] = module
+    return module
+
+
+def install():
+    """
+    Install the fake bpy modules in sys.modules.
+
+    Returns:
+        module: The fake bpy module
+    """
+    existing = sys.modules.get("bpy")
+    if existing is not None:
+        if getattr(existing, "__fake__", False):
+            return existing
+        raise RuntimeError("The real bpy is already imported, fake_bpy is for plain CPython only")
+
+    bpy = _module("bpy")
+    bpy.__fake__ = True
+
+    bpy.types = _module("bpy.types", _TypesModule)
+    bpy.props = _module("bpy.props", _PropsModule)
+    bpy.ops = _module("bpy.ops", _OpsModule)
+
+    bpy.app = _module("bpy.app")
+    bpy.app.version = (4, 3, 0)
+    bpy.app.version_string = "4.3.0 (fake_bpy)"
+    bpy.app.background = True
+    bpy.app.handlers = _module("bpy.app.handlers", _HandlersModule)
+    bpy.app.handlers.persistent = lambda function: function
+    bpy.app.timers = _module("bpy.app.timers")
+    bpy.app.timers.register = lambda function, first_interval=0.0, persistent=False: None
+    bpy.app.timers.unregister = lambda function: None
+    bpy.app.timers.is_registered = lambda function: False
+
+    bpy.utils = _module("bpy.utils")
+    bpy.utils.register_class = lambda cls: None
+    bpy.utils.unregister_class = lambda cls: None
+    bpy.utils.previews = _module("bpy.utils.previews")
+    bpy.utils.previews.new = _Previews
+    bpy.utils.previews.remove = lambda collection: collection.clear()
+
+    bpy.msgbus = _module("bpy.msgbus")
+    bpy.msgbus.subscribe_rna = lambda **kwargs: None
+    bpy.msgbus.clear_by_owner = lambda owner: None
+
+    scene = Scene()
+    bpy.data = SimpleNamespace(scenes=[scene], objects=[], actions=[])
+    bpy.context = SimpleNamespace(
+        scene=scene,
+        window=None,
+        area=None,
+        active_object=None,
+        selected_objects=[],
+        view_layer=SimpleNamespace(objects=SimpleNamespace(active=None)),
+    )
+
+    return bpy
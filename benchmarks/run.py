@@ -0,0 +1,285 @@
+"""
+GP Helper benchmark suite
+
+Times the GP Helper operators, their API functions (api.py) and the
+keyframe queries on synthetic GP scenes (see scene_gen.py) and writes the
+results as JSON, so runs can be compared over time.
+
+Usage:
+    blender --background --factory-startup --python benchmarks/run.py -- --output results.json
+    blender --background --factory-startup --python benchmarks/run.py -- --layers 50 --frames 200 --repeat 3
+"""
+
+import argparse
+import datetime
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from common import import_addon, script_args
+from scene_gen import SceneSpec, build_scene, teardown_scene
+
+
+def _select_all_frames(scene, obj):
+    for layer in obj.data.layers:
+        for gp_frame in layer.frames:
+            gp_frame.select = True
+
+
+def _go_to_middle(scene, obj):
+    scene.frame_set((scene.frame_start + scene.frame_end) // 2)
+
+
+def _prepare_layer_mover(scene, obj):
+    from gp_helper.utils import sync_object_layer_settings
+
+    sync_object_layer_settings(scene.gph_keyframe_props, obj.data)
+    _go_to_middle(scene, obj)
+
+
+def _prepare_dissolve(scene, obj):
+    layers = list(obj.data.layers)
+    props = scene.gph_dissolve_props
+    props.layer1_name = layers[0].name
+    props.layer2_name = layers[-1].name
+
+
+def _prepare_breakdown(scene, obj):
+    _select_all_frames(scene, obj)
+    scene.gph_breakdown_props.apply_to_all_layers = True
+
+
+def _enable_light_table(scene, obj):
+    scene.gph_light_table_props.reference_frame = scene.frame_start
+    import bpy
+    bpy.ops.gph.toggle_light_table()
+
+
+# (name, operator idname, operator arguments, prepare function)
+OPERATOR_CASES = (
+    ("keyframe_mover_forward", "gph.keyframe_mover_forward", {}, _go_to_middle),
+    ("keyframe_mover_backward", "gph.keyframe_mover_backward", {}, _go_to_middle),
+    ("keyframe_mover_layer_forward", "gph.keyframe_mover_layer_forward", {"layer_name": "Layer_000"}, _prepare_layer_mover),
+    ("keyframe_mover_layer_backward", "gph.keyframe_mover_layer_backward", {"layer_name": "Layer_000"}, _prepare_layer_mover),
+    ("keyframe_spacing", "gph.keyframe_spacing", {"spacing_frames": 3}, _select_all_frames),
+    ("marker_spacing", "gph.marker_spacing", {}, None),
+    ("add_breakdown", "gph.add_breakdown", {}, _prepare_breakdown),
+    ("dissolve_setup", "gph.dissolve_setup", {}, _prepare_dissolve),
+    ("light_table_enable", "gph.toggle_light_table", {}, None),
+    ("light_table_update", "gph.update_light_table", {}, _enable_light_table),
+    ("light_table_disable", "gph.toggle_light_table", {}, _enable_light_table),
+)
+
+
+def _context_override(scene, obj):
+    return {
+        "scene": scene,
+        "view_layer": scene.view_layers[0],
+        "active_object": obj,
+        "object": obj,
+        "selected_objects": [obj],
+        "selected_editable_objects": [obj],
+    }
+
+
+def _summarize(name, kind, times, status, detail=""):
+    result = {"name": name, "kind": kind, "status": status, "runs": len(times)}
+    if times:
+        result.update(
+            median_ms=statistics.median(times) * 1000.0,
+            min_ms=min(times) * 1000.0,
+            max_ms=max(times) * 1000.0,
+        )
+    if detail:
+        result["detail"] = detail
+    return result
+
+
+def run_operator_case(case, spec, repeat):
+    """Time one operator on a fresh scene per run"""
+    import bpy
+
+    name, idname, kwargs, prepare = case
+
+    category, op_name = idname.split(".")
+    operator = getattr(getattr(bpy.ops, category), op_name)
+
+    times = []
+    status = "ok"
+    detail = ""
+
+    for _ in range(repeat):
+        scene, obj = build_scene(spec)
+        try:
+            with bpy.context.temp_override(**_context_override(scene, obj)):
+                if prepare:
+                    prepare(scene, obj)
+
+                start = time.perf_counter()
+                result = operator(**kwargs)
+                times.append(time.perf_counter() - start)
+
+                if 'FINISHED' not in result:
+                    status, detail = "cancelled", ", ".join(sorted(result))
+
+            # Disable the light table before removing the scene
+            if scene.gph_light_table_props.enabled:
+                with bpy.context.temp_override(**_context_override(scene, obj)):
+                    bpy.ops.gph.toggle_light_table()
+
+        except Exception as error:
+            status, detail = "error", f"{type(error).__name__}: {error}"
+            break
+
+        finally:
+            teardown_scene(scene)
+
+    return _summarize(name, "operator", times, status, detail)
+
+
+def run_api_cases(spec, repeat):
+    """Time the api.py functions on a fresh scene per run, without any context"""
+    from gp_helper import api
+
+    def middle(scene):
+        return (scene.frame_start + scene.frame_end) // 2
+
+    cases = (
+        ("api.move_keys", lambda scene, obj: api.move_keys([obj], middle(scene), 4)),
+        ("api.space_keys", lambda scene, obj: api.space_keys(obj.data.layers, 3, frames=range(scene.frame_end + 1))),
+        ("api.apply_marker_spacing", lambda scene, obj: api.apply_marker_spacing(scene, [obj])),
+        ("api.add_breakdowns", lambda scene, obj: api.add_breakdowns(obj.data.layers, frames=range(scene.frame_end + 1))),
+    )
+
+    results = []
+    for name, function in cases:
+        times = []
+        for _ in range(repeat):
+            scene, obj = build_scene(spec)
+            try:
+                start = time.perf_counter()
+                function(scene, obj)
+                times.append(time.perf_counter() - start)
+            finally:
+                teardown_scene(scene)
+        results.append(_summarize(name, "api", times, "ok"))
+
+    return results
+
+
+def run_query_cases(spec, repeat):
+    """Time the keyframe_utils queries on one scene"""
+    from gp_helper.utils import (
+        has_keyframe_at_frame,
+        get_keyframes_after_frame,
+        get_all_keyframes_in_range,
+        get_all_keyframes,
+    )
+
+    scene, obj = build_scene(spec)
+    middle = (scene.frame_start + scene.frame_end) // 2
+
+    queries = (
+        ("has_keyframe_at_frame", lambda: has_keyframe_at_frame(obj, middle)),
+        ("get_keyframes_after_frame", lambda: get_keyframes_after_frame(obj, middle)),
+        ("get_all_keyframes_in_range", lambda: get_all_keyframes_in_range(obj, scene.frame_start, middle)),
+        ("get_all_keyframes", lambda: get_all_keyframes(obj)),
+    )
+
+    results = []
+    try:
+        for name, query in queries:
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                query()
+                times.append(time.perf_counter() - start)
+            results.append(_summarize(name, "query", times, "ok"))
+    finally:
+        teardown_scene(scene)
+
+    return results
+
+
+def parse_args():
+    defaults = SceneSpec()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--layers", type=int, default=defaults.layers)
+    parser.add_argument("--frames", type=int, default=defaults.frames, help="Keys per layer")
+    parser.add_argument("--frame-step", type=int, default=defaults.frame_step)
+    parser.add_argument("--strokes", type=int, default=defaults.strokes, help="Strokes per drawing")
+    parser.add_argument("--points", type=int, default=defaults.points, help="Points per stroke")
+    parser.add_argument("--no-fcurves", action="store_true", help="Don't key layer opacity")
+    parser.add_argument("--modifiers", type=int, default=defaults.modifiers)
+    parser.add_argument("--markers", type=int, default=defaults.markers)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="*", help="Only run the cases with these names")
+    parser.add_argument("--output", help="JSON file to write the results to")
+    return parser.parse_args(script_args())
+
+
+def main():
+    import bpy
+
+    args = parse_args()
+    spec = SceneSpec(
+        layers=args.layers,
+        frames=args.frames,
+        frame_step=args.frame_step,
+        strokes=args.strokes,
+        points=args.points,
+        attribute_fcurves=not args.no_fcurves,
+        modifiers=args.modifiers,
+        markers=args.markers,
+        seed=args.seed,
+    )
+
+    addon = import_addon()
+    addon.register()
+
+    try:
+        results = []
+        for case in OPERATOR_CASES:
+            if args.only and case[0] not in args.only:
+                continue
+            results.append(run_operator_case(case, spec, args.repeat))
+
+        results.extend(
+            result for result in run_api_cases(spec, args.repeat)
+            if not args.only or result["name"] in args.only
+        )
+
+        results.extend(
+            result for result in run_query_cases(spec, args.repeat)
+            if not args.only or result["name"] in args.only
+        )
+
+    finally:
+        addon.unregister()
+
+    report = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "blender": bpy.app.version_string,
+        "background": bpy.app.background,
+        "repeat": args.repeat,
+        "scene": spec.as_dict(),
+        "results": results,
+    }
+
+    for result in results:
+        timing = f"{result['median_ms']:10.2f} ms" if "median_ms" in result else " " * 13
+        print(f"{result['name']:<32}{timing}  {result['status']} {result.get('detail', '')}")
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Synthetic Grease Pencil scene generator for the benchmarks
+
+Builds a scene with one GP object whose size is set by SceneSpec: layer
+count, keys per layer and their spacing, strokes per drawing, points per
+stroke, opacity F-curves per layer, object modifiers and GP spacing markers.
+Everything is created in a dedicated scene and removed by teardown_scene().
+"""
+
+from dataclasses import dataclass, asdict
+
+import bpy
+import numpy as np
+
+# GP modifiers added in turn when SceneSpec.modifiers > 0
+MODIFIER_TYPES = (
+    'GREASE_PENCIL_NOISE',
+    'GREASE_PENCIL_OFFSET',
+    'GREASE_PENCIL_TINT',
+    'GREASE_PENCIL_OPACITY',
+    'GREASE_PENCIL_THICKNESS',
+)
+
+
+@dataclass
+class SceneSpec:
+    layers: int = 10
+    frames: int = 50
+    frame_step: int = 2
+    strokes: int = 5
+    points: int = 20
+    attribute_fcurves: bool = True
+    modifiers: int = 2
+    markers: int = 5
+    seed: int = 0
+
+    def as_dict(self):
+        return asdict(self)
+
+
+def _grease_pencil_data():
+    """Get the GPv3 data collection across Blender versions"""
+    return getattr(bpy.data, "grease_pencils_v3", None) or bpy.data.grease_pencils
+
+
+def _fill_drawing(drawing, spec, rng):
+    """Add random strokes to a drawing"""
+    if spec.strokes == 0 or spec.points == 0:
+        return
+
+    drawing.add_strokes([spec.points] * spec.strokes)
+    positions = rng.uniform(-1.0, 1.0, size=(spec.strokes * spec.points, 3)).astype(np.float32)
+    drawing.attributes["position"].data.foreach_set("vector", positions.ravel())
+
+
+def build_scene(spec):
+    """
+    Build a synthetic GP scene and make it the context scene.
+
+    Args:
+        spec: SceneSpec
+
+    Returns:
+        tuple: (scene, GP object)
+    """
+    from gp_helper.utils.fcurve_utils import ensure_action, write_keyframes
+
+    rng = np.random.default_rng(spec.seed)
+
+    scene = bpy.data.scenes.new("GPH_Bench")
+    scene.frame_start = 1
+    scene.frame_end = max(1, spec.frames * spec.frame_step)
+
+    gp_data = _grease_pencil_data().new("GPH_Bench")
+    obj = bpy.data.objects.new("GPH_Bench", gp_data)
+    scene.collection.objects.link(obj)
+
+    frame_numbers = [1 + index * spec.frame_step for index in range(spec.frames)]
+
+    for layer_index in range(spec.layers):
+        layer = gp_data.layers.new(f"Layer_{layer_index:03d}")
+        for frame_number in frame_numbers:
+            gp_frame = layer.frames.new(frame_number)
+            _fill_drawing(gp_frame.drawing, spec, rng)
+
+    if spec.attribute_fcurves and frame_numbers:
+        action = ensure_action(gp_data, "GPH_Bench_Action")
+        for layer in gp_data.layers:
+            fcurve = action.fcurves.new(data_path=f'layers["{layer.name}"].opacity')
+            write_keyframes(fcurve, frame_numbers, rng.uniform(0.0, 1.0, len(frame_numbers)))
+
+    for index in range(spec.modifiers):
+        modifier_type = MODIFIER_TYPES[index % len(MODIFIER_TYPES)]
+        try:
+            obj.modifiers.new(f"Bench_{index}", modifier_type)
+        except (TypeError, RuntimeError):
+            # Modifier type not available in this Blender version
+            pass
+
+    if spec.markers and frame_numbers:
+        marker_frames = np.linspace(frame_numbers[0], frame_numbers[-1], spec.markers + 2)[1:-1]
+        for frame in marker_frames.astype(int):
+            scene.timeline_markers.new(f"GP_{frame:04d}", frame=int(frame))
+
+    window = bpy.context.window
+    if window is not None:
+        window.scene = scene
+
+    return scene, obj
+
+
+def teardown_scene(scene):
+    """Remove a scene built by build_scene and everything created in it"""
+    window = bpy.context.window
+    if window is not None and window.scene == scene:
+        others = [other for other in bpy.data.scenes if other != scene]
+        if others:
+            window.scene = others[0]
+
+    objects = list(scene.objects)
+    data = [obj.data for obj in objects if obj.data is not None]
+    collections = list(scene.collection.children_recursive)
+    actions = [
+        id_data.animation_data.action
+        for id_data in objects + data
+        if id_data.animation_data and id_data.animation_data.action
+    ]
+
+    bpy.data.batch_remove(set(objects + data + collections + actions + [scene]))
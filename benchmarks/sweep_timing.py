@@ -0,0 +1,180 @@
+"""
+Timing algorithm sweep, in plain CPython
+
+Runs the planning functions (utils/timing.py), the key moves of api.py and
+the keyframe queries (utils/keyframe_utils.py) against fake GP objects of
+growing size, using the bpy stand-in from fake_bpy.py. No Blender needed.
+
+Usage:
+    python benchmarks/sweep_timing.py
+    python benchmarks/sweep_timing.py --layers 1 10 100 --frames 100 1000 --output sweep.json
+    python benchmarks/sweep_timing.py --layers 50 --frames 2000 --profile sweep.prof
+
+With --profile, the sweep runs under cProfile and the stats are written to
+the given file (open with pstats or snakeviz); the top entries are printed.
+
+Before timing, the keys written for each dissolve fade profile are read back
+by name and checked against the interpolation and easing the profile stands
+for; the sweep stops if write_keyframes wrote other enum values.
+"""
+
+import argparse
+import cProfile
+import importlib
+import json
+import pstats
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import fake_bpy
+
+fake_bpy.install()
+
+from common import import_addon
+
+
+def _time(function, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000.0
+
+
+def sweep_case(addon, layers, frames, frame_step, repeat):
+    """Time every algorithm on one object size"""
+    utils = addon.utils
+    api = importlib.import_module("gp_helper.api")
+    fcurve_utils = importlib.import_module("gp_helper.utils.fcurve_utils")
+    scene = fake_bpy.Scene()
+    obj = fake_bpy.make_gp_object(layers=layers, frames=frames, frame_step=frame_step, scene=scene)
+    middle = (scene.frame_start + scene.frame_end) // 2
+
+    layer = obj.data.layers[0]
+    all_frames = sorted(gp_frame.frame_number for gp_frame in layer.frames)
+    selected_frames = all_frames[::2]
+    affected = [frame for frame in all_frames if frame > middle]
+
+    def apply_plan():
+        plan = utils.plan_keyframe_spacing(all_frames, selected_frames, frame_step + 1)
+        test_layer = fake_bpy.Layer("Sweep")
+        test_layer.frames.extend(fake_bpy.Frame(frame) for frame in all_frames)
+        utils.apply_frame_plan(test_layer, plan)
+
+    def move_keys():
+        # Alternate directions so the object keeps its layout
+        api.move_keys([obj], middle, frame_step)
+        api.move_keys([obj], middle + frame_step, -frame_step)
+
+    fcurve = fake_bpy.FCurve("sweep")
+    key_frames = list(range(frames))
+    key_values = [0.0] * frames
+
+    timings = {
+        "plan_keyframe_spacing": lambda: utils.plan_keyframe_spacing(all_frames, selected_frames, frame_step + 1),
+        "plan_and_apply_frame_plan": apply_plan,
+        "calculate_safe_backward_offset": lambda: utils.calculate_safe_backward_offset(middle, frame_step, affected),
+        "calculate_spacing_to_add": lambda: utils.calculate_spacing_to_add(middle, all_frames),
+        "has_keyframe_at_frame": lambda: utils.has_keyframe_at_frame(obj, middle),
+        "get_keyframes_after_frame": lambda: utils.get_keyframes_after_frame(obj, middle),
+        "get_all_keyframes_in_range": lambda: utils.get_all_keyframes_in_range(obj, 1, middle),
+        "get_all_keyframes": lambda: utils.get_all_keyframes(obj),
+        "write_keyframes": lambda: fcurve_utils.write_keyframes(fcurve, key_frames, key_values),
+        "api.get_key_frames": lambda: api.get_key_frames([obj]),
+        "api.move_keys (x2)": move_keys,
+    }
+
+    return {
+        "layers": layers,
+        "frames": frames,
+        "frame_step": frame_step,
+        "median_ms": {name: _time(function, repeat) for name, function in timings.items()},
+    }
+
+
+# Fade profile -> (interpolation, easing) its keys must read back as
+EXPECTED_FADE_KEYS = {
+    'LINEAR': ('LINEAR', 'AUTO'),
+    'CONSTANT': ('CONSTANT', 'AUTO'),
+    'EASE': ('SINE', 'EASE_IN_OUT'),
+    'SMOOTHSTEP': ('BEZIER', 'AUTO'),
+    'STEPPED_TWOS': ('CONSTANT', 'AUTO'),
+    'CUSTOM': ('LINEAR', 'AUTO'),
+}
+
+
+def check_fade_keys():
+    """Write the keys of every fade profile and check their enums by name"""
+    from gp_helper.utils.dissolve import compute_dissolve_keys
+    from gp_helper.utils.fade_profiles import expand_fade_keys
+    from gp_helper.utils.fcurve_utils import write_keyframes
+
+    frames, layer1_values, layer2_values = compute_dissolve_keys(40, 10)
+
+    for profile, expected in EXPECTED_FADE_KEYS.items():
+        key_frames, values, interpolation, easing = expand_fade_keys(
+            frames, (layer1_values, layer2_values), profile
+        )
+        fcurve = fake_bpy.FCurve(f'layers["{profile}"].opacity')
+        write_keyframes(fcurve, key_frames, values[0], interpolation, easing)
+
+        written = {(key.interpolation, key.easing) for key in fcurve.keyframe_points}
+        if written != {expected}:
+            sys.exit(f"Fade profile {profile}: keys read back as {sorted(written)}, expected {expected}")
+
+    print(f"Fade profile keys OK ({len(EXPECTED_FADE_KEYS)} profiles)")
+
+
+def run_sweep(addon, args):
+    results = []
+    for layers in args.layers:
+        for frames in args.frames:
+            result = sweep_case(addon, layers, frames, args.frame_step, args.repeat)
+            results.append(result)
+
+            print(f"\n{layers} layers x {frames} keys")
+            for name, median_ms in result["median_ms"].items():
+                print(f"  {name:<32}{median_ms:10.3f} ms")
+
+    return results
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--layers", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--frames", type=int, nargs="+", default=[50, 200, 1000], help="Keys per layer")
+    parser.add_argument("--frame-step", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--profile", help="Write cProfile stats to this file")
+    parser.add_argument("--output", help="JSON file to write the results to")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    addon = import_addon()
+    check_fade_keys()
+
+    if args.profile:
+        profiler = cProfile.Profile()
+        results = profiler.runcall(run_sweep, addon, args)
+        profiler.dump_stats(args.profile)
+
+        print(f"\nProfile written to {args.profile}")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(20)
+    else:
+        results = run_sweep(addon, args)
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump({"bpy": "fake_bpy", "results": results}, output_file, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
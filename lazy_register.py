@@ -0,0 +1,276 @@
+"""
+Lazy registration - Register lightweight stubs at startup, the real classes on first use
+
+Enabled by setting the GP_HELPER_LAZY_REGISTER environment variable (1, true,
+yes or on). Properties and handlers are registered as usual, but instead of
+importing the operator and UI modules, register() only registers:
+
+- one stub operator per GP Helper operator (bl_idname, label and
+  properties from OPERATOR_MANIFEST), so the operators are found by search
+  and scripts
+- a stub sidebar panel in the GP Helper category
+- a stub Dope Sheet header callback
+
+The first time one of them is polled, invoked or drawn, a timer imports the
+operator and UI modules, replaces the stubs and registers the real classes.
+An operator run before that is run again, in the same window and area and
+with the same arguments, once the real classes are registered.
+
+Background Blender has no event loop to fire the timer, so there register()
+loads the real classes right away (LOAD_IN_BACKGROUND) and scripts calling
+bpy.ops.gph.* get the real operators.
+
+OPERATOR_MANIFEST must list every operator registered by operators/__init__.py,
+with the properties scripts and keymaps can pass to it.
+"""
+
+import os
+
+import bpy
+
+from .utils.logger import get_logger
+
+log = get_logger(__name__)
+
+ENV_VAR = "GP_HELPER_LAZY_REGISTER"
+
+# Load the real classes in register() when Blender runs in background
+# (turned off by the startup benchmark to time the stubs alone)
+LOAD_IN_BACKGROUND = True
+
+# Properties of the GPH_LayerSetTarget operators
+_LAYER_SET_PROPERTIES = {"layer_set": str, "layer_name": str, "layer_pattern": str, "layer_group": str}
+
+# bl_idname -> (bl_label, {property name: type}) of every operator. The stubs
+# take the same properties (enums as strings) so calls with arguments work
+# before the real classes are loaded
+OPERATOR_MANIFEST = {
+    "gph.keyframe_mover": ("Move Keyframes Forward", {}),
+    "gph.keyframe_mover_forward": ("Move Keyframes Forward", {}),
+    "gph.keyframe_mover_backward": ("Move Keyframes Backward", {}),
+    "gph.refresh_layers": ("Refresh Layers", {}),
+    "gph.keyframe_mover_layer_forward": ("Move Layer Keyframes Forward", {"layer_name": str}),
+    "gph.keyframe_mover_layer_backward": ("Move Layer Keyframes Backward", {"layer_name": str}),
+    "gph.keyframe_spacing": ("Space Keyframes Evenly", {"spacing_frames": int, "ripple_edit": bool}),
+    "gph.dissolve_setup": ("Setup Dissolve Keyframes", {}),
+    "gph.dissolve_refresh": ("Refresh Layer Names", {}),
+    "gph.dissolve_bake": ("Bake Dissolve to Keys", {}),
+    "gph.dissolve_chain_setup": ("Setup Dissolve Chain", {}),
+    "gph.dissolve_chain_refresh": ("Fill Chain from Layers", {}),
+    "gph.dissolve_chain_remove": ("Remove Chain Layer", {"index": int}),
+    "gph.dissolve_chain_move": ("Move Chain Layer", {"index": int, "direction": str}),
+    "gph.marker_spacing": ("Apply Marker Spacing", {}),
+    "gph.clear_markers": ("Clear GP Spacing Markers", {}),
+    "gph.add_gp_marker": ("Add GP Spacing Marker", {}),
+    "gph.add_breakdown": ("Add Breakdown", {}),
+    "gph.breakdown_preset": ("Breakdown Preset", {"position": float}),
+    "gph.breakdown_favor_first": ("Favor First (25%)", {}),
+    "gph.breakdown_middle": ("Middle (50%)", {}),
+    "gph.breakdown_favor_last": ("Favor Last (75%)", {}),
+    "gph.flip_flop_toggle": ("Flip/Flop", {}),
+    "gph.set_flip_frame": ("Set Flip Frame", {}),
+    "gph.flip_to_previous": ("Flip to Previous", {}),
+    "gph.flip_to_next": ("Flip to Next", {}),
+    "gph.reset_flip_flop": ("Reset Flip/Flop", {}),
+    "gph.flip_history_back": ("Previous Visited Frame", {}),
+    "gph.flip_history_forward": ("Next Visited Frame", {}),
+    "gph.flip_roll": ("Roll", {}),
+    "gph.toggle_light_table": ("Toggle Light Table", {}),
+    "gph.set_reference_frame": ("Set Reference Frame", {}),
+    "gph.update_light_table": ("Update Light Table", {}),
+    "gph.clear_reference": ("Clear Reference", {}),
+    "gph.jump_to_reference": ("Jump to Reference", {}),
+    "gph.layer_solo": ("Solo Layer", {**_LAYER_SET_PROPERTIES, "mode": str}),
+    "gph.layer_duplicate": ("Duplicate Layer", {
+        **_LAYER_SET_PROPERTIES,
+        "drawing_mode": str,
+        "use_frame_range": bool,
+        "frame_start": int,
+        "frame_end": int,
+    }),
+    "gph.layer_make_active": ("Activate Layer", _LAYER_SET_PROPERTIES),
+    "gph.refresh_icons": ("Refresh Icons", {}),
+    "gph.clear_performance_history": ("Clear Timings", {}),
+}
+
+_stub_classes = []
+_load_callback = None
+_load_scheduled = False
+_loaded = False
+_header_appended = False
+
+# Operator runs caught by the stubs: (idname, arguments, window, area, region)
+_pending_calls = []
+
+
+def is_lazy_registration_enabled():
+    """Check if lazy registration is requested through the environment"""
+    return os.environ.get(ENV_VAR, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def is_loaded():
+    """Check if the real classes have been registered"""
+    return _loaded
+
+
+def request_load():
+    """Schedule the real registration (safe to call from poll and draw)"""
+    global _load_scheduled
+
+    if _loaded or _load_scheduled:
+        return
+
+    _load_scheduled = True
+    bpy.app.timers.register(_load_from_timer, first_interval=0.0)
+
+
+def _load_from_timer():
+    load_now()
+    _run_pending_calls()
+    return None
+
+
+def _run_pending_calls():
+    """Run the operators the stubs were called for, now that they are registered"""
+    calls = list(_pending_calls)
+    _pending_calls.clear()
+
+    for idname, arguments, window, area, region in calls:
+        category, name = idname.split(".")
+        override = {key: value for key, value in (("window", window), ("area", area), ("region", region)) if value}
+        try:
+            with bpy.context.temp_override(**override):
+                getattr(getattr(bpy.ops, category), name)('INVOKE_DEFAULT', **dict(arguments))
+        except (RuntimeError, ReferenceError, TypeError) as error:
+            # Window or area closed meanwhile, or the operator can't run there
+            log.warning("Could not run %s after loading: %s", idname, error)
+
+
+def load_now():
+    """Replace the stubs with the real classes right away"""
+    global _loaded, _load_scheduled
+
+    if _loaded:
+        return
+
+    unregister_stubs()
+    _load_callback()
+
+    _loaded = True
+    _load_scheduled = False
+
+
+# Property type -> bpy.props function declaring it on a stub
+_PROPERTY_TYPES = {
+    bool: bpy.props.BoolProperty,
+    int: bpy.props.IntProperty,
+    float: bpy.props.FloatProperty,
+    str: bpy.props.StringProperty,
+}
+
+
+def _make_operator_stub(idname, label, properties):
+    """Build a stub operator that triggers the real registration"""
+
+    @classmethod
+    def poll(cls, context):
+        request_load()
+        return True
+
+    def invoke(self, context, event):
+        return self.execute(context)
+
+    def execute(self, context):
+        # Only the arguments given, the real operator has its own defaults
+        arguments = tuple(
+            (name, getattr(self, name)) for name in properties if self.properties.is_property_set(name)
+        )
+        call = (idname, arguments, context.window, context.area, context.region)
+        if call not in _pending_calls:
+            _pending_calls.append(call)
+        request_load()
+        self.report({'INFO'}, "GP Helper is loading, the tool will run in a moment")
+        return {'CANCELLED'}
+
+    return type(
+        f"GPH_OT_{idname.split('.')[1]}",
+        (bpy.types.Operator,),
+        {
+            "bl_idname": idname,
+            "bl_label": label,
+            "bl_options": {'REGISTER'},
+            "poll": poll,
+            "invoke": invoke,
+            "execute": execute,
+            "__annotations__": {name: _PROPERTY_TYPES[kind]() for name, kind in properties.items()},
+        },
+    )
+
+
+class GPH_PT_loading(bpy.types.Panel):
+    """Placeholder shown until the GP Helper panels are registered"""
+    bl_label = "GP Helper"
+    bl_idname = "GPH_PT_loading"
+    bl_space_type = 'DOPESHEET_EDITOR'
+    bl_region_type = 'UI'
+    bl_category = 'GP Helper'
+
+    def draw(self, context):
+        request_load()
+        self.layout.label(text="Loading GP Helper...", icon='TIME')
+
+
+def draw_stub_header(self, context):
+    """Dope Sheet header stub, triggers the real registration"""
+    request_load()
+
+
+def register_stubs(load_callback):
+    """
+    Register the stubs.
+
+    Args:
+        load_callback: Function registering the real operator and UI classes
+    """
+    global _load_callback, _loaded, _load_scheduled, _header_appended
+
+    _load_callback = load_callback
+    _loaded = False
+    _load_scheduled = False
+    _pending_calls.clear()
+
+    _stub_classes[:] = [
+        _make_operator_stub(idname, label, properties)
+        for idname, (label, properties) in OPERATOR_MANIFEST.items()
+    ]
+    _stub_classes.append(GPH_PT_loading)
+
+    for cls in _stub_classes:
+        bpy.utils.register_class(cls)
+
+    bpy.types.DOPESHEET_HT_header.append(draw_stub_header)
+    _header_appended = True
+
+
+def unregister_stubs():
+    """Unregister the stubs that are still registered"""
+    global _header_appended
+
+    if _header_appended:
+        bpy.types.DOPESHEET_HT_header.remove(draw_stub_header)
+        _header_appended = False
+
+    for cls in reversed(_stub_classes):
+        if cls.is_registered:
+            bpy.utils.unregister_class(cls)
+    _stub_classes.clear()
+
+
+def cancel_pending_load():
+    """Drop a scheduled registration (when the add-on is disabled first)"""
+    global _load_scheduled
+
+    if bpy.app.timers.is_registered(_load_from_timer):
+        bpy.app.timers.unregister(_load_from_timer)
+    _load_scheduled = False
+    _pending_calls.clear()
@@ -1,7 +1,30 @@
+import logging
+
 import bpy
 from bpy.types import Operator
+from ..api import setup_dissolve_steps, setup_dissolve_chain_steps
+from ..utils import find_layer
+from ..utils.fade_profiles import parse_lut
+from ..utils.fcurve_utils import bake_cycles_modifier, get_cycles_modifier
+from ..utils.logger import get_logger
+from .GPH_jobs import GPH_JobOperator
+
+log = get_logger(__name__)
+
+
+def get_dissolve_gp_object(context):
+    """Get the GP object to set up dissolves on: active, then selected"""
+    if context.active_object and context.active_object.type == 'GREASEPENCIL':
+        return context.active_object
+
+    for obj in context.selected_objects:
+        if obj.type == 'GREASEPENCIL':
+            return obj
+
+    return None
 
-class GPH_OT_dissolve_setup(Operator):
+
+class GPH_OT_dissolve_setup(GPH_JobOperator, Operator):
     bl_idname = "gph.dissolve_setup"
     bl_label = "Setup Dissolve Keyframes"
     bl_description = "Automatically setup opacity keyframes for dissolve effect"
@@ -10,105 +33,108 @@ class GPH_OT_dissolve_setup(Operator):
     def execute(self, context):
         props = context.scene.gph_dissolve_props
 
-        print("=== DEBUGGING GP OBJECT DETECTION ===")
-        print(f"Active object: {context.active_object}")
-        if context.active_object:
-            print(f"Active object type: {context.active_object.type}")
-
-        print(f"Selected objects: {context.selected_objects}")
-        print(f"Scene objects: {[obj.name + '(' + obj.type + ')' for obj in context.scene.objects]}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Active object: %s", context.active_object)
+            log.debug("Selected objects: %s", [obj.name for obj in context.selected_objects])
+            log.debug("Scene objects: %s", [f"{obj.name}({obj.type})" for obj in context.scene.objects])
 
         gp_obj = None
 
         if context.active_object and context.active_object.type == 'GREASEPENCIL':
             gp_obj = context.active_object
-            print(f"Found GP object via active: {gp_obj.name}")
+            log.debug("Found GP object via active: %s", gp_obj.name)
 
         if not gp_obj:
             for obj in context.selected_objects:
                 if obj.type == 'GREASEPENCIL':
                     gp_obj = obj
-                    print(f"Found GP object via selection: {gp_obj.name}")
+                    log.debug("Found GP object via selection: %s", gp_obj.name)
                     break
 
         if not gp_obj and hasattr(context, 'object') and context.object:
             if context.object.type == 'GREASEPENCIL':
                 gp_obj = context.object
-                print(f"Found GP object via context.object: {gp_obj.name}")
+                log.debug("Found GP object via context.object: %s", gp_obj.name)
 
         if not gp_obj:
             gp_objects = [obj for obj in context.scene.objects if obj.type == 'GREASEPENCIL']
-            print(f"All GP objects in scene: {[obj.name for obj in gp_objects]}")
             if gp_objects:
                 gp_obj = gp_objects[0]
                 self.report({'WARNING'}, f"Using first GP object found: {gp_obj.name}")
 
         if not gp_obj:
-            self.report({'ERROR'}, "No Grease Pencil object found. Check console for debug info.")
+            self.report({'ERROR'}, "No Grease Pencil object found.")
             return {'CANCELLED'}
 
-        print(f"Using GP object: {gp_obj.name}")
-        print("=== END DEBUG ===")
+        log.debug("Using GP object: %s", gp_obj.name)
 
         gp_data = gp_obj.data
 
-        layer1 = None
-        layer2 = None
-
-        for layer in gp_data.layers:
-            if layer.name == props.layer1_name:
-                layer1 = layer
-            elif layer.name == props.layer2_name:
-                layer2 = layer
-
-        if not layer1:
+        if not find_layer(gp_data, props.layer1_name):
             self.report({'ERROR'}, f"Could not find layer '{props.layer1_name}'")
             return {'CANCELLED'}
 
-        if not layer2:
+        if not find_layer(gp_data, props.layer2_name):
             self.report({'ERROR'}, f"Could not find layer '{props.layer2_name}'")
             return {'CANCELLED'}
 
-        if not gp_data.animation_data:
-            gp_data.animation_data_create()
-        if not gp_data.animation_data.action:
-            gp_data.animation_data.action = bpy.data.actions.new(name="GPencilDissolveAction")
+        steps = setup_dissolve_steps(
+            gp_data,
+            props.layer1_name,
+            props.layer2_name,
+            total_frames=props.total_frames,
+            cycle_length=props.cycle_length,
+            use_cycles_modifier=props.use_cycles_modifier,
+            fade_curve=props.fade_curve,
+            lut=parse_lut(props.custom_lut),
+        )
+        return self.run_job(context, steps)
 
-        action = gp_data.animation_data.action
-        fcurves_to_remove = []
+    def job_finished(self, context, job):
+        props = context.scene.gph_dissolve_props
+        key_count = job.result
 
-        for fcurve in action.fcurves:
-            if (fcurve.data_path == f'layers["{props.layer1_name}"].opacity' or
-                fcurve.data_path == f'layers["{props.layer2_name}"].opacity'):
-                fcurves_to_remove.append(fcurve)
+        if props.use_cycles_modifier:
+            self.report({'INFO'}, f"Set up cyclic dissolve: {key_count} keys repeated up to frame {props.total_frames}")
+            return {'FINISHED'}
 
-        for fcurve in fcurves_to_remove:
-            action.fcurves.remove(fcurve)
+        self.report({'INFO'}, f"Successfully set up dissolve keyframes for {key_count} frames")
+        return {'FINISHED'}
 
-        layer1_fcurve = action.fcurves.new(
-            data_path=f'layers["{props.layer1_name}"].opacity'
-        )
-        layer2_fcurve = action.fcurves.new(
-            data_path=f'layers["{props.layer2_name}"].opacity'
-        )
 
-        frame = 0
-        while frame <= props.total_frames:
-            if frame % props.cycle_length == 0:
-                layer1_fcurve.keyframe_points.insert(frame, 0.0)
-                layer2_fcurve.keyframe_points.insert(frame, 1.0)
-            elif frame % props.cycle_length == (props.cycle_length - 1):
-                layer1_fcurve.keyframe_points.insert(frame, 1.0)
-                layer2_fcurve.keyframe_points.insert(frame, 0.0)
+class GPH_OT_dissolve_bake(Operator):
+    bl_idname = "gph.dissolve_bake"
+    bl_label = "Bake Dissolve to Keys"
+    bl_description = "Replace cyclic dissolve curves with discrete keyframes over the whole range"
+    bl_options = {'REGISTER', 'UNDO'}
 
-            frame += 1
+    def execute(self, context):
+        props = context.scene.gph_dissolve_props
 
-        for fcurve in [layer1_fcurve, layer2_fcurve]:
-            fcurve.update()
-            for keyframe in fcurve.keyframe_points:
-                keyframe.interpolation = 'LINEAR'
+        gp_obj = get_dissolve_gp_object(context)
+        if not gp_obj:
+            self.report({'ERROR'}, "Please select a Grease Pencil object")
+            return {'CANCELLED'}
 
-        self.report({'INFO'}, f"Successfully set up dissolve keyframes for {len(layer1_fcurve.keyframe_points)} frames")
+        gp_data = gp_obj.data
+        if not gp_data.animation_data or not gp_data.animation_data.action:
+            self.report({'WARNING'}, "No dissolve animation found")
+            return {'CANCELLED'}
+
+        baked_curves = 0
+        total_keys = 0
+        for fcurve in gp_data.animation_data.action.fcurves:
+            if not fcurve.data_path.startswith('layers[') or get_cycles_modifier(fcurve) is None:
+                continue
+
+            total_keys += bake_cycles_modifier(fcurve, props.total_frames)
+            baked_curves += 1
+
+        if not baked_curves:
+            self.report({'WARNING'}, "No cyclic dissolve curves to bake")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Baked {baked_curves} curve(s) to {total_keys} keyframes")
         return {'FINISHED'}
 
 
@@ -150,4 +176,115 @@ class GPH_OT_dissolve_refresh(Operator):
             props.layer1_name = layers[1].name  # Dissolve Layer (bottom in UI) gets second GP layer
 
         self.report({'INFO'}, f"Found {len(layers)} layer(s)")
-        return {'FINISHED'}
\ No newline at end of file
+        return {'FINISHED'}
+
+class GPH_OT_dissolve_chain_setup(GPH_JobOperator, Operator):
+    bl_idname = "gph.dissolve_chain_setup"
+    bl_label = "Setup Dissolve Chain"
+    bl_description = "Crossfade through the chain layers in order, one cycle per layer"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        props = context.scene.gph_dissolve_props
+
+        gp_obj = get_dissolve_gp_object(context)
+        if not gp_obj:
+            self.report({'ERROR'}, "Please select a Grease Pencil object")
+            return {'CANCELLED'}
+
+        layer_names = [item.layer_name for item in props.chain_layers]
+        if len(layer_names) < 2:
+            self.report({'ERROR'}, "Add at least 2 layers to the chain")
+            return {'CANCELLED'}
+
+        gp_data = gp_obj.data
+        missing = [name for name in layer_names if find_layer(gp_data, name) is None]
+        if missing:
+            self.report({'ERROR'}, f"Could not find layer(s): {', '.join(missing)}")
+            return {'CANCELLED'}
+
+        steps = setup_dissolve_chain_steps(
+            gp_data,
+            layer_names,
+            total_frames=props.total_frames,
+            cycle_length=props.cycle_length,
+            use_cycles_modifier=props.use_cycles_modifier,
+            fade_curve=props.fade_curve,
+            lut=parse_lut(props.custom_lut),
+        )
+        return self.run_job(context, steps)
+
+    def job_finished(self, context, job):
+        layer_names = [item.layer_name for item in context.scene.gph_dissolve_props.chain_layers]
+        key_count = job.result
+
+        self.report({'INFO'}, f"Set up dissolve chain over {len(layer_names)} layers with {key_count} keys per layer")
+        return {'FINISHED'}
+
+
+class GPH_OT_dissolve_chain_refresh(Operator):
+    bl_idname = "gph.dissolve_chain_refresh"
+    bl_label = "Fill Chain from Layers"
+    bl_description = "Fill the dissolve chain with the visible layers of the active Grease Pencil object"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        props = context.scene.gph_dissolve_props
+
+        gp_obj = get_dissolve_gp_object(context)
+        if not gp_obj:
+            self.report({'WARNING'}, "Please select a Grease Pencil object")
+            return {'CANCELLED'}
+
+        props.chain_layers.clear()
+
+        # Reverse to match GP layers panel display order
+        for layer in reversed(gp_obj.data.layers):
+            if not layer.hide:
+                props.chain_layers.add().layer_name = layer.name
+
+        self.report({'INFO'}, f"Added {len(props.chain_layers)} layer(s) to the chain")
+        return {'FINISHED'}
+
+
+class GPH_OT_dissolve_chain_remove(Operator):
+    bl_idname = "gph.dissolve_chain_remove"
+    bl_label = "Remove Chain Layer"
+    bl_description = "Remove this layer from the dissolve chain"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    index: bpy.props.IntProperty()
+
+    def execute(self, context):
+        props = context.scene.gph_dissolve_props
+
+        if not 0 <= self.index < len(props.chain_layers):
+            return {'CANCELLED'}
+
+        props.chain_layers.remove(self.index)
+        return {'FINISHED'}
+
+
+class GPH_OT_dissolve_chain_move(Operator):
+    bl_idname = "gph.dissolve_chain_move"
+    bl_label = "Move Chain Layer"
+    bl_description = "Move this layer earlier or later in the dissolve chain"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    index: bpy.props.IntProperty()
+    direction: bpy.props.EnumProperty(
+        items=[
+            ('UP', "Up", "Move earlier in the chain"),
+            ('DOWN', "Down", "Move later in the chain")
+        ]
+    )
+
+    def execute(self, context):
+        props = context.scene.gph_dissolve_props
+
+        target = self.index - 1 if self.direction == 'UP' else self.index + 1
+        if not 0 <= self.index < len(props.chain_layers) or not 0 <= target < len(props.chain_layers):
+            return {'CANCELLED'}
+
+        props.chain_layers.move(self.index, target)
+        return {'FINISHED'}
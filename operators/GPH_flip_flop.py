@@ -1,12 +1,17 @@
+import time
+from bisect import bisect_right
+
 import bpy
 from bpy.types import Operator
+from ..utils import find_previous_keyframe, find_next_keyframe, get_sorted_keyframes
+from ..utils.frame_history import frame_history, record_frame_jump
 
 class GPH_OT_flip_flop_toggle(Operator):
     """Toggle between current frame and target frame"""
     bl_idname = "gph.flip_flop_toggle"
     bl_label = "Flip/Flop"
     bl_description = "Toggle between current frame and comparison frame (hotkey recommended: Alt+F)"
-    bl_options = {'REGISTER', 'UNDO'}
+    bl_options = {'REGISTER'}
 
     def execute(self, context):
         scene = context.scene
@@ -15,6 +20,7 @@ class GPH_OT_flip_flop_toggle(Operator):
 
         if props.is_flopped:
             # We're currently flopped, go back to original
+            record_frame_jump(current_frame, props.original_frame)
             scene.frame_set(props.original_frame)
             props.is_flopped = False
         else:
@@ -31,6 +37,7 @@ class GPH_OT_flip_flop_toggle(Operator):
 
             # Store original and flip
             props.original_frame = current_frame
+            record_frame_jump(current_frame, target_frame)
             scene.frame_set(target_frame)
             props.is_flopped = True
 
@@ -63,50 +70,14 @@ class GPH_OT_flip_flop_toggle(Operator):
         return None
 
     def find_previous_keyframe(self, context, current_frame):
-        """Find previous keyframe in active layer"""
-        obj = context.active_object
-        if not obj or obj.type != 'GREASEPENCIL':
-            return None
-
-        gp_data = obj.data
-        layer = gp_data.layers.active
-
-        if not layer:
-            return None
-
-        # Get all keyframes before current
-        keyframes = []
-        for frame in layer.frames:
-            if frame.frame_number < current_frame:
-                keyframes.append(frame.frame_number)
-
-        if keyframes:
-            return max(keyframes)  # Closest one before current
-
-        return None
+        """Find previous keyframe in the configured key scope"""
+        props = context.scene.gph_flip_flop_props
+        return find_previous_keyframe(context, current_frame, props.key_scope)
 
     def find_next_keyframe(self, context, current_frame):
-        """Find next keyframe in active layer"""
-        obj = context.active_object
-        if not obj or obj.type != 'GREASEPENCIL':
-            return None
-
-        gp_data = obj.data
-        layer = gp_data.layers.active
-
-        if not layer:
-            return None
-
-        # Get all keyframes after current
-        keyframes = []
-        for frame in layer.frames:
-            if frame.frame_number > current_frame:
-                keyframes.append(frame.frame_number)
-
-        if keyframes:
-            return min(keyframes)  # Closest one after current
-
-        return None
+        """Find next keyframe in the configured key scope"""
+        props = context.scene.gph_flip_flop_props
+        return find_next_keyframe(context, current_frame, props.key_scope)
 
 
 class GPH_OT_set_flip_frame(Operator):
@@ -132,7 +103,7 @@ class GPH_OT_flip_to_previous(Operator):
     bl_idname = "gph.flip_to_previous"
     bl_label = "Flip to Previous"
     bl_description = "Flip to previous frame (frame - 1)"
-    bl_options = {'REGISTER', 'UNDO'}
+    bl_options = {'REGISTER'}
 
     def execute(self, context):
         props = context.scene.gph_flip_flop_props
@@ -145,7 +116,7 @@ class GPH_OT_flip_to_next(Operator):
     bl_idname = "gph.flip_to_next"
     bl_label = "Flip to Next"
     bl_description = "Flip to next frame (frame + 1)"
-    bl_options = {'REGISTER', 'UNDO'}
+    bl_options = {'REGISTER'}
 
     def execute(self, context):
         props = context.scene.gph_flip_flop_props
@@ -158,14 +129,190 @@ class GPH_OT_reset_flip_flop(Operator):
     bl_idname = "gph.reset_flip_flop"
     bl_label = "Reset Flip/Flop"
     bl_description = "Reset flip/flop to normal state"
-    bl_options = {'REGISTER', 'UNDO'}
+    bl_options = {'REGISTER'}
 
     def execute(self, context):
         props = context.scene.gph_flip_flop_props
 
         if props.is_flopped:
+            record_frame_jump(context.scene.frame_current, props.original_frame)
             context.scene.frame_set(props.original_frame)
 
         props.is_flopped = False
 
         return {'FINISHED'}
+
+
+class GPH_OT_flip_history_back(Operator):
+    """Step back through visited frames"""
+    bl_idname = "gph.flip_history_back"
+    bl_label = "Previous Visited Frame"
+    bl_description = "Go back to the previously visited frame"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return frame_history.can_go_back
+
+    def execute(self, context):
+        frame = frame_history.back()
+        if frame is None:
+            return {'CANCELLED'}
+
+        context.scene.frame_set(frame)
+        return {'FINISHED'}
+
+
+class GPH_OT_flip_history_forward(Operator):
+    """Step forward through visited frames"""
+    bl_idname = "gph.flip_history_forward"
+    bl_label = "Next Visited Frame"
+    bl_description = "Go forward to the next visited frame"
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return frame_history.can_go_forward
+
+    def execute(self, context):
+        frame = frame_history.forward()
+        if frame is None:
+            return {'CANCELLED'}
+
+        context.scene.frame_set(frame)
+        return {'FINISHED'}
+
+
+# State of the running roll, shared between the operator and the timer
+_roll_state = {
+    "running": False,
+    "frames": [],
+    "index": 0,
+    "interval": 0.125,
+    "steps": 0,
+    "start_time": 0.0,
+    "set_frame": None,
+}
+
+
+def _set_frame_deferred(scene, frame):
+    """Change frame and let the window manager evaluate it once, on redraw"""
+    scene.frame_current = frame
+
+
+def _set_frame_immediate(scene, frame):
+    """Change frame and evaluate the scene right away"""
+    scene.frame_set(frame)
+
+
+def _roll_step():
+    """Timer callback showing the next roll frame"""
+    state = _roll_state
+    if not state["running"]:
+        return None
+
+    frames = state["frames"]
+    try:
+        state["set_frame"](bpy.context.scene, frames[state["index"]])
+    except (ReferenceError, AttributeError):
+        state["running"] = False
+        return None
+
+    state["index"] = (state["index"] + 1) % len(frames)
+    state["steps"] += 1
+
+    # Schedule against the start time so timer jitter doesn't accumulate
+    next_time = state["start_time"] + state["steps"] * state["interval"]
+    return max(0.0, next_time - time.perf_counter())
+
+
+class GPH_OT_flip_roll(Operator):
+    """Roll through a few drawings repeatedly, press any key to stop"""
+    bl_idname = "gph.flip_roll"
+    bl_label = "Roll"
+    bl_description = "Cycle through a set of frames at a fixed rate. Press any key to stop"
+    bl_options = {'REGISTER'}
+
+    def invoke(self, context, event):
+        props = context.scene.gph_flip_flop_props
+
+        if _roll_state["running"]:
+            # Clicking again stops the running roll
+            _roll_state["running"] = False
+            return {'FINISHED'}
+
+        frames = self.get_roll_frames(context)
+        if len(frames) < 2:
+            self.report({'WARNING'}, "Need at least 2 frames to roll through")
+            return {'CANCELLED'}
+
+        # Deferred frame change is the cheapest: evaluation happens once per
+        # redraw instead of synchronously on every step
+        if context.window:
+            set_frame = _set_frame_deferred
+        else:
+            set_frame = _set_frame_immediate
+
+        self.original_frame = context.scene.frame_current
+
+        _roll_state.update(
+            running=True,
+            frames=frames,
+            index=0,
+            interval=1.0 / props.roll_rate,
+            steps=0,
+            start_time=time.perf_counter(),
+            set_frame=set_frame,
+        )
+        props.is_rolling = True
+
+        bpy.app.timers.register(_roll_step, first_interval=0.0)
+        context.window_manager.modal_handler_add(self)
+
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        # Stop on any key press, or when the roll was stopped elsewhere
+        if _roll_state["running"] and event.value != 'PRESS':
+            return {'PASS_THROUGH'}
+
+        self.stop(context)
+        return {'FINISHED'}
+
+    def stop(self, context):
+        """Stop the timer, restore the frame and report the achieved rate"""
+        state = _roll_state
+        state["running"] = False
+
+        if bpy.app.timers.is_registered(_roll_step):
+            bpy.app.timers.unregister(_roll_step)
+
+        elapsed = time.perf_counter() - state["start_time"]
+        achieved = state["steps"] / elapsed if elapsed > 0 else 0.0
+        requested = 1.0 / state["interval"]
+
+        props = context.scene.gph_flip_flop_props
+        props.is_rolling = False
+        context.scene.frame_set(self.original_frame)
+
+        self.report({'INFO'}, f"Rolled at {achieved:.1f} fps (requested {requested:.1f} fps)")
+
+    def get_roll_frames(self, context):
+        """Get the frames to cycle through"""
+        props = context.scene.gph_flip_flop_props
+
+        if props.roll_source == 'CUSTOM':
+            frames = []
+            for part in props.roll_frames.split(","):
+                part = part.strip()
+                if part.lstrip("-").isdigit():
+                    frames.append(int(part))
+            return frames
+
+        # Keyframes leading up to (and including) the current drawing
+        keyframes = get_sorted_keyframes(context, props.key_scope)
+        end = bisect_right(keyframes, context.scene.frame_current)
+        end = max(end, min(props.roll_count, len(keyframes)))
+        start = max(0, end - props.roll_count)
+
+        return keyframes[start:end]
@@ -0,0 +1,77 @@
+import bpy
+from ..utils import Job, run_steps, start_job, cancel_job, rollback_job
+
+# Seconds between two checks of a running job by the modal operator
+MODAL_TIMER_INTERVAL = 0.1
+
+# Events still handled by Blender while a job runs (viewing, not editing)
+PASS_THROUGH_EVENTS = {'TIMER', 'MOUSEMOVE', 'INBETWEEN_MOUSEMOVE', 'WINDOW_DEACTIVATE', 'TIMER_REPORT'}
+
+
+class GPH_JobOperator:
+    """
+    Mixin for operators whose work can take long: it runs as a chunked job.
+
+    execute() calls run_job() with the work generator (see utils/jobs.py)
+    and returns its result. Work that fits in one chunk finishes right away;
+    longer work goes modal, showing its progress, until it finishes (one
+    undo step, like any operator) or Esc cancels it (undone). Background
+    Blender runs the work in one go. job_finished() reports the result.
+    """
+
+    def run_job(self, context, steps):
+        job = Job(self.bl_label, steps)
+
+        if bpy.app.background or context.window is None:
+            job.result = run_steps(steps)
+            job.state = 'FINISHED'
+            return self.job_finished(context, job)
+
+        # Short work doesn't need to go modal
+        job.run_chunk()
+        if not job.running:
+            return self.end_job(context, job)
+
+        start_job(job, context.window_manager)
+        self._job = job
+        self._timer = context.window_manager.event_timer_add(MODAL_TIMER_INTERVAL, window=context.window)
+        context.window_manager.modal_handler_add(self)
+        self.show_job_status(context, job)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        job = self._job
+
+        if event.type == 'ESC' and event.value == 'PRESS':
+            cancel_job(job)
+
+        if job.running:
+            self.show_job_status(context, job)
+            if event.type in PASS_THROUGH_EVENTS:
+                return {'PASS_THROUGH'}
+            # Keep edits out while the job changes the data
+            return {'RUNNING_MODAL'}
+
+        context.window_manager.event_timer_remove(self._timer)
+        context.workspace.status_text_set(None)
+        return self.end_job(context, job)
+
+    def end_job(self, context, job):
+        if job.state == 'FINISHED':
+            return self.job_finished(context, job)
+
+        # Partial changes: back to the state before the job
+        rollback_job(context.window, job.name)
+
+        if job.state == 'CANCELLED':
+            self.report({'WARNING'}, f"{job.name} cancelled, changes undone")
+        else:
+            self.report({'ERROR'}, f"{job.name} failed: {job.error}")
+        return {'CANCELLED'}
+
+    def show_job_status(self, context, job):
+        context.workspace.status_text_set(f"{job.name}: {int(job.progress * 100)}% (Esc to cancel)")
+
+    def job_finished(self, context, job):
+        """Report the result of a finished job (override)"""
+        return {'FINISHED'}
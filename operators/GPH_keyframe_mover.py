@@ -1,6 +1,49 @@
 import bpy
 from bpy.types import Operator
-from ..utils import has_keyframe_at_frame, get_keyframes_after_frame, get_all_keyframes_in_range
+from .. import api
+from ..utils import sync_object_layer_settings, find_layer, calculate_safe_backward_offset
+from .GPH_layer_operations import tag_layer_areas_redraw
+
+
+def get_mover_objects(context):
+    """Get the GP objects keys are moved on: the active object and the selected ones"""
+    objects = [context.active_object] + [obj for obj in context.selected_objects if obj != context.active_object]
+    return api.get_gp_objects(objects)
+
+
+def move_keys_backward(operator, objects, frame, frame_offset, layer_names=None):
+    """
+    Move keys from the playhead onward to the left by the safe offset.
+
+    Reports through the operator why the offset is reduced or the move refused.
+
+    Returns:
+        int: Offset moved by, 0 if nothing moved
+    """
+    key_frames = api.get_key_frames(objects, layer_names)
+
+    if frame in key_frames:
+        operator.report({'WARNING'}, "Cannot move backwards - keyframe detected at playhead")
+        return 0
+
+    affected_keyframes = [key_frame for key_frame in key_frames if key_frame > frame]
+    if not affected_keyframes:
+        operator.report({'INFO'}, "No keyframes found after playhead to move")
+        return 0
+
+    # Calculate the safe maximum offset to avoid collisions
+    safe_offset = calculate_safe_backward_offset(frame, frame_offset, affected_keyframes)
+
+    if safe_offset == 0:
+        operator.report({'WARNING'}, "Cannot move backwards - would cause keyframe collision")
+        return 0
+
+    if safe_offset < frame_offset:
+        operator.report({'WARNING'}, f"Reduced offset from {frame_offset} to {safe_offset} frames to avoid collision")
+
+    api.move_keys(objects, frame, -safe_offset, layer_names)
+    return safe_offset
+
 
 class GPH_OT_keyframe_mover_forward(Operator):
     """Move all keyframes from playhead onward by the specified number of frames to the right"""
@@ -9,17 +52,15 @@ class GPH_OT_keyframe_mover_forward(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        if context.area.type != 'DOPESHEET_EDITOR':
-            self.report({'ERROR'}, "This operator only works in the Dope Sheet editor.")
+        objects = get_mover_objects(context)
+        if not objects:
+            self.report({'ERROR'}, "No Grease Pencil object selected")
             return {'CANCELLED'}
 
-        # Get the frame offset from properties
         frame_offset = context.scene.gph_keyframe_props.frame_offset
+        api.move_keys(objects, context.scene.frame_current, frame_offset)
 
-        bpy.ops.action.select_all(action='DESELECT')
-        bpy.ops.action.select_leftright(mode='RIGHT', extend=False)
-        bpy.ops.transform.transform(mode='TIME_TRANSLATE', value=(frame_offset, 0, 0, 0))
-
+        tag_layer_areas_redraw(context)
         return {'FINISHED'}
 
 class GPH_OT_keyframe_mover_backward(Operator):
@@ -29,96 +70,18 @@ class GPH_OT_keyframe_mover_backward(Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        if context.area.type != 'DOPESHEET_EDITOR':
-            self.report({'ERROR'}, "This operator only works in the Dope Sheet editor.")
+        objects = get_mover_objects(context)
+        if not objects:
+            self.report({'ERROR'}, "No Grease Pencil object selected")
             return {'CANCELLED'}
 
-        scene = context.scene
-        current_frame = scene.frame_current
         frame_offset = context.scene.gph_keyframe_props.frame_offset
-
-        # Get all keyframes that will be affected (keyframes after current frame)
-        affected_keyframes = get_keyframes_after_frame(context.active_object, current_frame)
-
-        if not affected_keyframes:
-            self.report({'INFO'}, "No keyframes found after playhead to move")
-            return {'CANCELLED'}
-
-        # Calculate the safe maximum offset to avoid collisions
-        safe_offset = self.calculate_safe_backward_offset(context, current_frame, frame_offset, affected_keyframes)
-
-        if safe_offset == 0:
-            self.report({'WARNING'}, "Cannot move backwards - would cause keyframe collision")
+        if not move_keys_backward(self, objects, context.scene.frame_current, frame_offset):
             return {'CANCELLED'}
 
-        if safe_offset < frame_offset:
-            self.report({'WARNING'}, f"Reduced offset from {frame_offset} to {safe_offset} frames to avoid collision")
-
-        # Check if there's a keyframe at the playhead
-        if has_keyframe_at_frame(context.active_object, current_frame):
-            self.report({'WARNING'}, "Cannot move backwards - keyframe detected at playhead")
-            return {'CANCELLED'}
-
-        # No keyframe at playhead, proceed with backward movement using safe offset
-        bpy.ops.action.select_all(action='DESELECT')
-        bpy.ops.action.select_leftright(mode='RIGHT', extend=False)
-        bpy.ops.transform.transform(mode='TIME_TRANSLATE', value=(-safe_offset, 0, 0, 0))
-
+        tag_layer_areas_redraw(context)
         return {'FINISHED'}
 
-    def calculate_safe_backward_offset(self, context, current_frame, desired_offset, affected_keyframes):
-        """Calculate the maximum safe offset to avoid keyframe collisions."""
-        if not affected_keyframes:
-            return desired_offset
-
-        # Find the minimum distance from current frame to any affected keyframe
-        min_distance = min(kf - current_frame for kf in affected_keyframes)
-
-        print(f"DEBUG: Current frame: {current_frame}, Desired offset: {desired_offset}")
-        print(f"DEBUG: Affected keyframes: {affected_keyframes}")
-        print(f"DEBUG: Minimum distance to keyframe: {min_distance}")
-
-        # Check what keyframes exist in the target collision zone
-        # When moving backwards by offset, keyframes will land at (original_position - offset)
-        # We need to check if any keyframes will land in the "forbidden zone"
-        # between current_frame and the closest existing keyframe to the left
-
-        # Get all existing keyframes before current frame to find collision boundaries
-        all_existing_keyframes = get_all_keyframes_in_range(context.active_object, 1, current_frame)
-
-        # Find the closest existing keyframe to the left of current frame
-        closest_left_keyframe = None
-        if all_existing_keyframes:
-            closest_left_keyframe = max(all_existing_keyframes)
-
-        print(f"DEBUG: Existing keyframes before current: {all_existing_keyframes}")
-        print(f"DEBUG: Closest left keyframe: {closest_left_keyframe}")
-
-        # Calculate safe offset
-        if min_distance <= desired_offset:
-            # The desired offset would cause collision
-            # Reduce offset to the maximum safe distance minus 1
-            safe_offset = min_distance - 1
-            if safe_offset < 1:
-                return 0  # No safe movement possible
-            return safe_offset
-
-        # Check if any affected keyframe would land on existing keyframes
-        max_safe_offset = desired_offset
-        for kf in affected_keyframes:
-            target_position = kf - desired_offset
-
-            # If target position would be at or before current frame, that's invalid
-            if target_position <= current_frame:
-                # Calculate maximum offset that keeps this keyframe after current frame
-                max_safe_for_this_kf = kf - current_frame - 1
-                if max_safe_for_this_kf > 0:
-                    max_safe_offset = min(max_safe_offset, max_safe_for_this_kf)
-                else:
-                    return 0  # No safe movement possible
-
-        return max(1, max_safe_offset)
-
 
 class GPH_OT_refresh_layers(Operator):
     """Refresh the list of Grease Pencil layers"""
@@ -129,9 +92,6 @@ class GPH_OT_refresh_layers(Operator):
     def execute(self, context):
         props = context.scene.gph_keyframe_props
 
-        # Clear existing layer settings
-        props.layer_settings.clear()
-
         # Find active GP object
         gp_obj = None
         if context.active_object and context.active_object.type == 'GREASEPENCIL':
@@ -154,30 +114,18 @@ class GPH_OT_refresh_layers(Operator):
             self.report({'WARNING'}, "No Grease Pencil object found")
             return {'CANCELLED'}
 
-        # Populate layer settings in reverse order to match GP layers panel display order
-        for layer in reversed(gp_obj.data.layers):
-            layer_setting = props.layer_settings.add()
-            layer_setting.layer_name = layer.info if hasattr(layer, 'info') else layer.name
-            layer_setting.is_enabled = True
+        # Diff against the existing entries, keeping their enabled flags
+        sync_object_layer_settings(props, gp_obj.data)
 
         self.report({'INFO'}, f"Found {len(props.layer_settings)} GP layers")
         return {'FINISHED'}
 
 
-class GPH_OT_keyframe_mover_layer_forward(Operator):
-    """Move keyframes forward for a specific Grease Pencil layer"""
-    bl_idname = "gph.keyframe_mover_layer_forward"
-    bl_label = "Move Layer Keyframes Forward"
-    bl_options = {'REGISTER', 'UNDO'}
+class GPH_LayerMoverMixin:
+    """Shared checks of the per-layer movers"""
 
-    layer_name: bpy.props.StringProperty(name="Layer Name")
-
-    def execute(self, context):
-        if context.area.type != 'DOPESHEET_EDITOR':
-            self.report({'ERROR'}, "This operator only works in the Dope Sheet editor.")
-            return {'CANCELLED'}
-
-        # Find the layer setting
+    def get_layer_target(self, context):
+        """Get the GP object whose layer moves, or None after reporting why"""
         props = context.scene.gph_keyframe_props
         layer_setting = None
         for setting in props.layer_settings:
@@ -187,227 +135,49 @@ class GPH_OT_keyframe_mover_layer_forward(Operator):
 
         if not layer_setting:
             self.report({'ERROR'}, f"Layer setting not found for '{self.layer_name}'")
-            return {'CANCELLED'}
+            return None
 
         if not layer_setting.is_enabled:
             self.report({'INFO'}, f"Layer '{self.layer_name}' is disabled")
-            return {'CANCELLED'}
+            return None
 
-        # Use master frame offset
-        frame_offset = props.frame_offset
-
-        # Set the GP object as active and ensure we're working with the right layer
         gp_obj = context.active_object
         if not gp_obj or gp_obj.type != 'GREASEPENCIL':
             self.report({'ERROR'}, f"No active Grease Pencil object found")
-            return {'CANCELLED'}
-
-        # Find and make the target layer active
-        target_layer = None
-        for layer in gp_obj.data.layers:
-            layer_id = layer.info if hasattr(layer, 'info') else layer.name
-            if layer_id == self.layer_name:
-                target_layer = layer
-                break
+            return None
 
-        if not target_layer:
+        if not find_layer(gp_obj.data, self.layer_name):
             self.report({'ERROR'}, f"Layer '{self.layer_name}' not found")
-            return {'CANCELLED'}
-
-        # Store original active layer
-        original_active_layer = gp_obj.data.layers.active
-
-        try:
-            # Same master behavior but filtered to this layer
-            bpy.ops.action.select_all(action='DESELECT')
-            bpy.ops.action.select_leftright(mode='RIGHT', extend=False)
-
-            # Filter selection to only this layer's keyframes
-            self.filter_selection_to_layer(context, self.layer_name)
+            return None
 
-            # Move using same transform as master
-            bpy.ops.transform.transform(mode='TIME_TRANSLATE', value=(frame_offset, 0, 0, 0))
+        return gp_obj
 
-            self.report({'INFO'}, f"Moved '{self.layer_name}' keyframes forward by {frame_offset} frames")
 
-        finally:
-            # Restore original active layer
-            if original_active_layer:
-                gp_obj.data.layers.active = original_active_layer
-
-        return {'FINISHED'}
-
-    def filter_selection_to_layer(self, context, layer_name):
-        """Filter selection to only GP frames and attribute keyframes from the specified layer."""
-        gp_obj = context.active_object
-        if not gp_obj or gp_obj.type != 'GREASEPENCIL':
-            return
-
-        print(f"DEBUG: Filtering to layer '{layer_name}' - GP frames and attributes only")
-
-        # Deselect drawing frames from other layers
-        drawing_frames_deselected = 0
-        for layer in gp_obj.data.layers:
-            layer_id = layer.info if hasattr(layer, 'info') else layer.name
-            if layer_id != layer_name:
-                # Deselect all drawing frames from other layers
-                for frame in layer.frames:
-                    if hasattr(frame, 'select') and frame.select:
-                        frame.select = False
-                        drawing_frames_deselected += 1
-
-        # Deselect attribute keyframes from other layers
-        attribute_keyframes_deselected = 0
-
-        # Check both object-level and GP data-level animation data
-        animation_data_sources = []
-        if gp_obj.animation_data and gp_obj.animation_data.action:
-            animation_data_sources.append(gp_obj.animation_data.action)
-        if gp_obj.data.animation_data and gp_obj.data.animation_data.action:
-            animation_data_sources.append(gp_obj.data.animation_data.action)
-
-        for action in animation_data_sources:
-            for fcurve in action.fcurves:
-                # Check if this fcurve affects a different layer
-                if 'layers[' in fcurve.data_path:
-                    # Extract layer name from data path like 'layers["LayerName"].opacity'
-                    is_target_layer = f'layers["{layer_name}"]' in fcurve.data_path
-
-                    if not is_target_layer:
-                        # Deselect all keyframes in this fcurve
-                        for keyframe in fcurve.keyframe_points:
-                            if keyframe.select_control_point:
-                                keyframe.select_control_point = False
-                                attribute_keyframes_deselected += 1
-                            if keyframe.select_left_handle:
-                                keyframe.select_left_handle = False
-                            if keyframe.select_right_handle:
-                                keyframe.select_right_handle = False
-
-        print(f"DEBUG: Deselected {drawing_frames_deselected} drawing frames and {attribute_keyframes_deselected} attribute keyframes from other layers")
-
-    def move_layer_keyframes(self, context, layer_name, offset):
-        """Move keyframes for a specific layer forward."""
-        gp_obj = context.active_object
-        if not gp_obj or gp_obj.type != 'GREASEPENCIL':
-            return False
-
-        current_frame = context.scene.frame_current
-        moved_any = False
-
-        # Find the specific layer
-        target_layer = None
-        for layer in gp_obj.data.layers:
-            layer_id = layer.info if hasattr(layer, 'info') else layer.name
-            if layer_id == layer_name:
-                target_layer = layer
-                break
-
-        if not target_layer:
-            return False
-
-        # Move GP frames for this layer
-        frames_to_move = []
-        for frame in target_layer.frames:
-            if frame.frame_number > current_frame:
-                frames_to_move.append(frame)
-
-        # Sort by frame number in reverse order to avoid conflicts
-        frames_to_move.sort(key=lambda f: f.frame_number, reverse=True)
-
-        for frame in frames_to_move:
-            old_frame_num = frame.frame_number
-            new_frame_num = old_frame_num + offset
-
-            # Check if target frame already exists
-            existing_frames = {f.frame_number for f in target_layer.frames}
-            if new_frame_num not in existing_frames:
-                # Create new frame at target position
-                new_frame = target_layer.frames.new(new_frame_num)
-
-                # Copy frame data
-                try:
-                    if hasattr(frame, 'copy_to'):
-                        frame.copy_to(new_frame)
-                    else:
-                        # Alternative copying method
-                        new_frame.strokes.clear()
-                        for stroke in frame.strokes:
-                            new_stroke = new_frame.strokes.new()
-                            new_stroke.copy_from(stroke)
-                except:
-                    pass  # If copying fails, at least create empty frame
-
-                # Remove original frame using frame number
-                try:
-                    # Create a list of frames to check since we modified the collection
-                    frames_to_check = [f for f in target_layer.frames if f.frame_number == old_frame_num and f != new_frame]
-                    if frames_to_check:
-                        # Remove by frame number - this is the correct API
-                        del target_layer.frames[old_frame_num]
-                except:
-                    # Alternative removal method if del doesn't work
-                    try:
-                        target_layer.frames.remove(old_frame_num)
-                    except:
-                        pass  # If removal fails, at least we have the new frame
-                moved_any = True
-
-        # Also move layer attribute keyframes
-        moved_any |= self.move_layer_attribute_keyframes(context, layer_name, current_frame, offset)
-
-        return moved_any
-
-    def move_layer_attribute_keyframes(self, context, layer_name, current_frame, offset):
-        """Move layer attribute keyframes (opacity, tint, etc.) forward."""
-        gp_obj = context.active_object
-        if not gp_obj or gp_obj.type != 'GREASEPENCIL':
-            return False
-
-        moved_any = False
-
-        # Check both object-level and GP data-level animation data
-        animation_data_sources = []
-        if gp_obj.animation_data and gp_obj.animation_data.action:
-            animation_data_sources.append(gp_obj.animation_data.action)
-        if gp_obj.data.animation_data and gp_obj.data.animation_data.action:
-            animation_data_sources.append(gp_obj.data.animation_data.action)
-
-        for action in animation_data_sources:
-            # Find fcurves that affect this specific layer
-            layer_fcurves = []
-            for fcurve in action.fcurves:
-                if f'layers["{layer_name}"]' in fcurve.data_path:
-                    layer_fcurves.append(fcurve)
-
-            # Move keyframes in layer-specific fcurves
-            for fcurve in layer_fcurves:
-                keyframes_to_move = []
-                for keyframe in fcurve.keyframe_points:
-                    if keyframe.co[0] > current_frame:
-                        keyframes_to_move.append(keyframe)
+class GPH_OT_keyframe_mover_layer_forward(GPH_LayerMoverMixin, Operator):
+    """Move keyframes forward for a specific Grease Pencil layer"""
+    bl_idname = "gph.keyframe_mover_layer_forward"
+    bl_label = "Move Layer Keyframes Forward"
+    bl_options = {'REGISTER', 'UNDO'}
 
-                # Sort by frame in reverse order to avoid conflicts
-                keyframes_to_move.sort(key=lambda kf: kf.co[0], reverse=True)
+    layer_name: bpy.props.StringProperty(name="Layer Name")
 
-                for keyframe in keyframes_to_move:
-                    old_frame = keyframe.co[0]
-                    new_frame = old_frame + offset
+    def execute(self, context):
+        gp_obj = self.get_layer_target(context)
+        if not gp_obj:
+            return {'CANCELLED'}
 
-                    # Move the keyframe
-                    keyframe.co[0] = new_frame
-                    keyframe.handle_left[0] += offset
-                    keyframe.handle_right[0] += offset
-                    moved_any = True
+        # Use master frame offset
+        frame_offset = context.scene.gph_keyframe_props.frame_offset
 
-                # Update the fcurve if we moved any keyframes
-                if keyframes_to_move:
-                    fcurve.update()
+        # Drawings and attribute keys of this layer only
+        api.move_keys([gp_obj], context.scene.frame_current, frame_offset, layer_names=[self.layer_name])
 
-        return moved_any
+        self.report({'INFO'}, f"Moved '{self.layer_name}' keyframes forward by {frame_offset} frames")
+        tag_layer_areas_redraw(context)
+        return {'FINISHED'}
 
 
-class GPH_OT_keyframe_mover_layer_backward(Operator):
+class GPH_OT_keyframe_mover_layer_backward(GPH_LayerMoverMixin, Operator):
     """Move keyframes backward for a specific Grease Pencil layer"""
     bl_idname = "gph.keyframe_mover_layer_backward"
     bl_label = "Move Layer Keyframes Backward"
@@ -416,309 +186,23 @@ class GPH_OT_keyframe_mover_layer_backward(Operator):
     layer_name: bpy.props.StringProperty(name="Layer Name")
 
     def execute(self, context):
-        if context.area.type != 'DOPESHEET_EDITOR':
-            self.report({'ERROR'}, "This operator only works in the Dope Sheet editor.")
-            return {'CANCELLED'}
-
-        # Find the layer setting
-        props = context.scene.gph_keyframe_props
-        layer_setting = None
-        for setting in props.layer_settings:
-            if setting.layer_name == self.layer_name:
-                layer_setting = setting
-                break
-
-        if not layer_setting:
-            self.report({'ERROR'}, f"Layer setting not found for '{self.layer_name}'")
-            return {'CANCELLED'}
-
-        if not layer_setting.is_enabled:
-            self.report({'INFO'}, f"Layer '{self.layer_name}' is disabled")
+        gp_obj = self.get_layer_target(context)
+        if not gp_obj:
             return {'CANCELLED'}
 
         # Use master frame offset
-        frame_offset = props.frame_offset
-        current_frame = context.scene.frame_current
-
-        # Get keyframes for this layer after current frame
-        affected_keyframes = self.get_layer_keyframes_after_frame(context, self.layer_name, current_frame)
-
-        if not affected_keyframes:
-            self.report({'INFO'}, f"No keyframes found after playhead for layer '{self.layer_name}'")
-            return {'CANCELLED'}
-
-        # Calculate safe offset using the same logic as master backward
-        safe_offset = self.calculate_safe_backward_offset_for_layer(context, self.layer_name, current_frame, frame_offset, affected_keyframes)
-
-        if safe_offset == 0:
-            self.report({'WARNING'}, f"Cannot move layer '{self.layer_name}' backwards - would cause collision")
-            return {'CANCELLED'}
-
-        if safe_offset < frame_offset:
-            self.report({'WARNING'}, f"Reduced layer '{self.layer_name}' offset from {frame_offset} to {safe_offset} frames to avoid collision")
-
-        # Set the GP object as active and ensure we're working with the right layer
-        gp_obj = context.active_object
-        if not gp_obj or gp_obj.type != 'GREASEPENCIL':
-            self.report({'ERROR'}, f"No active Grease Pencil object found")
-            return {'CANCELLED'}
-
-        # Find and make the target layer active
-        target_layer = None
-        for layer in gp_obj.data.layers:
-            layer_id = layer.info if hasattr(layer, 'info') else layer.name
-            if layer_id == self.layer_name:
-                target_layer = layer
-                break
+        frame_offset = context.scene.gph_keyframe_props.frame_offset
 
-        if not target_layer:
-            self.report({'ERROR'}, f"Layer '{self.layer_name}' not found")
+        safe_offset = move_keys_backward(
+            self, [gp_obj], context.scene.frame_current, frame_offset, layer_names=[self.layer_name]
+        )
+        if not safe_offset:
             return {'CANCELLED'}
 
-        # Store original active layer
-        original_active_layer = gp_obj.data.layers.active
-
-        try:
-            # Same master behavior but filtered to this layer
-            bpy.ops.action.select_all(action='DESELECT')
-            bpy.ops.action.select_leftright(mode='RIGHT', extend=False)
-
-            # Filter selection to only this layer's keyframes
-            self.filter_selection_to_layer(context, self.layer_name)
-
-            # Move using same transform as master with safe offset
-            bpy.ops.transform.transform(mode='TIME_TRANSLATE', value=(-safe_offset, 0, 0, 0))
-
-            self.report({'INFO'}, f"Moved '{self.layer_name}' keyframes backward by {safe_offset} frames")
-
-        finally:
-            # Restore original active layer
-            if original_active_layer:
-                gp_obj.data.layers.active = original_active_layer
-
+        self.report({'INFO'}, f"Moved '{self.layer_name}' keyframes backward by {safe_offset} frames")
+        tag_layer_areas_redraw(context)
         return {'FINISHED'}
 
-    def filter_selection_to_layer(self, context, layer_name):
-        """Filter selection to only GP frames and attribute keyframes from the specified layer."""
-        gp_obj = context.active_object
-        if not gp_obj or gp_obj.type != 'GREASEPENCIL':
-            return
-
-        print(f"DEBUG: Filtering to layer '{layer_name}' - GP frames and attributes only")
-
-        # Deselect drawing frames from other layers
-        drawing_frames_deselected = 0
-        for layer in gp_obj.data.layers:
-            layer_id = layer.info if hasattr(layer, 'info') else layer.name
-            if layer_id != layer_name:
-                # Deselect all drawing frames from other layers
-                for frame in layer.frames:
-                    if hasattr(frame, 'select') and frame.select:
-                        frame.select = False
-                        drawing_frames_deselected += 1
-
-        # Deselect attribute keyframes from other layers
-        attribute_keyframes_deselected = 0
-
-        # Check both object-level and GP data-level animation data
-        animation_data_sources = []
-        if gp_obj.animation_data and gp_obj.animation_data.action:
-            animation_data_sources.append(gp_obj.animation_data.action)
-        if gp_obj.data.animation_data and gp_obj.data.animation_data.action:
-            animation_data_sources.append(gp_obj.data.animation_data.action)
-
-        for action in animation_data_sources:
-            for fcurve in action.fcurves:
-                # Check if this fcurve affects a different layer
-                if 'layers[' in fcurve.data_path:
-                    # Extract layer name from data path like 'layers["LayerName"].opacity'
-                    is_target_layer = f'layers["{layer_name}"]' in fcurve.data_path
-
-                    if not is_target_layer:
-                        # Deselect all keyframes in this fcurve
-                        for keyframe in fcurve.keyframe_points:
-                            if keyframe.select_control_point:
-                                keyframe.select_control_point = False
-                                attribute_keyframes_deselected += 1
-                            if keyframe.select_left_handle:
-                                keyframe.select_left_handle = False
-                            if keyframe.select_right_handle:
-                                keyframe.select_right_handle = False
-
-        print(f"DEBUG: Deselected {drawing_frames_deselected} drawing frames and {attribute_keyframes_deselected} attribute keyframes from other layers")
-
-    def get_layer_keyframes_after_frame(self, context, layer_name, frame):
-        """Get keyframes for a specific layer after the specified frame."""
-        gp_obj = context.active_object
-        if not gp_obj or gp_obj.type != 'GREASEPENCIL':
-            return []
-
-        keyframes = []
-
-        # Get drawing keyframes
-        for layer in gp_obj.data.layers:
-            layer_id = layer.info if hasattr(layer, 'info') else layer.name
-            if layer_id == layer_name:
-                for gp_frame in layer.frames:
-                    if gp_frame.frame_number > frame:
-                        keyframes.append(gp_frame.frame_number)
-                break
-
-        # Get layer attribute keyframes
-        animation_data_sources = []
-        if gp_obj.animation_data and gp_obj.animation_data.action:
-            animation_data_sources.append(gp_obj.animation_data.action)
-        if gp_obj.data.animation_data and gp_obj.data.animation_data.action:
-            animation_data_sources.append(gp_obj.data.animation_data.action)
-
-        for action in animation_data_sources:
-            for fcurve in action.fcurves:
-                if f'layers["{layer_name}"]' in fcurve.data_path:
-                    for keyframe in fcurve.keyframe_points:
-                        kf_frame = int(keyframe.co[0])
-                        if kf_frame > frame:
-                            keyframes.append(kf_frame)
-
-        return sorted(list(set(keyframes)))
-
-    def calculate_safe_backward_offset_for_layer(self, context, layer_name, current_frame, desired_offset, affected_keyframes):
-        """Calculate safe backward offset for a specific layer."""
-        if not affected_keyframes:
-            return desired_offset
-
-        min_distance = min(kf - current_frame for kf in affected_keyframes)
-
-        if min_distance <= desired_offset:
-            safe_offset = min_distance - 1
-            if safe_offset < 1:
-                return 0
-            return safe_offset
-
-        return desired_offset
-
-    def move_layer_keyframes_backward(self, context, layer_name, offset):
-        """Move keyframes for a specific layer backward."""
-        gp_obj = context.active_object
-        if not gp_obj or gp_obj.type != 'GREASEPENCIL':
-            return False
-
-        current_frame = context.scene.frame_current
-        moved_any = False
-
-        # Find the specific layer
-        target_layer = None
-        for layer in gp_obj.data.layers:
-            layer_id = layer.info if hasattr(layer, 'info') else layer.name
-            if layer_id == layer_name:
-                target_layer = layer
-                break
-
-        if not target_layer:
-            return False
-
-        # Move GP frames for this layer
-        frames_to_move = []
-        for frame in target_layer.frames:
-            if frame.frame_number > current_frame:
-                frames_to_move.append(frame)
-
-        # Sort by frame number to avoid conflicts
-        frames_to_move.sort(key=lambda f: f.frame_number)
-
-        for frame in frames_to_move:
-            old_frame_num = frame.frame_number
-            new_frame_num = old_frame_num - offset
-
-            if new_frame_num > current_frame:  # Only move if still after playhead
-                # Check if target frame already exists
-                existing_frames = {f.frame_number for f in target_layer.frames}
-                if new_frame_num not in existing_frames:
-                    # Create new frame at target position
-                    new_frame = target_layer.frames.new(new_frame_num)
-
-                    # Copy frame data
-                    try:
-                        if hasattr(frame, 'copy_to'):
-                            frame.copy_to(new_frame)
-                        else:
-                            # Alternative copying method
-                            new_frame.strokes.clear()
-                            for stroke in frame.strokes:
-                                new_stroke = new_frame.strokes.new()
-                                new_stroke.copy_from(stroke)
-                    except:
-                        pass  # If copying fails, at least create empty frame
-
-                    # Remove original frame using frame number
-                    try:
-                        # Create a list of frames to check since we modified the collection
-                        frames_to_check = [f for f in target_layer.frames if f.frame_number == old_frame_num and f != new_frame]
-                        if frames_to_check:
-                            # Remove by frame number - this is the correct API
-                            del target_layer.frames[old_frame_num]
-                    except:
-                        # Alternative removal method if del doesn't work
-                        try:
-                            target_layer.frames.remove(old_frame_num)
-                        except:
-                            pass  # If removal fails, at least we have the new frame
-                    moved_any = True
-
-        # Also move layer attribute keyframes
-        moved_any |= self.move_layer_attribute_keyframes_backward(context, layer_name, current_frame, offset)
-
-        return moved_any
-
-    def move_layer_attribute_keyframes_backward(self, context, layer_name, current_frame, offset):
-        """Move layer attribute keyframes (opacity, tint, etc.) backward."""
-        gp_obj = context.active_object
-        if not gp_obj or gp_obj.type != 'GREASEPENCIL':
-            return False
-
-        moved_any = False
-
-        # Check both object-level and GP data-level animation data
-        animation_data_sources = []
-        if gp_obj.animation_data and gp_obj.animation_data.action:
-            animation_data_sources.append(gp_obj.animation_data.action)
-        if gp_obj.data.animation_data and gp_obj.data.animation_data.action:
-            animation_data_sources.append(gp_obj.data.animation_data.action)
-
-        for action in animation_data_sources:
-            # Find fcurves that affect this specific layer
-            layer_fcurves = []
-            for fcurve in action.fcurves:
-                if f'layers["{layer_name}"]' in fcurve.data_path:
-                    layer_fcurves.append(fcurve)
-
-            # Move keyframes in layer-specific fcurves
-            for fcurve in layer_fcurves:
-                keyframes_to_move = []
-                for keyframe in fcurve.keyframe_points:
-                    if keyframe.co[0] > current_frame:
-                        keyframes_to_move.append(keyframe)
-
-                # Sort by frame in forward order to avoid conflicts when moving backward
-                keyframes_to_move.sort(key=lambda kf: kf.co[0])
-
-                for keyframe in keyframes_to_move:
-                    old_frame = keyframe.co[0]
-                    new_frame = old_frame - offset
-
-                    # Only move if the new position is still after the playhead
-                    if new_frame > current_frame:
-                        # Move the keyframe
-                        keyframe.co[0] = new_frame
-                        keyframe.handle_left[0] -= offset
-                        keyframe.handle_right[0] -= offset
-                        moved_any = True
-
-                # Update the fcurve if we moved any keyframes
-                if keyframes_to_move:
-                    fcurve.update()
-
-        return moved_any
-
 
 # Keep old class for backward compatibility
 class GPH_OT_keyframe_mover(GPH_OT_keyframe_mover_forward):
@@ -1,14 +1,72 @@
 import bpy
 from bpy.types import Operator
+from ..utils import solo_layers, restore_snapshot, get_solo_mode, get_soloed_layers
+from ..utils.layer_duplicate import DRAWING_MODE_ITEMS, duplicate_layers
+from ..utils.layer_sets import LAYER_SET_ITEMS, resolve_layer_set, describe_layer_set
 
-class GPH_OT_layer_solo(Operator):
-    """Solo this layer (lock all others)"""
+# Areas that display layer state
+LAYER_AREA_TYPES = {'DOPESHEET_EDITOR', 'PROPERTIES', 'VIEW_3D'}
+
+
+def tag_layer_areas_redraw(context):
+    """Redraw the areas that show layers"""
+    # No screen when run from a background script
+    if context.screen is None:
+        return
+
+    for area in context.screen.areas:
+        if area.type in LAYER_AREA_TYPES:
+            area.tag_redraw()
+
+
+class GPH_LayerSetTarget:
+    """Mixin for operators that act on a layer set"""
+
+    layer_set: bpy.props.EnumProperty(
+        name="Layers",
+        description="Layers to act on",
+        items=LAYER_SET_ITEMS,
+        default='SINGLE'
+    )
+
+    layer_name: bpy.props.StringProperty(
+        name="Layer",
+        description="Layer name, when acting on a single layer"
+    )
+
+    layer_pattern: bpy.props.StringProperty(
+        name="Pattern",
+        description="Wildcard pattern of layer names, when acting on a name pattern"
+    )
+
+    layer_group: bpy.props.StringProperty(
+        name="Group",
+        description="Layer group name, when acting on a layer group"
+    )
+
+    def get_target_layers(self, gp_data):
+        """Resolve the layer set of the operator"""
+        return resolve_layer_set(gp_data, self.layer_set, self.layer_name, self.layer_pattern, self.layer_group)
+
+    def describe_target(self):
+        return describe_layer_set(self.layer_set, self.layer_name, self.layer_pattern, self.layer_group)
+
+
+class GPH_OT_layer_solo(GPH_LayerSetTarget, Operator):
+    """Solo layers (lock or hide all others)"""
     bl_idname = "gph.layer_solo"
     bl_label = "Solo Layer"
-    bl_description = "Lock all other layers, or unsolo to unlock all"
+    bl_description = "Lock (or hide) all other layers, or unsolo to restore their previous state"
     bl_options = {'REGISTER', 'UNDO'}
-    
-    layer_name: bpy.props.StringProperty()
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ('LOCK', "Lock Others", "Lock every other layer"),
+            ('HIDE', "Hide Others", "Hide every other layer")
+        ],
+        default='LOCK'
+    )
     
     def execute(self, context):
         obj = context.active_object
@@ -18,60 +76,72 @@ class GPH_OT_layer_solo(Operator):
         
         gp_data = obj.data
         
-        # Find the target layer
-        target_layer = None
-        for layer in gp_data.layers:
-            if layer.name == self.layer_name:
-                target_layer = layer
-                break
+        # Find the target layers
+        target_layers = self.get_target_layers(gp_data)
         
-        if not target_layer:
-            self.report({'ERROR'}, f"Layer '{self.layer_name}' not found")
+        if not target_layers:
+            self.report({'ERROR'}, f"No {self.describe_target()} found")
             return {'CANCELLED'}
+
+        target_names = frozenset(layer.name for layer in target_layers)
         
-        # Check if currently soloed
-        is_soloed = self.is_layer_soloed(gp_data, target_layer)
+        # Check if the targets are currently soloed (cached, no layer scan)
+        soloed = get_soloed_layers(gp_data)
+        is_soloed = bool(soloed) and target_names <= soloed and get_solo_mode(gp_data) == self.mode
         
         if is_soloed:
-            # Unsolo: unlock all layers
-            for layer in gp_data.layers:
-                layer.lock = False
+            # Unsolo: restore the lock/hide state from before the solo
+            restore_snapshot(gp_data)
             self.report({'INFO'}, "Unsoloed all layers")
         else:
-            # Solo: lock all except target
-            for layer in gp_data.layers:
-                if layer == target_layer:
-                    layer.lock = False
-                else:
-                    layer.lock = True
-            self.report({'INFO'}, f"Soloed layer '{self.layer_name}'")
+            # Solo: snapshot, then lock/hide all except targets
+            solo_layers(gp_data, target_names, self.mode)
+            self.report({'INFO'}, f"Soloed {len(target_names)} layer(s)")
         
-        # Force UI refresh
-        for area in context.screen.areas:
-            area.tag_redraw()
+        tag_layer_areas_redraw(context)
         
         return {'FINISHED'}
-    
-    def is_layer_soloed(self, gp_data, layer):
-        """Check if this layer is currently soloed"""
-        if layer.lock:
-            return False
-        
-        other_layers_locked = all(
-            other.lock for other in gp_data.layers if other != layer
-        )
-        
-        return other_layers_locked
 
 
-class GPH_OT_layer_duplicate(Operator):
-    """Duplicate layer with all keyframes"""
+class GPH_OT_layer_duplicate(GPH_LayerSetTarget, Operator):
+    """Duplicate layers with all keyframes"""
     bl_idname = "gph.layer_duplicate"
     bl_label = "Duplicate Layer"
-    bl_description = "Duplicate this layer including all keyframes and drawings"
+    bl_description = "Duplicate layers with their keyframes, copying or instancing the drawings"
     bl_options = {'REGISTER', 'UNDO'}
-    
-    layer_name: bpy.props.StringProperty()
+
+    drawing_mode: bpy.props.EnumProperty(
+        name="Drawings",
+        description="How the drawings of the source layer are carried over",
+        items=DRAWING_MODE_ITEMS,
+        default='INSTANCE'
+    )
+
+    use_frame_range: bpy.props.BoolProperty(
+        name="Frame Range",
+        description="Only duplicate the keys inside a frame range",
+        default=False
+    )
+
+    frame_start: bpy.props.IntProperty(
+        name="Start",
+        description="First frame to duplicate",
+        default=1
+    )
+
+    frame_end: bpy.props.IntProperty(
+        name="End",
+        description="Last frame to duplicate",
+        default=250
+    )
+
+    def invoke(self, context, event):
+        # Default the range to the scene range
+        if not self.properties.is_property_set("frame_start"):
+            self.frame_start = context.scene.frame_start
+        if not self.properties.is_property_set("frame_end"):
+            self.frame_end = context.scene.frame_end
+        return self.execute(context)
     
     def execute(self, context):
         obj = context.active_object
@@ -81,51 +151,38 @@ class GPH_OT_layer_duplicate(Operator):
         
         gp_data = obj.data
         
-        # Find the source layer
-        source_layer = None
-        for layer in gp_data.layers:
-            if layer.name == self.layer_name:
-                source_layer = layer
-                break
+        # Find the source layers
+        source_layers = self.get_target_layers(gp_data)
         
-        if not source_layer:
-            self.report({'ERROR'}, f"Layer '{self.layer_name}' not found")
+        if not source_layers:
+            self.report({'ERROR'}, f"No {self.describe_target()} found")
             return {'CANCELLED'}
-        
-        # Make source layer active (required for duplication)
-        gp_data.layers.active = source_layer
-        
-        try:
-            # Use Blender's built-in duplicate operator
-            bpy.ops.grease_pencil.layer_duplicate()
-            
-            # The new layer is now active
-            new_layer = gp_data.layers.active
-            
-            self.report({'INFO'}, f"Duplicated layer '{self.layer_name}' as '{new_layer.name}'")
-            
-            # Force UI refresh
-            for area in context.screen.areas:
-                area.tag_redraw()
-            
-            return {'FINISHED'}
-            
-        except Exception as e:
-            self.report({'ERROR'}, f"Failed to duplicate layer: {e}")
-            import traceback
-            traceback.print_exc()
+
+        if self.use_frame_range and self.frame_end < self.frame_start:
+            self.report({'ERROR'}, "Frame range end is before its start")
             return {'CANCELLED'}
 
+        frame_range = (self.frame_start, self.frame_end) if self.use_frame_range else None
+        new_layers = duplicate_layers(gp_data, source_layers, self.drawing_mode, frame_range)
+        gp_data.layers.active = new_layers[-1]
+
+        if len(new_layers) == 1:
+            self.report({'INFO'}, f"Duplicated layer '{source_layers[0].name}' as '{new_layers[0].name}'")
+        else:
+            self.report({'INFO'}, f"Duplicated {len(new_layers)} layers")
+
+        tag_layer_areas_redraw(context)
+
+        return {'FINISHED'}
+
 
-class GPH_OT_layer_make_active(Operator):
+class GPH_OT_layer_make_active(GPH_LayerSetTarget, Operator):
     """Make this layer active"""
     bl_idname = "gph.layer_make_active"
     bl_label = "Activate Layer"
-    bl_description = "Click to make active"
+    bl_description = "Click to make active. With several layers, select them all and activate the top one"
     bl_options = {'REGISTER', 'UNDO'}
     
-    layer_name: bpy.props.StringProperty()
-    
     def execute(self, context):
         obj = context.active_object
         if not obj or obj.type != 'GREASEPENCIL':
@@ -133,17 +190,18 @@ class GPH_OT_layer_make_active(Operator):
         
         gp_data = obj.data
         
-        # Find and activate the layer
-        for layer in gp_data.layers:
-            if layer.name == self.layer_name:
-                gp_data.layers.active = layer
-                
-                # Force UI refresh
-                for area in context.screen.areas:
-                    area.tag_redraw()
-                
-                return {'FINISHED'}
-        
-        return {'CANCELLED'}
+        # Find and activate the layers
+        target_layers = self.get_target_layers(gp_data)
+        if not target_layers:
+            return {'CANCELLED'}
+
+        if len(target_layers) > 1:
+            target_names = {layer.name for layer in target_layers}
+            for layer in gp_data.layers:
+                layer.select = layer.name in target_names
 
+        gp_data.layers.active = target_layers[-1]
 
+        tag_layer_areas_redraw(context)
+
+        return {'FINISHED'}
@@ -1,5 +1,11 @@
 import bpy
 from bpy.types import Operator
+from ..api import light_table_enable, light_table_disable
+from ..utils.frame_history import record_frame_jump
+from ..utils.light_table import get_reference_object, get_light_table_collection, update_reference_object
+from ..utils.logger import get_logger
+
+log = get_logger(__name__)
 
 # Helper function to get source object (shared by all operators)
 def get_source_gp_object(context):
@@ -9,6 +15,11 @@ def get_source_gp_object(context):
     if not obj or obj.type != 'GREASEPENCIL':
         return None
     
+    # Reference objects point back to their source directly
+    source = obj.get("gph_light_table_source")
+    if source is not None and not isinstance(source, str):
+        return source
+
     # Check if this is a light table reference duplicate
     if "_LIGHT_TABLE_REF" in obj.name:
         # This is a duplicate, find the original
@@ -19,97 +30,41 @@ def get_source_gp_object(context):
             # Fallback: search for any object that references this duplicate
             for potential_source in bpy.data.objects:
                 if potential_source.type == 'GREASEPENCIL':
-                    ref_name = potential_source.get("gph_light_table_ref")
-                    if ref_name == obj.name:
+                    if get_reference_object(potential_source) == obj:
                         return potential_source
     
     return obj
 
 
-def disable_light_table(context, source_obj):
-    """Remove light table reference"""
-    # Find and remove reference object
-    ref_obj_name = source_obj.get("gph_light_table_ref")
+def get_source_gp_objects(context):
+    """Get every source GP object the light table should cover"""
+    props = context.scene.gph_light_table_props
+    active_source = get_source_gp_object(context)
 
-    if ref_obj_name and ref_obj_name in bpy.data.objects:
-        ref_obj = bpy.data.objects[ref_obj_name]
-        bpy.data.objects.remove(ref_obj, do_unlink=True)
+    if not props.multi_object:
+        return [active_source] if active_source else []
 
-        if "gph_light_table_ref" in source_obj:
-            del source_obj["gph_light_table_ref"]
+    sources = []
+    for obj in context.selected_objects:
+        if obj.type != 'GREASEPENCIL' or "gph_light_table_source" in obj:
+            continue
+        sources.append(obj)
 
+    if active_source and active_source not in sources:
+        sources.insert(0, active_source)
 
-def create_reference_object(context, source_obj):
-    """Create duplicate GP object for reference"""
-    props = context.scene.gph_light_table_props
-    
-    # Remove old reference if exists
-    disable_light_table(context, source_obj)
-    
-    try:
-        # Duplicate the GP object
-        ref_obj = source_obj.copy()
-        ref_obj.data = source_obj.data  # Link to same data
-        ref_obj.name = f"{source_obj.name}_LIGHT_TABLE_REF"
-        
-        # Link to collection
-        context.collection.objects.link(ref_obj)
-        
-        # Clear all modifiers from the duplicate for a clean reference
-        ref_obj.modifiers.clear()
-        print(f"Cleared {len(source_obj.modifiers)} modifiers from reference object")
-        
-        # Add Time Offset modifier
-        try:
-            time_mod = ref_obj.modifiers.new(name="Light Table Lock", type='GREASE_PENCIL_TIME')
-            time_mod.mode = 'FIX'
+    return sources
 
-            # For Grease Pencil v3 Time Offset modifier, use 'offset' attribute
-            time_mod.offset = props.reference_frame
-            
-            print(f"Created Time Offset modifier locked to frame {props.reference_frame}")
-            print(f"Time modifier offset value: {time_mod.offset}")
-            
-        except Exception as e:
-            print(f"Warning: Could not create Time Offset modifier: {e}")
-            import traceback
-            traceback.print_exc()
-
-        # Add Tint modifier if enabled
-        if props.use_tint:
-            try:
-                tint_mod = ref_obj.modifiers.new(name="Light Table Tint", type='GREASE_PENCIL_TINT')
-                tint_mod.color = props.tint_color
-                tint_mod.factor = 1.0
-                print("Created Tint modifier")
-            except Exception as e:
-                print(f"Warning: Could not create Tint modifier: {e}")
-                import traceback
-                traceback.print_exc()
-        
-        # Set opacity
-        ref_obj.color[3] = props.opacity
-        
-        # Set display properties
-        ref_obj.show_in_front = props.show_in_front
-        ref_obj.hide_render = True
-        ref_obj.hide_select = True
-        
-        # Store reference
-        source_obj["gph_light_table_ref"] = ref_obj.name
-        
-        # Tag for redraw
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
-        
-        return True
-        
-    except Exception as e:
-        print(f"Error creating light table reference: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+
+def tag_viewports_redraw(context):
+    """Tag all 3D viewports for redraw"""
+    # No screen when run from a background script
+    if context.screen is None:
+        return
+
+    for area in context.screen.areas:
+        if area.type == 'VIEW_3D':
+            area.tag_redraw()
 
 
 class GPH_OT_toggle_light_table(Operator):
@@ -126,36 +81,33 @@ class GPH_OT_toggle_light_table(Operator):
 
     def execute(self, context):
         props = context.scene.gph_light_table_props
-        print(f"Light table toggle execute - currently enabled: {props.enabled}")
+        log.debug("Light table toggle, currently enabled: %s", props.enabled)
         
-        # Get the actual source object (not the reference duplicate)
-        source_obj = get_source_gp_object(context)
-        if not source_obj:
+        # Get the actual source objects (not the reference duplicates)
+        source_objects = get_source_gp_objects(context)
+        if not source_objects and not props.enabled:
             self.report({'ERROR'}, "No valid Grease Pencil object found")
             return {'CANCELLED'}
 
         if props.enabled:
-            # Disable light table
-            print("Disabling light table...")
-            disable_light_table(context, source_obj)
-            props.enabled = False
+            # Disable light table - tears down every reference at once
+            log.debug("Disabling light table")
+            light_table_disable(context.scene)
             self.report({'INFO'}, "Light table disabled")
         else:
             # Enable light table
-            print("Enabling light table...")
+            log.debug("Enabling light table")
             
             # Store reference frame if lock_to_current
-            if props.lock_to_current:
-                props.reference_frame = context.scene.frame_current
-            
-            success = create_reference_object(context, source_obj)
-            if success:
-                props.enabled = True
-                self.report({'INFO'}, "Light table enabled")
-                print("Light table enabled successfully")
+            reference_frame = context.scene.frame_current if props.lock_to_current else None
+
+            created = light_table_enable(context.scene, source_objects, reference_frame)
+            if created:
+                tag_viewports_redraw(context)
+                self.report({'INFO'}, f"Light table enabled on {created} object(s)")
+                log.debug("Light table enabled on %d object(s)", created)
             else:
                 self.report({'ERROR'}, "Failed to enable light table")
-                print("Light table enable failed")
                 return {'CANCELLED'}
 
         return {'FINISHED'}
@@ -197,49 +149,23 @@ class GPH_OT_update_light_table(Operator):
     def execute(self, context):
         props = context.scene.gph_light_table_props
         
-        # Get the actual source object (not the reference duplicate)
-        source_obj = get_source_gp_object(context)
-
-        if not props.enabled or not source_obj:
+        if not props.enabled:
             return {'CANCELLED'}
 
-        # Find reference object
-        ref_obj_name = source_obj.get("gph_light_table_ref")
+        collection = get_light_table_collection(context.scene)
 
-        if not ref_obj_name or ref_obj_name not in bpy.data.objects:
-            # Reference doesn't exist, recreate
+        if collection is None or not collection.objects:
+            # References don't exist, recreate
             bpy.ops.gph.toggle_light_table()
             bpy.ops.gph.toggle_light_table()
             return {'FINISHED'}
 
-        ref_obj = bpy.data.objects[ref_obj_name]
-
-        # Update opacity
-        ref_obj.color[3] = props.opacity
-
-        # Update show in front
-        ref_obj.show_in_front = props.show_in_front
-
-        # Update time offset modifier - use 'offset' attribute
-        for mod in ref_obj.modifiers:
-            if mod.type == 'GREASE_PENCIL_TIME' and mod.name == "Light Table Lock":
-                mod.offset = props.reference_frame
-                print(f"Updated Time Offset modifier to frame {props.reference_frame}")
-                print(f"Time modifier offset value: {mod.offset}")
-
-        # Update tint modifier
-        for mod in ref_obj.modifiers:
-            if mod.type == 'GREASE_PENCIL_TINT' and mod.name == "Light Table Tint":
-                if props.use_tint:
-                    mod.color = props.tint_color
-                    mod.show_viewport = True
-                else:
-                    mod.show_viewport = False
+        # Apply the shared settings to every reference in one pass
+        for ref_obj in collection.objects:
+            update_reference_object(ref_obj, props)
 
         # Force viewport update
-        for area in context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        tag_viewports_redraw(context)
 
         return {'FINISHED'}
 
@@ -255,13 +181,7 @@ class GPH_OT_clear_reference(Operator):
         props = context.scene.gph_light_table_props
 
         if props.enabled:
-            # Get the actual source object before disabling
-            source_obj = get_source_gp_object(context)
-            
-            if source_obj:
-                # Disable using the source object
-                disable_light_table(context, source_obj)
-                props.enabled = False
+            light_table_disable(context.scene)
 
         props.reference_frame = 1
 
@@ -274,9 +194,10 @@ class GPH_OT_jump_to_reference(Operator):
     bl_idname = "gph.jump_to_reference"
     bl_label = "Jump to Reference"
     bl_description = "Jump timeline to reference frame"
-    bl_options = {'REGISTER', 'UNDO'}
+    bl_options = {'REGISTER'}
 
     def execute(self, context):
         props = context.scene.gph_light_table_props
+        record_frame_jump(context.scene.frame_current, props.reference_frame)
         context.scene.frame_set(props.reference_frame)
         return {'FINISHED'}
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""
+GP Helper - Performance Operators
+Manage the recorded operator timings
+"""
+
+import bpy
+from ..utils import clear_operator_history
+
+
+class GPH_OT_clear_performance_history(bpy.types.Operator):
+    """Forget the recorded GP Helper operator timings"""
+    bl_idname = "gph.clear_performance_history"
+    bl_label = "Clear Timings"
+    bl_options = {'REGISTER'}
+
+    # Not listed in its own history
+    record_timing = False
+
+    def execute(self, context):
+        clear_operator_history()
+        return {'FINISHED'}
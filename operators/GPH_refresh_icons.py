@@ -17,12 +17,12 @@ class GPH_OT_refresh_icons(bpy.types.Operator):
     def invoke(self, context, event):
         # Only reload icons if shift is held
         if event.shift:
-            load_icons()
+            load_icons(rescan=True)
             self.report({'INFO'}, "GP Helper icons reloaded")
         return {'FINISHED'}
 
     def execute(self, context):
         # Direct execution (no event) - just reload
-        load_icons()
+        load_icons(rescan=True)
         self.report({'INFO'}, "GP Helper icons reloaded")
         return {'FINISHED'}
@@ -8,7 +8,15 @@ from .GPH_keyframe_mover import (
     GPH_OT_keyframe_mover_layer_forward,
     GPH_OT_keyframe_mover_layer_backward
 )
-from .GPH_dissolve_automation import GPH_OT_dissolve_setup, GPH_OT_dissolve_refresh
+from .GPH_dissolve_automation import (
+    GPH_OT_dissolve_setup,
+    GPH_OT_dissolve_refresh,
+    GPH_OT_dissolve_bake,
+    GPH_OT_dissolve_chain_setup,
+    GPH_OT_dissolve_chain_refresh,
+    GPH_OT_dissolve_chain_remove,
+    GPH_OT_dissolve_chain_move
+)
 from .GPH_marker_spacing import GPH_OT_marker_spacing, GPH_OT_clear_markers, GPH_OT_add_gp_marker
 from .GPH_keyframe_spacing import GPH_OT_keyframe_spacing
 
@@ -28,7 +36,10 @@ from .GPH_flip_flop import (
     GPH_OT_set_flip_frame,
     GPH_OT_flip_to_previous,
     GPH_OT_flip_to_next,
-    GPH_OT_reset_flip_flop
+    GPH_OT_reset_flip_flop,
+    GPH_OT_flip_history_back,
+    GPH_OT_flip_history_forward,
+    GPH_OT_flip_roll
 )
 from .GPH_light_table import (
     GPH_OT_toggle_light_table,
@@ -44,6 +55,8 @@ from .GPH_layer_operations import (
     GPH_OT_layer_make_active,
 )
 from .GPH_refresh_icons import GPH_OT_refresh_icons
+from .GPH_performance import GPH_OT_clear_performance_history
+from ..utils import instrument_operator
 
 classes = (
     # Existing operators
@@ -56,6 +69,11 @@ classes = (
     GPH_OT_keyframe_spacing,
     GPH_OT_dissolve_setup,
     GPH_OT_dissolve_refresh,
+    GPH_OT_dissolve_bake,
+    GPH_OT_dissolve_chain_setup,
+    GPH_OT_dissolve_chain_refresh,
+    GPH_OT_dissolve_chain_remove,
+    GPH_OT_dissolve_chain_move,
     GPH_OT_marker_spacing,
     GPH_OT_clear_markers,
     GPH_OT_add_gp_marker,
@@ -73,6 +91,9 @@ classes = (
     GPH_OT_flip_to_previous,
     GPH_OT_flip_to_next,
     GPH_OT_reset_flip_flop,
+    GPH_OT_flip_history_back,
+    GPH_OT_flip_history_forward,
+    GPH_OT_flip_roll,
 
     # NEW: Light Table operators
     GPH_OT_toggle_light_table,
@@ -88,10 +109,13 @@ classes = (
 
     # NEW: Utility operators
     GPH_OT_refresh_icons,
+    GPH_OT_clear_performance_history,
 )
 
 def register():
     for cls in classes:
+        # Record execute() timings for the Performance panel
+        instrument_operator(cls)
         bpy.utils.register_class(cls)
 
 def unregister():
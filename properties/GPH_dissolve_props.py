@@ -1,6 +1,22 @@
 import bpy
 from bpy.types import PropertyGroup
-from bpy.props import StringProperty, IntProperty
+from bpy.props import StringProperty, IntProperty, BoolProperty, EnumProperty, CollectionProperty
+
+# Fade profiles of utils/fade_profiles.py
+FADE_PROFILE_ITEMS = [
+    ('LINEAR', "Linear", "Fade linearly"),
+    ('CONSTANT', "Cut", "Switch at the start of each fade without fading"),
+    ('EASE', "Ease In/Out", "Sine ease in and out of each fade"),
+    ('SMOOTHSTEP', "Smoothstep", "Smoothstep fade (Bezier keys with flat handles)"),
+    ('STEPPED_TWOS', "Stepped on Twos", "Linear fade held for two frames at a time"),
+    ('CUSTOM', "Custom LUT", "Fade following a custom list of values"),
+]
+
+class GPH_DissolveChainLayer(PropertyGroup):
+    layer_name: StringProperty(
+        name="Layer Name",
+        description="Name of the Grease Pencil layer in the chain"
+    )
 
 class GPH_dissolve_properties(PropertyGroup):
     layer1_name: StringProperty(
@@ -29,4 +45,29 @@ class GPH_dissolve_properties(PropertyGroup):
         default=10,
         min=1,
         max=100
-    )
\ No newline at end of file
+    )
+
+    use_cycles_modifier: BoolProperty(
+        name="Cyclic (Constant Size)",
+        description="Key a single cycle and repeat it with an F-curve Cycles modifier, instead of keying every cycle",
+        default=False
+    )
+
+    chain_layers: CollectionProperty(
+        type=GPH_DissolveChainLayer,
+        name="Chain Layers",
+        description="Layers to crossfade through, in order"
+    )
+
+    fade_curve: EnumProperty(
+        name="Fade Curve",
+        description="How each layer fades into the next one",
+        items=FADE_PROFILE_ITEMS,
+        default='LINEAR'
+    )
+
+    custom_lut: StringProperty(
+        name="Custom Curve",
+        description="Comma-separated fade values from 0 to 1, spread evenly over each fade",
+        default="0, 0.1, 0.5, 0.9, 1"
+    )
@@ -1,6 +1,6 @@
 import bpy
 from bpy.types import PropertyGroup
-from bpy.props import IntProperty, BoolProperty, EnumProperty
+from bpy.props import IntProperty, BoolProperty, EnumProperty, FloatProperty, StringProperty
 
 class GPH_FlipFlopProps(PropertyGroup):
     """Properties for flip/flop tool"""
@@ -38,8 +38,57 @@ class GPH_FlipFlopProps(PropertyGroup):
         default='PREVIOUS'
     )
 
+    key_scope: EnumProperty(
+        name="Key Scope",
+        description="Which keyframes Previous Key / Next Key look at",
+        items=[
+            ('ACTIVE_LAYER', "Active Layer", "Keyframes of the active layer"),
+            ('VISIBLE_LAYERS', "Visible Layers", "Keyframes of every visible layer of the active object"),
+            ('ALL_OBJECTS', "All GP Objects", "Keyframes of every visible layer of every Grease Pencil object")
+        ],
+        default='ACTIVE_LAYER'
+    )
+
     auto_update_stored: BoolProperty(
         name="Auto-Update Stored",
         description="Automatically update stored frame to current frame when setting",
         default=True
     )
+
+    roll_source: EnumProperty(
+        name="Roll Frames",
+        description="Which frames to cycle through when rolling",
+        items=[
+            ('KEYS', "Keyframes", "Cycle through the keyframes leading up to the current frame"),
+            ('CUSTOM', "Custom", "Cycle through a custom list of frames")
+        ],
+        default='KEYS'
+    )
+
+    roll_count: IntProperty(
+        name="Drawings",
+        description="Number of keyframes to roll through",
+        default=3,
+        min=2,
+        max=8
+    )
+
+    roll_frames: StringProperty(
+        name="Frames",
+        description="Comma-separated frames to roll through (e.g. 1, 5, 9)",
+        default="1, 5, 9"
+    )
+
+    roll_rate: FloatProperty(
+        name="Rate",
+        description="Drawings shown per second while rolling",
+        default=8.0,
+        min=1.0,
+        max=60.0
+    )
+
+    is_rolling: BoolProperty(
+        name="Rolling",
+        description="True while rolling through frames",
+        default=False
+    )
@@ -27,6 +27,25 @@ class GPH_KeyframeProperties(PropertyGroup):
         name="Layer Settings"
     )
 
+    layer_settings_owner: StringProperty(
+        name="Layer Settings Owner",
+        description="Name of the Grease Pencil data the layer settings were synced from",
+        default=""
+    )
+
+    layer_settings_owner_uid: IntProperty(
+        name="Layer Settings Owner UID",
+        description="Session UID of the Grease Pencil data the layer settings were synced from",
+        default=0
+    )
+
+    active_layer_setting_index: IntProperty(
+        name="Active Layer Setting",
+        description="Index of the highlighted row in the layer controls list",
+        default=0,
+        min=0
+    )
+
     show_layer_controls: BoolProperty(
         name="Show Layer Controls",
         description="Show individual layer controls",
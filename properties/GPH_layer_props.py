@@ -1,6 +1,8 @@
 import bpy
 from bpy.types import PropertyGroup
-from bpy.props import IntProperty
+from bpy.props import IntProperty, EnumProperty, StringProperty
+
+from ..utils.layer_sets import LAYER_SET_ITEMS
 
 def update_active_layer(self, context):
     """Update the active GP layer when list selection changes"""
@@ -21,4 +23,22 @@ class GPH_LayerManagerProps(PropertyGroup):
         default=0,
         min=0,
         update=update_active_layer
-    )
\ No newline at end of file
+    )
+
+    batch_layer_set: EnumProperty(
+        name="Batch Layers",
+        description="Layers the batch actions apply to",
+        items=[item for item in LAYER_SET_ITEMS if item[0] != 'SINGLE'],
+        default='SELECTED'
+    )
+
+    batch_pattern: StringProperty(
+        name="Pattern",
+        description="Wildcard pattern of layer names (e.g. 'Char_*')",
+        default="*"
+    )
+
+    batch_group: StringProperty(
+        name="Group",
+        description="Layer group the batch actions apply to"
+    )
@@ -64,3 +64,9 @@ class GPH_LightTableProps(PropertyGroup):
         description="Display reference in front of current drawing",
         default=False
     )
+
+    multi_object: BoolProperty(
+        name="All Selected Objects",
+        description="Create references for every selected Grease Pencil object, sharing these settings",
+        default=False
+    )
@@ -0,0 +1,25 @@
+import bpy
+from bpy.types import PropertyGroup
+from bpy.props import BoolProperty, StringProperty
+
+class GPH_PerformanceProps(PropertyGroup):
+    """Properties for the operator timing panel"""
+
+    count_touched_keys: BoolProperty(
+        name="Count Touched Keys",
+        description="Count the GP frames and keys each operator changes (compares every key before and after, slower on big scenes)",
+        default=False
+    )
+
+    profile_next_run: BoolProperty(
+        name="Profile Next Run",
+        description="Run the next GP Helper operator under cProfile and write its stats to a .prof file",
+        default=False
+    )
+
+    profile_directory: StringProperty(
+        name="Profile Folder",
+        description="Folder for the .prof files (the system temp folder if empty)",
+        default="",
+        subtype='DIR_PATH'
+    )
@@ -2,7 +2,7 @@ import bpy
 from bpy.types import PropertyGroup
 from bpy.props import StringProperty, IntProperty, PointerProperty
 
-from .GPH_dissolve_props import GPH_dissolve_properties
+from .GPH_dissolve_props import GPH_DissolveChainLayer, GPH_dissolve_properties
 from .GPH_marker_spacing_props import GPH_marker_spacing_properties
 from .GPH_keyframe_props import GPH_LayerKeyframeSettings, GPH_KeyframeProperties
 from .GPH_keyframe_spacing_props import GPH_KeyframeSpacingProps
@@ -10,8 +10,10 @@ from .GPH_breakdown_props import GPH_BreakdownProps
 from .GPH_flip_flop_props import GPH_FlipFlopProps
 from .GPH_light_table_props import GPH_LightTableProps
 from .GPH_layer_props import GPH_LayerManagerProps  # NEW
+from .GPH_performance_props import GPH_PerformanceProps
 
 classes = (
+    GPH_DissolveChainLayer,
     GPH_dissolve_properties,
     GPH_marker_spacing_properties,
     GPH_LayerKeyframeSettings,
@@ -21,6 +23,7 @@ classes = (
     GPH_FlipFlopProps,
     GPH_LightTableProps,
     GPH_LayerManagerProps,  # NEW
+    GPH_PerformanceProps,
 )
 
 def register():
@@ -35,6 +38,7 @@ def register():
     bpy.types.Scene.gph_flip_flop_props = PointerProperty(type=GPH_FlipFlopProps)
     bpy.types.Scene.gph_light_table_props = PointerProperty(type=GPH_LightTableProps)
     bpy.types.Scene.gph_layer_manager_props = PointerProperty(type=GPH_LayerManagerProps)  # NEW
+    bpy.types.Scene.gph_performance_props = PointerProperty(type=GPH_PerformanceProps)
 
 def unregister():
     for cls in reversed(classes):
@@ -55,4 +59,6 @@ def unregister():
     if hasattr(bpy.types.Scene, 'gph_light_table_props'):
         del bpy.types.Scene.gph_light_table_props
     if hasattr(bpy.types.Scene, 'gph_layer_manager_props'):
-        del bpy.types.Scene.gph_layer_manager_props  # NEW
\ No newline at end of file
+        del bpy.types.Scene.gph_layer_manager_props  # NEW
+    if hasattr(bpy.types.Scene, 'gph_performance_props'):
+        del bpy.types.Scene.gph_performance_props
@@ -0,0 +1,178 @@
+"""
+Batch retime - Apply the same retiming to many .blend files in parallel
+
+Runs one background Blender per file, up to --workers at a time, each
+applying the operations of a JSON spec with the add-on's API (see
+batch_retime_worker.py), and writes the per-file results and timings to a
+JSON report. Runs in plain Python, no Blender needed to start it.
+
+Usage:
+    python tools/batch_retime.py spec.json shots/*.blend --workers 8 --report report.json
+    python tools/batch_retime.py spec.json --files-from shots.txt --blender /opt/blender/blender
+
+Spec:
+    {
+        "operations": [
+            {"op": "marker_spacing", "spacing_method": "FIXED", "fixed_spacing": 6, "remove_markers": true},
+            {"op": "move_keys", "frame": 24, "offset": 4, "objects": ["Char"]}
+        ],
+        "output_dir": "retimed"
+    }
+
+Operations: move_keys, marker_spacing, space_keys, add_breakdowns; their
+keys are the arguments of the matching api.py functions. Files are saved in
+place unless "output_dir" is set ("save": false to only report). Under
+output_dir, each file keeps its path relative to the folder all the input
+files share, so sq010/shot.blend and sq020/shot.blend don't collide.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+WORKER_SCRIPT = Path(__file__).resolve().parent / "batch_retime_worker.py"
+
+# Lines of Blender output kept in the report when a file fails
+OUTPUT_TAIL_LINES = 20
+
+
+def get_output_paths(files, output_dir):
+    """
+    Map each input file to its path under the output directory.
+
+    Paths are mirrored relative to the deepest folder shared by all files.
+    """
+    if not output_dir:
+        return {path: None for path in files}
+
+    root = Path(os.path.commonpath([path.parent for path in files]))
+    return {path: Path(output_dir).resolve() / path.relative_to(root) for path in files}
+
+
+def retime_file(blender, blend_file, spec_path, output_path, timeout):
+    """Retime one file in a background Blender and collect its result"""
+    with tempfile.TemporaryDirectory(prefix="gph_retime_") as temp_dir:
+        result_path = Path(temp_dir) / "result.json"
+        command = [
+            blender, "--background", "--factory-startup", str(blend_file),
+            "--python", str(WORKER_SCRIPT), "--", str(spec_path), str(result_path),
+        ]
+        if output_path is not None:
+            command.append(str(output_path))
+
+        start = time.perf_counter()
+        try:
+            process = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return {"file": str(blend_file), "status": "timeout", "wall_seconds": time.perf_counter() - start}
+        wall_seconds = time.perf_counter() - start
+
+        if result_path.exists():
+            with open(result_path) as result_file:
+                result = json.load(result_file)
+        else:
+            # Blender failed before the worker could report
+            result = {"file": str(blend_file), "status": "error", "error": f"Blender exited with code {process.returncode}"}
+
+    result["wall_seconds"] = wall_seconds
+    if result["status"] != "ok":
+        output = (process.stdout + process.stderr).splitlines()
+        result["output"] = output[-OUTPUT_TAIL_LINES:]
+    return result
+
+
+def read_files(args):
+    files = [Path(path) for path in args.files]
+    if args.files_from:
+        with open(args.files_from) as list_file:
+            files.extend(Path(line.strip()) for line in list_file if line.strip())
+    return files
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("spec", help="JSON operation spec")
+    parser.add_argument("files", nargs="*", help=".blend files to retime")
+    parser.add_argument("--files-from", help="Text file listing .blend files, one per line")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Blender processes running at once")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender executable")
+    parser.add_argument("--timeout", type=float, default=None, help="Seconds before a file is abandoned")
+    parser.add_argument("--report", help="JSON file to write the report to")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    files = [path.resolve() for path in read_files(args)]
+    if not files:
+        sys.exit("No .blend files given")
+
+    missing = [str(path) for path in files if not path.is_file()]
+    if missing:
+        sys.exit(f"File(s) not found: {', '.join(missing)}")
+
+    duplicates = sorted({str(path) for path in files if files.count(path) > 1})
+    if duplicates:
+        sys.exit(f"File(s) given more than once: {', '.join(duplicates)}")
+
+    if shutil.which(args.blender) is None:
+        sys.exit(f"Blender executable not found: {args.blender}")
+
+    spec_path = Path(args.spec).resolve()
+    with open(spec_path) as spec_file:
+        spec = json.load(spec_file)
+
+    output_paths = get_output_paths(files, spec.get("output_dir") if spec.get("save", True) else None)
+
+    workers = max(1, min(args.workers, len(files)))
+    print(f"Retiming {len(files)} file(s) with {workers} worker(s)")
+
+    # Each task waits on its own Blender process, threads are enough to drive them
+    results = []
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(retime_file, args.blender, path, spec_path, output_paths[path], args.timeout)
+            for path in files
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            print(f"[{len(results)}/{len(files)}] {result['status']:<8}{result['wall_seconds']:8.1f} s  {result['file']}")
+    total_seconds = time.perf_counter() - start
+
+    results.sort(key=lambda result: result["file"])
+    failed = [result for result in results if result["status"] != "ok"]
+
+    report = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "blender": args.blender,
+        "workers": workers,
+        "spec": spec,
+        "total_seconds": total_seconds,
+        "summary": {"files": len(results), "ok": len(results) - len(failed), "failed": len(failed)},
+        "files": results,
+    }
+
+    print(f"Done in {total_seconds:.1f} s: {len(results) - len(failed)} ok, {len(failed)} failed")
+    for result in failed:
+        print(f"  {result['file']}: {result.get('error', result['status'])}")
+
+    if args.report:
+        with open(args.report, "w") as report_file:
+            json.dump(report, report_file, indent=2)
+        print(f"Report written to {args.report}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Batch retime worker, runs inside Blender on one file
+
+Started by batch_retime.py for every .blend file:
+    blender --background --factory-startup shot.blend --python tools/batch_retime_worker.py -- spec.json result.json [output.blend]
+
+Applies the operations of the spec with the add-on's API (api.py), saves
+the file and writes the per-operation results and timings to result.json.
+"""
+
+import importlib.util
+import json
+import sys
+import time
+import traceback
+from pathlib import Path
+
+import bpy
+
+ADDON_DIR = Path(__file__).resolve().parent.parent
+ADDON_NAME = "gp_helper"
+
+
+def import_addon():
+    """Import the add-on package from the repository"""
+    if ADDON_NAME in sys.modules:
+        return sys.modules[ADDON_NAME]
+
+    spec = importlib.util.spec_from_file_location(
+        ADDON_NAME, ADDON_DIR / "__init__.py", submodule_search_locations=[str(ADDON_DIR)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[ADDON_NAME] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def get_objects(scene, names):
+    """Get the objects named in an operation, or every GP object of the scene"""
+    if names is None:
+        return [obj for obj in scene.objects if obj.type == 'GREASEPENCIL']
+
+    missing = [name for name in names if name not in bpy.data.objects]
+    if missing:
+        raise ValueError(f"Object(s) not found: {', '.join(missing)}")
+    return [bpy.data.objects[name] for name in names]
+
+
+def get_layers(objects, names):
+    """Get the named layers of the objects, or their visible, unlocked layers"""
+    layers = []
+    for obj in objects:
+        for layer in obj.data.layers:
+            if names is None and not layer.lock and not layer.hide:
+                layers.append(layer)
+            elif names is not None and layer.name in names:
+                layers.append(layer)
+    return layers
+
+
+def run_move_keys(api, scene, operation):
+    objects = get_objects(scene, operation.get("objects"))
+    frame = operation.get("frame", scene.frame_current)
+    offset = operation["offset"]
+    layer_names = operation.get("layer_names")
+
+    if offset < 0 and operation.get("clamp", True):
+        # Same collision-safe clamping as Move Keyframes Backward
+        offset = -api.safe_backward_offset(objects, frame, -offset, layer_names)
+
+    keys_moved = api.move_keys(objects, frame, offset, layer_names)
+    return {"keys_moved": keys_moved, "offset": offset}
+
+
+def run_marker_spacing(api, scene, operation):
+    result = api.apply_marker_spacing(
+        scene,
+        objects=get_objects(scene, operation.get("objects")),
+        marker_frames=operation.get("marker_frames"),
+        spacing_method=operation.get("spacing_method", 'MULTIPLIER'),
+        fixed_spacing=operation.get("fixed_spacing", 20),
+        spacing_multiplier=operation.get("spacing_multiplier", 2.0),
+        auto_detect_spacing=operation.get("auto_detect_spacing", True),
+        remove_markers=operation.get("remove_markers", False),
+    )
+    return result._asdict()
+
+
+def run_space_keys(api, scene, operation):
+    objects = get_objects(scene, operation.get("objects"))
+    layers_spaced, collisions = api.space_keys(
+        get_layers(objects, operation.get("layer_names")),
+        operation["spacing"],
+        frames=operation.get("frames"),
+    )
+    return {"layers_spaced": layers_spaced, "collisions": collisions}
+
+
+def run_add_breakdowns(api, scene, operation):
+    objects = get_objects(scene, operation.get("objects"))
+    created, layers_processed = api.add_breakdowns(
+        get_layers(objects, operation.get("layer_names")),
+        position=operation.get("position", 0.5),
+        custom_offset=operation.get("custom_offset"),
+        copy_mode=operation.get("copy_mode", 'FIRST'),
+        frames=operation["frames"],
+    )
+    return {"breakdowns": created, "layers": layers_processed}
+
+
+# "op" of a spec operation -> function applying it
+OPERATIONS = {
+    "move_keys": run_move_keys,
+    "marker_spacing": run_marker_spacing,
+    "space_keys": run_space_keys,
+    "add_breakdowns": run_add_breakdowns,
+}
+
+
+def save(spec, output_path=None):
+    """
+    Save the file in place, or a copy in the spec's output directory.
+
+    output_path is the copy's path chosen by batch_retime.py; without it the
+    copy goes to output_dir under the file's name.
+    """
+    if not spec.get("save", True):
+        return None
+
+    output_dir = spec.get("output_dir")
+    if not output_dir:
+        bpy.ops.wm.save_mainfile()
+        return bpy.data.filepath
+
+    if output_path is None:
+        output_path = Path(output_dir) / Path(bpy.data.filepath).name
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    bpy.ops.wm.save_as_mainfile(filepath=str(output_path), copy=True)
+    return str(output_path)
+
+
+def run(spec):
+    """Apply every operation of the spec to the open file"""
+    import_addon()
+    # Imported on its own, the add-on may defer it (lazy registration)
+    api = importlib.import_module(f"{ADDON_NAME}.api")
+    scene = bpy.data.scenes[spec["scene"]] if spec.get("scene") else bpy.context.scene
+
+    results = []
+    for operation in spec["operations"]:
+        name = operation["op"]
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation '{name}'")
+
+        start = time.perf_counter()
+        result = OPERATIONS[name](api, scene, operation)
+        results.append({"op": name, "result": result, "seconds": time.perf_counter() - start})
+
+    return results
+
+
+def main():
+    args = sys.argv[sys.argv.index("--") + 1:]
+    spec_path, result_path = args[0], args[1]
+    output_path = args[2] if len(args) > 2 else None
+
+    with open(spec_path) as spec_file:
+        spec = json.load(spec_file)
+
+    report = {"file": bpy.data.filepath, "status": "ok"}
+    start = time.perf_counter()
+    try:
+        report["operations"] = run(spec)
+        report["saved"] = save(spec, output_path)
+    except Exception as error:
+        report["status"] = "error"
+        report["error"] = f"{type(error).__name__}: {error}"
+        report["traceback"] = traceback.format_exc()
+    report["seconds"] = time.perf_counter() - start
+
+    with open(result_path, "w") as result_file:
+        json.dump(report, result_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
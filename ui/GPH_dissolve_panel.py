@@ -28,7 +28,33 @@ class GPH_PT_dissolve_panel(Panel):
         box.label(text="Animation Settings:", icon='PREFERENCES')
         box.prop(props, "total_frames")
         box.prop(props, "cycle_length")
+        box.prop(props, "fade_curve")
+        if props.fade_curve == 'CUSTOM':
+            box.prop(props, "custom_lut", text="")
+        box.prop(props, "use_cycles_modifier")
 
         layout.separator()
         layout.operator("gph.dissolve_setup", icon='KEYFRAME_HLT')
+        layout.operator("gph.dissolve_bake", icon='REC')
+
+        # Multi-layer crossfade chain
+        layout.separator()
+        box = layout.box()
+        box.label(text="Dissolve Chain:", icon='LINKED')
+        box.operator("gph.dissolve_chain_refresh", icon='FILE_REFRESH')
+
+        col = box.column(align=True)
+        for i, item in enumerate(props.chain_layers):
+            row = col.row(align=True)
+            row.label(text=f"{i + 1}. {item.layer_name}")
+
+            op = row.operator("gph.dissolve_chain_move", text="", icon='TRIA_UP')
+            op.index = i
+            op.direction = 'UP'
+            op = row.operator("gph.dissolve_chain_move", text="", icon='TRIA_DOWN')
+            op.index = i
+            op.direction = 'DOWN'
+            row.operator("gph.dissolve_chain_remove", text="", icon='X').index = i
+
+        box.operator("gph.dissolve_chain_setup", icon='KEYFRAME_HLT')
 
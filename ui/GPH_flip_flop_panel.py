@@ -44,6 +44,38 @@ class GPH_PT_flip_flop_panel(Panel):
         flip_icon = 'LOOP_BACK' if props.is_flopped else 'LOOP_FORWARDS'
         row.operator("gph.flip_flop_toggle", text="FLIP/FLOP", icon=flip_icon, depress=props.is_flopped)
 
+        # Visited frame history
+        row = layout.row(align=True)
+        row.operator("gph.flip_history_back", text="Back", icon='TRIA_LEFT')
+        row.operator("gph.flip_history_forward", text="Forward", icon='TRIA_RIGHT')
+
+        layout.separator()
+
+        # Flip mode
+        col = layout.column(align=True)
+        col.prop(props, "flip_mode", text="Mode")
+        if props.flip_mode in {'PREVIOUS_KEY', 'NEXT_KEY'}:
+            col.prop(props, "key_scope", text="Keys")
+
+        layout.separator()
+
+        # Rolling
+        box = layout.box()
+        box.label(text="Rolling:", icon='FILE_REFRESH')
+
+        col = box.column(align=True)
+        col.prop(props, "roll_source", text="")
+        if props.roll_source == 'CUSTOM':
+            col.prop(props, "roll_frames", text="Frames")
+        else:
+            col.prop(props, "roll_count")
+        col.prop(props, "roll_rate")
+
+        row = box.row()
+        row.scale_y = 1.5
+        roll_text = "Rolling... (any key stops)" if props.is_rolling else "Roll"
+        row.operator("gph.flip_roll", text=roll_text, icon='PLAY', depress=props.is_rolling)
+
         layout.separator()
 
         # Stored frame control
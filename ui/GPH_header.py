@@ -5,109 +5,101 @@ Adds tools to the Dope Sheet top bar
 
 import bpy
 from bpy.types import Header, Menu
-from ..utils import get_icon
+from ..utils import get_icon, get_icon_generation
+
+# Icon arguments of the header buttons, resolved once per icon collection generation
+_header_icons = {"generation": None}
+
+
+def _icon_args(icon_name, fallback=None):
+    """Get operator icon keyword arguments, custom icon first, then the fallback"""
+    icon_id = get_icon(icon_name)
+    if icon_id > 0:
+        return {"icon_value": icon_id}
+    if fallback:
+        return {"icon": fallback}
+    return None
+
+
+def _get_header_icons():
+    """Get the cached header icon arguments"""
+    if _header_icons["generation"] != get_icon_generation():
+        _header_icons.update(
+            backward=_icon_args("gph_move_backward", 'BACK'),
+            forward=_icon_args("gph_move_forward", 'FORWARD'),
+            picker={"icon_value": get_icon("gph_picker")},
+            space=_icon_args("gph_space", 'KEYFRAME'),
+            # None: fallback depends on the tool state
+            flip_flop=_icon_args("gph_flip_flop"),
+            light_table=_icon_args("gph_light_table"),
+        )
+        # Read after the lookups, the first get_icon() call loads the icons
+        _header_icons["generation"] = get_icon_generation()
+    return _header_icons
 
 
 def draw_gp_helper_header(self, context):
     """Draw GP Helper tools in Dope Sheet header"""
-    layout = self.layout
-    
     # Only show for Grease Pencil objects
     obj = context.active_object
-    if not obj or obj.type != 'GREASEPENCIL':
+    if obj is None or obj.type != 'GREASEPENCIL':
         return
-    
+
+    layout = self.layout
+    scene = context.scene
+    icons = _get_header_icons()
+
     layout.separator()
-    
-        # === KEYFRAME MOVER ===
-    kf_props = context.scene.gph_keyframe_props
+
+    # === KEYFRAME MOVER ===
     row = layout.row(align=True)
-    
-    # Move backward/forward buttons with custom icons
-    backward_icon = get_icon("gph_move_backward")
-    forward_icon = get_icon("gph_move_forward")
-    
-    if backward_icon and backward_icon > 0:
-        row.operator("gph.keyframe_mover_backward", text="", icon_value=backward_icon)
-    else:
-        row.operator("gph.keyframe_mover_backward", text="", icon='BACK')
-    
-    if forward_icon and forward_icon > 0:
-        row.operator("gph.keyframe_mover_forward", text="", icon_value=forward_icon)
-    else:
-        row.operator("gph.keyframe_mover_forward", text="", icon='FORWARD')
-    
+    row.operator("gph.keyframe_mover_backward", text="", **icons["backward"])
+    row.operator("gph.keyframe_mover_forward", text="", **icons["forward"])
+
     # Frame offset input (compact)
     sub = row.row(align=True)
     sub.scale_x = 0.5
-    sub.prop(kf_props, "frame_offset", text="")
-    
-    
+    sub.prop(scene.gph_keyframe_props, "frame_offset", text="")
+
     # === FLIP/FLOP - Most frequently used ===
-    props = context.scene.gph_flip_flop_props
+    props = scene.gph_flip_flop_props
+    is_flopped = props.is_flopped
     row = layout.row(align=True)
-    
-    # Get custom flip/flop icon
-    flip_flop_custom_icon = get_icon("gph_flip_flop")
-    
-    # Main flip/flop button - use custom icon if available
-    if flip_flop_custom_icon and flip_flop_custom_icon > 0:
-        row.operator("gph.flip_flop_toggle", text="", icon_value=flip_flop_custom_icon, depress=props.is_flopped)
-    else:
-        # Fallback to default Blender icons
-        flip_icon = 'LOOP_BACK' if props.is_flopped else 'LOOP_FORWARDS'
-        row.operator("gph.flip_flop_toggle", text="", icon=flip_icon, depress=props.is_flopped)
-    
+
+    # Main flip/flop button - custom icon, or default Blender icons
+    flip_icon = icons["flip_flop"] or {"icon": 'LOOP_BACK' if is_flopped else 'LOOP_FORWARDS'}
+    row.operator("gph.flip_flop_toggle", text="", depress=is_flopped, **flip_icon)
+
     # Stored frame input (compact)
     sub = row.row(align=True)
     sub.scale_x = 0.6
     sub.prop(props, "stored_frame", text="")
-    
+
     # Set button
-    row.operator("gph.set_flip_frame", text="", icon_value=get_icon("gph_picker"))
-    
-    #layout.separator()
-    
+    row.operator("gph.set_flip_frame", text="", **icons["picker"])
+
     # === LIGHT TABLE ===
-    lt_props = context.scene.gph_light_table_props
+    lt_props = scene.gph_light_table_props
+    enabled = lt_props.enabled
     row = layout.row(align=True)
-    
-    # Get custom light table icon
-    light_table_custom_icon = get_icon("gph_light_table")
-    
+
     # Toggle button with visual feedback
-    if light_table_custom_icon and light_table_custom_icon > 0:
-        # Use custom icon
-        if lt_props.enabled:
-            row.alert = True
-        row.operator("gph.toggle_light_table", text="", icon_value=light_table_custom_icon, depress=lt_props.enabled)
+    row.alert = enabled
+    if icons["light_table"]:
+        row.operator("gph.toggle_light_table", text="", depress=enabled, **icons["light_table"])
     else:
-        # Fallback to default icons
-        if lt_props.enabled:
-            row.alert = True
-            icon = 'OUTLINER_OB_LIGHT'
-            text = "LT"
-        else:
-            icon = 'LIGHT'
-            text = "LT"
-        row.operator("gph.toggle_light_table", text=text, icon=icon, depress=lt_props.enabled)
-    
+        row.operator("gph.toggle_light_table", text="LT", icon='OUTLINER_OB_LIGHT' if enabled else 'LIGHT', depress=enabled)
+
     # Reference frame (compact)
     sub = row.row(align=True)
     sub.scale_x = 0.6
     sub.prop(lt_props, "reference_frame", text="")
-    
+
     # Eyedropper to set reference
-    row.operator("gph.set_reference_frame", text="", icon_value=get_icon("gph_picker"))
-    
-    #layout.separator()
-    
-
-    
-    #layout.separator()
-    
+    row.operator("gph.set_reference_frame", text="", **icons["picker"])
+
     # === KEYFRAME SPACING ===
-    spacing_props = context.scene.gph_keyframe_spacing_props
+    spacing_props = scene.gph_keyframe_spacing_props
     row = layout.row(align=True)
 
     # Spacing value input
@@ -116,16 +108,9 @@ def draw_gp_helper_header(self, context):
     sub.prop(spacing_props, "spacing_frames", text="")
 
     # Apply button with custom icon
-    spacing_icon = get_icon("gph_space")
-    op_row = row.row(align=True)
-    if spacing_icon and spacing_icon > 0:
-        op = op_row.operator("gph.keyframe_spacing", text="", icon_value=spacing_icon)
-    else:
-        op = op_row.operator("gph.keyframe_spacing", text="", icon='KEYFRAME')
+    op = row.operator("gph.keyframe_spacing", text="", **icons["space"])
     op.spacing_frames = spacing_props.spacing_frames
     op.ripple_edit = spacing_props.ripple_edit
-    
-    #layout.separator()
 
     # === MORE TOOLS MENU ===
     layout.menu("DOPESHEET_MT_gp_helper_tools", text="", icon='DOWNARROW_HLT')
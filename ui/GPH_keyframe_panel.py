@@ -1,5 +1,76 @@
 import bpy
-from bpy.types import Panel
+from bpy.types import Panel, UIList
+from ..utils import get_layer_settings_generation
+
+# Lowercase layer names, rebuilt when the layer settings change
+_lower_names = {"key": None, "names": []}
+
+# Filter flags and order of the last filter, reused while nothing changes
+_filter_cache = {"key": None, "result": ([], [])}
+
+
+def _get_lower_names(layer_settings):
+    """Get the cached lowercase names of the layer settings"""
+    key = (layer_settings.id_data.as_pointer(), get_layer_settings_generation(), len(layer_settings))
+    if _lower_names["key"] != key:
+        _lower_names["names"] = [setting.layer_name.lower() for setting in layer_settings]
+        _lower_names["key"] = key
+    return _lower_names["names"]
+
+
+class GPH_UL_layer_settings(UIList):
+    """Per-layer mover controls, only visible rows are drawn"""
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=False)
+
+        # Enable/disable checkbox
+        row.prop(item, "is_enabled", text="")
+
+        # Arrow controls grouped together, greyed out when disabled
+        arrow_row = row.row(align=True)
+        arrow_row.enabled = item.is_enabled
+        backward_op = arrow_row.operator("gph.keyframe_mover_layer_backward", text="", icon='BACK')
+        backward_op.layer_name = item.layer_name
+        forward_op = arrow_row.operator("gph.keyframe_mover_layer_forward", text="", icon='FORWARD')
+        forward_op.layer_name = item.layer_name
+
+        # Layer name on the right
+        row.label(text=item.layer_name)
+
+    def filter_items(self, context, data, propname):
+        layer_settings = getattr(data, propname)
+
+        key = (
+            data.id_data.as_pointer(),
+            get_layer_settings_generation(),
+            len(layer_settings),
+            self.filter_name,
+            self.use_filter_invert,
+            self.use_filter_sort_alpha,
+            self.use_filter_sort_reverse,
+        )
+        if _filter_cache["key"] == key:
+            return _filter_cache["result"]
+
+        names = _get_lower_names(layer_settings)
+
+        flags = []
+        if self.filter_name:
+            needle = self.filter_name.lower()
+            flags = [self.bitflag_filter_item if needle in name else 0 for name in names]
+
+        order = []
+        if self.use_filter_sort_alpha:
+            sorted_indices = sorted(range(len(names)), key=names.__getitem__)
+            order = [0] * len(names)
+            for position, index in enumerate(sorted_indices):
+                order[index] = position
+
+        _filter_cache["key"] = key
+        _filter_cache["result"] = (flags, order)
+
+        return flags, order
 
 class GPH_PT_keyframe_panel(Panel):
     """Panel in the Dope Sheet for keyframe tools"""
@@ -44,34 +115,15 @@ class GPH_PT_keyframe_panel(Panel):
             layout.separator()
             layout.label(text="Individual Layer Controls:")
 
-            for i, layer_setting in enumerate(props.layer_settings):
-                # Create a box for each layer
-                box = layout.box()
-
-                # Single horizontal row: checkbox + arrows + layer name
-                row = box.row(align=False)
-
-                # Enable/disable checkbox
-                row.prop(layer_setting, "is_enabled", text="")
-
-                if layer_setting.is_enabled:
-                    # Arrow controls grouped together
-                    arrow_row = row.row(align=True)
-                    backward_op = arrow_row.operator("gph.keyframe_mover_layer_backward", text="", icon='BACK')
-                    backward_op.layer_name = layer_setting.layer_name
-                    forward_op = arrow_row.operator("gph.keyframe_mover_layer_forward", text="", icon='FORWARD')
-                    forward_op.layer_name = layer_setting.layer_name
-                else:
-                    # If disabled, add spacing where arrows would be
-                    spacer = row.row(align=True)
-                    spacer.enabled = False
-                    spacer.label(text="  ")
-
-                # Layer name on the right
-                row.label(text=layer_setting.layer_name)
+            layout.template_list(
+                "GPH_UL_layer_settings", "",
+                props, "layer_settings",
+                props, "active_layer_setting_index",
+                rows=6, maxrows=12
+            )
 
         elif props.show_layer_controls and len(props.layer_settings) == 0:
             layout.separator()
             col = layout.column()
             col.label(text="No layers found.", icon='INFO')
-            col.label(text="Click 'Refresh Layers' to detect GP layers.")
\ No newline at end of file
+            col.label(text="Select a GP object or click 'Refresh Layers'.")
\ No newline at end of file
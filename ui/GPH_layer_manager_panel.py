@@ -1,5 +1,6 @@
 import bpy
 from bpy.types import Panel
+from ..utils import is_layer_soloed, get_solo_mode
 
 class GPH_PT_layer_manager_panel(Panel):
     """Layer manager with solo and duplicate buttons"""
@@ -41,24 +42,56 @@ class GPH_PT_layer_manager_panel(Panel):
             box.label(text="Quick Actions:")
             row = box.row(align=True)
 
-            # Solo button
-            is_soloed = self.is_layer_soloed(gpd, active_layer)
-            solo_icon = 'SOLO_ON' if is_soloed else 'SOLO_OFF'
-            solo_text = "Unsolo" if is_soloed else "Solo"
-            op = row.operator("gph.layer_solo", text=solo_text, icon=solo_icon)
+            # Solo buttons (cached solo state, no layer scan)
+            is_soloed = is_layer_soloed(gpd, active_layer)
+            solo_mode = get_solo_mode(gpd) if is_soloed else None
+
+            is_lock_soloed = solo_mode == 'LOCK'
+            op = row.operator("gph.layer_solo", text="Unsolo" if is_lock_soloed else "Solo",
+                              icon='SOLO_ON' if is_lock_soloed else 'SOLO_OFF')
+            op.layer_name = active_layer.name
+            op.mode = 'LOCK'
+
+            is_hide_soloed = solo_mode == 'HIDE'
+            op = row.operator("gph.layer_solo", text="Unsolo View" if is_hide_soloed else "Solo View",
+                              icon='HIDE_ON' if is_hide_soloed else 'HIDE_OFF')
             op.layer_name = active_layer.name
+            op.mode = 'HIDE'
 
             # Duplicate button
             op = row.operator("gph.layer_duplicate", text="Duplicate", icon='DUPLICATE')
             op.layer_name = active_layer.name
 
-    def is_layer_soloed(self, gp_data, layer):
-        """Check if this layer is currently soloed"""
-        if layer.lock:
-            return False
+            # Cleanup pass: same key timing, blank drawings
+            row = box.row(align=True)
+            op = row.operator("gph.layer_duplicate", text="Duplicate Timing Only", icon='KEYFRAME')
+            op.layer_name = active_layer.name
+            op.drawing_mode = 'EMPTY'
+
+        # Batch actions over a layer set
+        layer_props = context.scene.gph_layer_manager_props
+
+        layout.separator()
+        box = layout.box()
+        box.label(text="Batch Actions:")
 
-        other_layers = [l for l in gp_data.layers if l != layer]
-        if not other_layers:
-            return False
+        col = box.column(align=True)
+        col.prop(layer_props, "batch_layer_set", text="")
+        if layer_props.batch_layer_set == 'PATTERN':
+            col.prop(layer_props, "batch_pattern", text="")
+        elif layer_props.batch_layer_set == 'GROUP':
+            col.prop_search(layer_props, "batch_group", gpd, "layer_groups", text="")
 
-        return all(other.lock for other in other_layers)
\ No newline at end of file
+        row = box.row(align=True)
+        for idname, text, icon, mode in (
+            ("gph.layer_solo", "Solo", 'SOLO_OFF', 'LOCK'),
+            ("gph.layer_solo", "Solo View", 'HIDE_OFF', 'HIDE'),
+            ("gph.layer_duplicate", "Duplicate", 'DUPLICATE', None),
+            ("gph.layer_make_active", "Select", 'RESTRICT_SELECT_OFF', None),
+        ):
+            op = row.operator(idname, text=text, icon=icon)
+            op.layer_set = layer_props.batch_layer_set
+            op.layer_pattern = layer_props.batch_pattern
+            op.layer_group = layer_props.batch_group
+            if mode:
+                op.mode = mode
@@ -41,6 +41,10 @@ class GPH_PT_light_table_panel(Panel):
             icon = 'OUTLINER_OB_LIGHT' if props.enabled else 'LIGHT'
             row.operator("gph.toggle_light_table", text=text, icon=icon, depress=props.enabled)
 
+        row = box.row()
+        row.enabled = not props.enabled
+        row.prop(props, "multi_object")
+
         # Reference frame controls
         box = layout.box()
         box.label(text="Reference Frame:", icon='KEYFRAME_HLT')
@@ -0,0 +1,57 @@
+import bpy
+from bpy.types import Panel
+from ..utils import get_operator_history
+
+class GPH_PT_performance_panel(Panel):
+    """Panel showing the recent GP Helper operator timings"""
+    bl_label = "Performance"
+    bl_idname = "GPH_PT_performance_panel"
+    bl_space_type = 'DOPESHEET_EDITOR'
+    bl_region_type = 'UI'
+    bl_category = 'GP Helper'
+    bl_order = 20
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.gph_performance_props
+
+        # Capture options
+        col = layout.column(align=True)
+        col.prop(props, "count_touched_keys")
+        row = col.row(align=True)
+        row.prop(props, "profile_next_run", icon='REC' if props.profile_next_run else 'NONE')
+        if props.profile_next_run:
+            col.prop(props, "profile_directory", text="")
+
+        history = get_operator_history()
+
+        row = layout.row()
+        row.label(text=f"Recent Runs ({len(history)})", icon='TIME')
+        row.operator("gph.clear_performance_history", text="", icon='TRASH')
+
+        if not history:
+            layout.label(text="Run a GP Helper tool to record its timing", icon='INFO')
+            return
+
+        box = layout.box()
+        col = box.column(align=True)
+        for timing in history:
+            row = col.row(align=True)
+            icon = 'CHECKMARK' if timing.result == 'FINISHED' else 'CANCEL'
+            row.label(text=timing.label, icon=icon)
+            row.label(text=f"{timing.wall_ms:.1f} ms")
+
+            details = f"{timing.depsgraph_evals} evals"
+            if timing.keys_touched is not None:
+                details += f", {timing.keys_touched} keys"
+            if timing.undo_push:
+                details += ", undo"
+
+            row = col.row(align=True)
+            row.enabled = False
+            row.label(text=f"    {details}")
+
+            if timing.profile_path:
+                row = col.row(align=True)
+                row.label(text=f"    {bpy.path.basename(timing.profile_path)}", icon='FILE')
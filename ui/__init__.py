@@ -1,6 +1,6 @@
 import bpy
 
-from .GPH_keyframe_panel import GPH_PT_keyframe_panel
+from .GPH_keyframe_panel import GPH_UL_layer_settings, GPH_PT_keyframe_panel
 from .GPH_keyframe_spacing_panel import GPH_PT_keyframe_spacing_panel
 from .GPH_dissolve_panel import GPH_PT_dissolve_panel
 from .GPH_marker_spacing_panel import GPH_PT_marker_spacing_panel
@@ -9,6 +9,7 @@ from .GPH_breakdown_panel import GPH_PT_breakdown_panel
 from .GPH_flip_flop_panel import GPH_PT_flip_flop_panel
 from .GPH_light_table_panel import GPH_PT_light_table_panel
 from .GPH_layer_manager_panel import GPH_PT_layer_manager_panel
+from .GPH_performance_panel import GPH_PT_performance_panel
 
 # Import header components
 from .GPH_header import DOPESHEET_MT_gp_helper_tools, draw_gp_helper_header
@@ -17,6 +18,9 @@ classes = (
     # Header menu
     DOPESHEET_MT_gp_helper_tools,
 
+    # Lists
+    GPH_UL_layer_settings,
+
     # Sidebar panels (N-panel)
     GPH_PT_keyframe_spacing_panel,
     GPH_PT_keyframe_panel,
@@ -27,6 +31,7 @@ classes = (
     GPH_PT_breakdown_panel,
     GPH_PT_light_table_panel,
     GPH_PT_layer_manager_panel,
+    GPH_PT_performance_panel,
 )
 
 def register():
@@ -1,21 +1,159 @@
 # Utility functions and helpers for GP Helper addon
 # This module can contain shared functionality, constants, and helper functions
+#
+# Imported at registration: the NumPy-based modules (fcurve_utils,
+# layer_duplicate, dissolve, fade_profiles) are not re-exported here and are
+# imported directly by the operators and the API, which load on first use in
+# lazy registration mode.
 
-from .icon_loader import load_icons, get_icon, unload_icons, load_icons_on_file_load
+from .logger import get_logger, set_log_level
+from .icon_loader import (
+    load_icons,
+    reload_icons_if_changed,
+    get_icon,
+    get_icon_generation,
+    unload_icons,
+    load_icons_on_file_load
+)
 from .keyframe_utils import (
     has_keyframe_at_frame,
     get_keyframes_after_frame,
     get_all_keyframes_in_range,
     get_all_keyframes
 )
+from .keyframe_index import (
+    get_sorted_keyframes,
+    find_previous_keyframe,
+    find_next_keyframe,
+    invalidate_keyframe_index,
+    invalidate_keyframe_index_on_update,
+    invalidate_keyframe_index_on_reload
+)
+from .layer_index import (
+    get_layer_index,
+    find_layer,
+    find_layers,
+    get_group_layer_names,
+    is_layer_in_group,
+    invalidate_layer_index,
+    invalidate_layer_index_on_update,
+    invalidate_layer_index_on_reload
+)
+from .layer_sets import resolve_layer_set, describe_layer_set
+from .layer_solo import (
+    solo_layers,
+    restore_snapshot,
+    get_soloed_layers,
+    get_solo_mode,
+    is_layer_soloed,
+    clear_solo_cache,
+    clear_solo_cache_on_reload
+)
+from .layer_settings_sync import (
+    get_layer_settings_generation,
+    get_layer_names,
+    sync_layer_settings,
+    sync_object_layer_settings,
+    sync_active_layer_settings,
+    sync_layer_settings_on_update,
+    sync_layer_settings_on_file_load,
+    invalidate_layer_settings_on_reload
+)
+from .msgbus_subscriptions import (
+    subscribe_layer_updates,
+    unsubscribe_layer_updates,
+    resubscribe_layer_updates_on_file_load
+)
+from .timing import (
+    plan_keyframe_spacing,
+    apply_frame_plan,
+    move_frame,
+    shift_frames,
+    calculate_safe_backward_offset,
+    detect_spacing_around_marker,
+    calculate_spacing_to_add
+)
+from .profiling import (
+    instrument_operator,
+    get_operator_history,
+    clear_operator_history,
+    count_depsgraph_update
+)
+from .jobs import (
+    Job,
+    run_steps,
+    start_job,
+    cancel_job,
+    cancel_all_jobs,
+    get_running_jobs,
+    rollback_job,
+    cancel_jobs_on_file_load
+)
 
 __all__ = [
+    'get_logger',
+    'set_log_level',
     'load_icons',
+    'reload_icons_if_changed',
     'get_icon',
+    'get_icon_generation',
     'unload_icons',
     'load_icons_on_file_load',
     'has_keyframe_at_frame',
     'get_keyframes_after_frame',
     'get_all_keyframes_in_range',
-    'get_all_keyframes'
-]
\ No newline at end of file
+    'get_all_keyframes',
+    'get_sorted_keyframes',
+    'find_previous_keyframe',
+    'find_next_keyframe',
+    'invalidate_keyframe_index',
+    'invalidate_keyframe_index_on_update',
+    'invalidate_keyframe_index_on_reload',
+    'get_layer_index',
+    'find_layer',
+    'find_layers',
+    'get_group_layer_names',
+    'is_layer_in_group',
+    'invalidate_layer_index',
+    'invalidate_layer_index_on_update',
+    'invalidate_layer_index_on_reload',
+    'resolve_layer_set',
+    'describe_layer_set',
+    'solo_layers',
+    'restore_snapshot',
+    'get_soloed_layers',
+    'get_solo_mode',
+    'is_layer_soloed',
+    'clear_solo_cache',
+    'clear_solo_cache_on_reload',
+    'get_layer_settings_generation',
+    'get_layer_names',
+    'sync_layer_settings',
+    'sync_object_layer_settings',
+    'sync_active_layer_settings',
+    'sync_layer_settings_on_update',
+    'sync_layer_settings_on_file_load',
+    'invalidate_layer_settings_on_reload',
+    'subscribe_layer_updates',
+    'unsubscribe_layer_updates',
+    'resubscribe_layer_updates_on_file_load',
+    'plan_keyframe_spacing',
+    'apply_frame_plan',
+    'move_frame',
+    'shift_frames',
+    'calculate_safe_backward_offset',
+    'detect_spacing_around_marker',
+    'calculate_spacing_to_add',
+    'instrument_operator',
+    'get_operator_history',
+    'clear_operator_history',
+    'count_depsgraph_update',
+    'Job',
+    'run_steps',
+    'start_job',
+    'cancel_job',
+    'cancel_all_jobs',
+    'get_running_jobs',
+    'rollback_job',
+    'cancel_jobs_on_file_load',
+]
@@ -0,0 +1,48 @@
+"""
+Dissolve - Key layouts for dissolve and crossfade chains
+
+Pure NumPy: the key times and opacities of every layer are computed in one
+vectorized pass, then written to the opacity F-curves with write_keyframes().
+"""
+
+import numpy as np
+
+
+def compute_dissolve_keys(total_frames, cycle_length):
+    """
+    Compute the dissolve key times and opacities for both layers.
+
+    Each cycle starts with the dissolve layer hidden and the base layer
+    visible, and ends (one frame before the next cycle) the other way round.
+
+    Returns:
+        tuple: (frames, layer1_values, layer2_values) as NumPy arrays
+    """
+    cycle_starts = np.arange(0, total_frames + 1, cycle_length)
+    if cycle_length > 1:
+        cycle_ends = np.arange(cycle_length - 1, total_frames + 1, cycle_length)
+    else:
+        cycle_ends = np.empty(0, dtype=cycle_starts.dtype)
+
+    frames = np.sort(np.concatenate((cycle_starts, cycle_ends)))
+    layer1_values = np.where(frames % cycle_length == 0, 0.0, 1.0)
+    layer2_values = 1.0 - layer1_values
+
+    return frames, layer1_values, layer2_values
+
+
+def compute_chain_keys(layer_count, total_frames, cycle_length):
+    """
+    Compute crossfade keys for a chain of layers in one vectorized pass.
+
+    Every cycle_length frames the next layer in the chain is fully visible;
+    in between, the current layer fades out while the next one fades in.
+
+    Returns:
+        tuple: (frames, values) with values shaped (layer_count, len(frames))
+    """
+    frames = np.arange(0, total_frames + 1, cycle_length)
+    slots = np.arange(len(frames)) % layer_count
+    values = (slots[None, :] == np.arange(layer_count)[:, None]).astype(np.float32)
+
+    return frames, values
@@ -0,0 +1,129 @@
+"""
+Fade profiles - Precomputed easing curves for dissolve fades
+
+A profile describes how a value travels from one key to the next over a
+segment of a given length: the frame offsets of the keys to write inside the
+segment, the fraction of the fade reached at each of them, and the
+interpolation/easing enums of those keys.
+
+Profiles that Blender can express with a single key per segment (linear,
+cut, ease, smoothstep) cost no more keys than a linear fade. Sampled profiles
+(stepped on twos, custom LUT) add keys inside the segment. Samples are
+computed once per (profile, segment length) with NumPy and cached.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+FadeProfile = namedtuple("FadeProfile", ["offsets", "weights", "interpolation", "easing"])
+
+# Profiles written as one key per segment: (interpolation, easing)
+_SINGLE_KEY_PROFILES = {
+    'LINEAR': ('LINEAR', 'AUTO'),
+    'CONSTANT': ('CONSTANT', 'AUTO'),
+    'EASE': ('SINE', 'EASE_IN_OUT'),
+    'SMOOTHSTEP': ('BEZIER', 'AUTO'),
+}
+
+DEFAULT_LUT = (0.0, 1.0)
+
+
+def parse_lut(text):
+    """Parse a comma-separated list of fade values, clamped to 0-1"""
+    values = []
+    for part in text.split(","):
+        try:
+            values.append(min(1.0, max(0.0, float(part))))
+        except ValueError:
+            continue
+
+    if len(values) < 2:
+        return DEFAULT_LUT
+
+    return tuple(values)
+
+
+@lru_cache(maxsize=128)
+def get_fade_profile(name, length, lut=DEFAULT_LUT):
+    """
+    Get the cached samples of a fade profile for a segment length.
+
+    Args:
+        name: Profile identifier (fade_curve items of the dissolve properties)
+        length: Segment length in frames
+        lut: Fade values for the CUSTOM profile, spread evenly over the segment
+
+    Returns:
+        FadeProfile: offsets and weights arrays plus interpolation and easing names
+    """
+    if name in _SINGLE_KEY_PROFILES:
+        interpolation, easing = _SINGLE_KEY_PROFILES[name]
+        offsets = np.zeros(1, dtype=np.float32)
+        weights = np.zeros(1, dtype=np.float32)
+
+    elif name == 'STEPPED_TWOS':
+        interpolation, easing = 'CONSTANT', 'AUTO'
+        offsets = np.arange(0, length, 2, dtype=np.float32)
+        weights = offsets / length
+
+    elif name == 'CUSTOM':
+        interpolation, easing = 'LINEAR', 'AUTO'
+        samples = min(len(lut), max(1, int(length)))
+        offsets = np.unique(np.floor(np.linspace(0, length, samples, endpoint=False))).astype(np.float32)
+        weights = np.interp(offsets / length, np.linspace(0.0, 1.0, len(lut)), lut).astype(np.float32)
+
+    else:
+        raise ValueError(f"Unknown fade profile '{name}'")
+
+    offsets.flags.writeable = False
+    weights.flags.writeable = False
+
+    return FadeProfile(offsets, weights, interpolation, easing)
+
+
+def expand_fade_keys(frames, values, profile, lut=DEFAULT_LUT):
+    """
+    Expand fade knots into the keys of a profile, for several curves at once.
+
+    Args:
+        frames: Knot times shared by all curves, shape (K,)
+        values: Knot values, shape (curves, K)
+        profile: Profile identifier (fade_curve items of the dissolve properties)
+        lut: Fade values for the CUSTOM profile
+
+    Returns:
+        tuple: (frames, values, interpolation, easing) ready for write_keyframes
+    """
+    frames = np.asarray(frames, dtype=np.float32)
+    values = np.atleast_2d(np.asarray(values, dtype=np.float32))
+
+    if len(frames) < 2:
+        interpolation, easing = get_fade_profile(profile, 1, lut)[2:]
+        return frames, values, interpolation, easing
+
+    segment_lengths = np.diff(frames)
+    out_frames = []
+    out_values = []
+
+    # Segments of equal length share the same cached samples
+    for length in np.unique(segment_lengths):
+        fade = get_fade_profile(profile, float(length), lut)
+        starts = np.nonzero(segment_lengths == length)[0]
+
+        out_frames.append((frames[starts][:, None] + fade.offsets[None, :]).ravel())
+
+        start_values = values[:, starts]
+        deltas = values[:, starts + 1] - start_values
+        segment_values = start_values[:, :, None] + deltas[:, :, None] * fade.weights[None, None, :]
+        out_values.append(segment_values.reshape(len(values), -1))
+
+    out_frames.append(frames[-1:])
+    out_values.append(values[:, -1:])
+
+    all_frames = np.concatenate(out_frames)
+    all_values = np.concatenate(out_values, axis=1)
+    order = np.argsort(all_frames, kind='stable')
+
+    return all_frames[order], all_values[:, order], fade.interpolation, fade.easing
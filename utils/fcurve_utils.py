@@ -0,0 +1,252 @@
+"""
+F-curve utilities - Bulk keyframe writing
+
+Inserting keys one by one with keyframe_points.insert() does a sorted insert
+and handle recalculation per key. These helpers allocate all keyframe points
+at once and fill them with foreach_set, then update the curve a single time.
+Keys are moved the same way: one foreach_get/foreach_set per vector.
+"""
+
+import bpy
+import numpy as np
+
+# RNA enum values, as used by foreach_set (Blender's eBezTriple_Interpolation
+# order: the easing interpolations are sorted by name, not by strength)
+INTERPOLATION_VALUES = {
+    'CONSTANT': 0,
+    'LINEAR': 1,
+    'BEZIER': 2,
+    'BACK': 3,
+    'BOUNCE': 4,
+    'CIRC': 5,
+    'CUBIC': 6,
+    'ELASTIC': 7,
+    'EXPO': 8,
+    'QUAD': 9,
+    'QUART': 10,
+    'QUINT': 11,
+    'SINE': 12,
+}
+
+EASING_VALUES = {
+    'AUTO': 0,
+    'EASE_IN': 1,
+    'EASE_OUT': 2,
+    'EASE_IN_OUT': 3,
+}
+
+HANDLE_TYPE_FREE = 0
+
+
+def _enum_array(value, lookup, count):
+    """Expand an enum name (or array of enum values) to an int array"""
+    if isinstance(value, str):
+        return np.full(count, lookup[value], dtype=np.int32)
+    return np.asarray(value, dtype=np.int32)
+
+
+def write_keyframes(fcurve, frames, values, interpolation='LINEAR', easing='AUTO'):
+    """
+    Replace the keyframes of an F-curve in bulk.
+
+    Handles are written flat, a third of the way to the neighbouring keys,
+    so BEZIER keys ease in and out of every key.
+
+    Args:
+        fcurve: F-curve to fill
+        frames: Sorted key times
+        values: Key values, same length as frames
+        interpolation: Interpolation name, or array of enum values per key
+        easing: Easing name, or array of enum values per key
+
+    Returns:
+        int: Number of keyframes written
+    """
+    frames = np.asarray(frames, dtype=np.float32)
+    values = np.asarray(values, dtype=np.float32)
+    count = len(frames)
+
+    points = fcurve.keyframe_points
+    points.clear()
+
+    if count == 0:
+        return 0
+
+    points.add(count)
+
+    # Distance to the neighbouring keys, mirrored at both ends
+    if count > 1:
+        gaps = np.diff(frames)
+        left_gaps = np.concatenate((gaps[:1], gaps))
+        right_gaps = np.concatenate((gaps, gaps[-1:]))
+    else:
+        left_gaps = right_gaps = np.ones(1, dtype=np.float32)
+
+    points.foreach_set("co", np.column_stack((frames, values)).ravel())
+    points.foreach_set("handle_left", np.column_stack((frames - left_gaps / 3.0, values)).ravel())
+    points.foreach_set("handle_right", np.column_stack((frames + right_gaps / 3.0, values)).ravel())
+
+    handle_types = np.full(count, HANDLE_TYPE_FREE, dtype=np.int32)
+    points.foreach_set("handle_left_type", handle_types)
+    points.foreach_set("handle_right_type", handle_types)
+
+    points.foreach_set("interpolation", _enum_array(interpolation, INTERPOLATION_VALUES, count))
+    points.foreach_set("easing", _enum_array(easing, EASING_VALUES, count))
+
+    fcurve.update()
+
+    return count
+
+
+def shift_keyframes(fcurve, frame, offset):
+    """
+    Move the keys of an F-curve from a frame onward, handles included.
+
+    Args:
+        fcurve: F-curve
+        frame: First frame to move (keys on it move too)
+        offset: Frames to move by (negative moves left)
+
+    Returns:
+        int: Number of keys moved
+    """
+    points = fcurve.keyframe_points
+    count = len(points)
+    if not count or not offset:
+        return 0
+
+    co = np.empty(count * 2, dtype=np.float32)
+    points.foreach_get("co", co)
+
+    mask = co[0::2] >= frame - 0.01
+    moved = int(mask.sum())
+    if not moved:
+        return 0
+
+    for attr in ("co", "handle_left", "handle_right"):
+        if attr == "co":
+            data = co
+        else:
+            data = np.empty(count * 2, dtype=np.float32)
+            points.foreach_get(attr, data)
+
+        times = data[0::2]
+        times[mask] += offset
+        points.foreach_set(attr, data)
+
+    fcurve.update()
+
+    return moved
+
+
+def get_cycles_modifier(fcurve):
+    """Get the Cycles modifier of an F-curve, if any"""
+    for modifier in fcurve.modifiers:
+        if modifier.type == 'CYCLES':
+            return modifier
+    return None
+
+
+def add_cycles_modifier(fcurve, frame_start=None, frame_end=None):
+    """
+    Repeat the keys of an F-curve with a Cycles modifier.
+
+    Args:
+        fcurve: F-curve holding one cycle of keys
+        frame_start: Optional start of the range the cycles cover
+        frame_end: Optional end of the range the cycles cover
+
+    Returns:
+        FModifier: The Cycles modifier
+    """
+    modifier = get_cycles_modifier(fcurve) or fcurve.modifiers.new('CYCLES')
+
+    if frame_start is not None and frame_end is not None:
+        modifier.use_restricted_range = True
+        modifier.frame_start = frame_start
+        modifier.frame_end = frame_end
+
+    return modifier
+
+
+def bake_cycles_modifier(fcurve, frame_end):
+    """
+    Turn a Cycles modifier into discrete keys and remove it.
+
+    The cycle is the span between the first and last key. Repeats are laid
+    out back to back, dropping the first key of each repeat since it lands
+    on the last key of the previous one.
+
+    Args:
+        fcurve: F-curve with a Cycles modifier
+        frame_end: Last frame to bake when the modifier range isn't restricted
+
+    Returns:
+        int: Number of keyframes after baking
+    """
+    modifier = get_cycles_modifier(fcurve)
+    points = fcurve.keyframe_points
+    count = len(points)
+
+    if modifier is None:
+        return count
+
+    if modifier.use_restricted_range:
+        frame_end = modifier.frame_end
+
+    fcurve.modifiers.remove(modifier)
+
+    if count < 2:
+        return count
+
+    co = np.empty(count * 2, dtype=np.float32)
+    interpolation = np.empty(count, dtype=np.int32)
+    easing = np.empty(count, dtype=np.int32)
+    points.foreach_get("co", co)
+    points.foreach_get("interpolation", interpolation)
+    points.foreach_get("easing", easing)
+    co = co.reshape(-1, 2)
+
+    first, last = co[0, 0], co[-1, 0]
+    period = last - first
+    if period <= 0:
+        return count
+
+    repeats = max(0, int(np.ceil((frame_end - last) / period)))
+    offsets = (np.arange(1, repeats + 1, dtype=np.float32) * period)[:, None]
+
+    frames = np.concatenate((co[:, 0], (co[1:, 0] + offsets).ravel()))
+    values = np.concatenate((co[:, 1], np.tile(co[1:, 1], repeats)))
+    interpolation = np.concatenate((interpolation, np.tile(interpolation[1:], repeats)))
+    easing = np.concatenate((easing, np.tile(easing[1:], repeats)))
+
+    keep = frames <= frame_end
+    keep[:count] = True
+
+    return write_keyframes(fcurve, frames[keep], values[keep], interpolation[keep], easing[keep])
+
+
+def ensure_action(id_data, name):
+    """Get the action of an ID, creating animation data and action if needed"""
+    if not id_data.animation_data:
+        id_data.animation_data_create()
+    if not id_data.animation_data.action:
+        id_data.animation_data.action = bpy.data.actions.new(name=name)
+    return id_data.animation_data.action
+
+
+def remove_fcurves(action, data_paths):
+    """
+    Remove every F-curve whose data path is in data_paths, in one pass.
+
+    Args:
+        action: Action to clean up
+        data_paths: Set of data paths to remove
+
+    Returns:
+        int: Number of F-curves removed
+    """
+    stale = [fcurve for fcurve in action.fcurves if fcurve.data_path in data_paths]
+    for fcurve in stale:
+        action.fcurves.remove(fcurve)
+    return len(stale)
@@ -0,0 +1,74 @@
+"""
+Frame history - Small ring buffer of visited frames
+
+Navigation operators (flip/flop, jump to reference...) don't push undo steps,
+so they record the frames they visit here instead. The history lives in the
+add-on only and is not saved with the file.
+"""
+
+
+class FrameHistory:
+    """Fixed-size ring buffer of frames with back/forward stepping"""
+
+    def __init__(self, size=32):
+        self._buffer = [0] * size
+        self._size = size
+        self._start = 0
+        self._length = 0
+        self._cursor = -1
+
+    def _slot(self, index):
+        return (self._start + index) % self._size
+
+    def push(self, frame):
+        """Record a visited frame, dropping any forward history"""
+        if self._length and self._buffer[self._slot(self._cursor)] == frame:
+            return
+
+        self._length = self._cursor + 1
+
+        # Buffer full: overwrite the oldest entry
+        if self._length == self._size:
+            self._start = self._slot(1)
+            self._length -= 1
+
+        self._buffer[self._slot(self._length)] = frame
+        self._length += 1
+        self._cursor = self._length - 1
+
+    def back(self):
+        """Step back, returning the previous frame or None"""
+        if self._cursor <= 0:
+            return None
+        self._cursor -= 1
+        return self._buffer[self._slot(self._cursor)]
+
+    def forward(self):
+        """Step forward, returning the next frame or None"""
+        if self._cursor >= self._length - 1:
+            return None
+        self._cursor += 1
+        return self._buffer[self._slot(self._cursor)]
+
+    @property
+    def can_go_back(self):
+        return self._cursor > 0
+
+    @property
+    def can_go_forward(self):
+        return self._cursor < self._length - 1
+
+    def clear(self):
+        self._start = 0
+        self._length = 0
+        self._cursor = -1
+
+
+# Shared history for all navigation operators
+frame_history = FrameHistory()
+
+
+def record_frame_jump(from_frame, to_frame):
+    """Record a jump between two frames"""
+    frame_history.push(from_frame)
+    frame_history.push(to_frame)
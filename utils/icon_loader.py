@@ -1,128 +1,208 @@
 """
 Icon loader for GP Helper addon
 Handles loading and registration of custom PNG icons
+
+Icons are loaded lazily, on the first get_icon() call, and kept across file
+loads. The icon files are located once (the add-on ships both an "icons" and
+an "Icons" folder). On file load, their modification times are checked and
+the collection is only rebuilt if an icon's content actually changed.
 """
 
+import hashlib
+import os
+
 import bpy
 import bpy.utils.previews
-import os
 from bpy.app.handlers import persistent
 
+from .logger import get_logger
+
+log = get_logger(__name__)
+
 # Global variable to store icon previews
 preview_collections = {}
 
-def load_icons():
-    """Load all custom icons from the icons folder"""
-    global preview_collections
-    
-    # CRITICAL: Remove old collection if it exists
+# Bumped every time the icon collection is (re)built or removed
+_icon_generation = 0
+
+# Icon mapping: filename (without .png) -> icon identifier
+ICON_FILES = {
+    "GP_move_back": "gph_move_backward",
+    "GP_move_Front": "gph_move_forward",
+    "GP_light_table": "gph_light_table",
+    "GP_light_table_A": "gph_light_table_a",
+    "GP_flip_flop": "gph_flip_flop",
+    "GP_picker": "gph_picker",
+    "GP_space": "gph_space",
+}
+
+# Icon folders, in lookup order
+ICON_DIRS = ("icons", "Icons")
+
+# Icon identifier -> absolute file path, resolved once
+_icon_paths = None
+
+# (mtimes, content hash) of the loaded icon files
+_loaded_signature = None
+
+
+def get_icon_generation():
+    """Get the icon collection generation, UI code can cache icon IDs per generation"""
+    return _icon_generation
+
+
+def _resolve_icon_paths(rescan=False):
+    """Find the icon files, scanning each icon folder once"""
+    global _icon_paths
+
+    if _icon_paths is not None and not rescan:
+        return _icon_paths
+
+    addon_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    wanted = {f"{filename}.png": icon_id for filename, icon_id in ICON_FILES.items()}
+
+    _icon_paths = {}
+    for dirname in ICON_DIRS:
+        icons_dir = os.path.join(addon_dir, dirname)
+        try:
+            entries = list(os.scandir(icons_dir))
+        except OSError:
+            continue
+
+        for entry in entries:
+            icon_id = wanted.get(entry.name)
+            if icon_id and icon_id not in _icon_paths:
+                _icon_paths[icon_id] = entry.path
+
+    missing = sorted(set(ICON_FILES.values()) - set(_icon_paths))
+    if missing:
+        log.debug("Icon files not found for: %s", ", ".join(missing))
+
+    return _icon_paths
+
+
+def _get_mtimes(paths):
+    mtimes = []
+    for path in paths:
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def _get_content_hash(paths):
+    digest = hashlib.sha1()
+    for path in paths:
+        try:
+            with open(path, "rb") as icon_file:
+                digest.update(icon_file.read())
+        except OSError:
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def load_icons(rescan=False):
+    """
+    Load all custom icons from the icons folders
+
+    Args:
+        rescan: Look for the icon files again instead of reusing their paths
+    """
+    global preview_collections, _icon_generation, _loaded_signature
+
+    # Remove old collection if it exists
     if "main" in preview_collections:
         try:
             bpy.utils.previews.remove(preview_collections["main"])
-        except:
+        except Exception:
             pass
         preview_collections.clear()
-    
+
     # Create a new preview collection
     pcoll = bpy.utils.previews.new()
-    
-    # Get the icons directory path
-    addon_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
-    icons_dir = os.path.join(addon_dir, "icons")
-    
-    print(f"========================================")
-    print(f"GP Helper: LOADING ICONS")
-    print(f"GP Helper: Icons directory: {icons_dir}")
-    print(f"GP Helper: Directory exists: {os.path.exists(icons_dir)}")
-    
-    if os.path.exists(icons_dir):
-        print(f"GP Helper: Files in directory: {os.listdir(icons_dir)}")
-    
-    # Icon mapping: filename (without .png) -> icon identifier
-    icon_files = {
-        "GP_move_back": "gph_move_backward",
-        "GP_move_Front": "gph_move_forward",
-        "GP_light_table": "gph_light_table",
-        "GP_light_table_A": "gph_light_table_a",
-        "GP_flip_flop": "gph_flip_flop",
-        "GP_picker": "gph_picker",
-        "GP_space": "gph_space",
-    }
-    
-    # Load each icon
-    loaded_count = 0
-    for filename, icon_id in icon_files.items():
-        icon_path = os.path.join(icons_dir, f"{filename}.png")
-        
-        print(f"GP Helper: Attempting to load: {icon_path}")
-        print(f"GP Helper: File exists: {os.path.exists(icon_path)}")
-        
-        if os.path.exists(icon_path):
-            try:
-                # Use absolute path - critical for icon loading
-                abs_path = os.path.abspath(icon_path)
-                print(f"GP Helper: Absolute path: {abs_path}")
-                
-                pcoll.load(icon_id, abs_path, 'IMAGE')
-                print(f"GP Helper: ✓✓✓ SUCCESS! Loaded '{filename}.png' as '{icon_id}'")
-                print(f"GP Helper: Icon ID in collection: {icon_id in pcoll}")
-                if icon_id in pcoll:
-                    print(f"GP Helper: Icon object: {pcoll[icon_id]}")
-                    print(f"GP Helper: Icon ID number: {pcoll[icon_id].icon_id}")
-                loaded_count += 1
-            except Exception as e:
-                print(f"GP Helper: ✗✗✗ FAILED to load '{filename}.png': {e}")
-                import traceback
-                traceback.print_exc()
-        else:
-            print(f"GP Helper: ✗ Icon file not found: {filename}.png")
-    
-    print(f"GP Helper: Total icons loaded: {loaded_count}")
-    print(f"GP Helper: Icons in collection: {list(pcoll.keys())}")
-    print(f"========================================")
-    
+
+    icon_paths = _resolve_icon_paths(rescan)
+    for icon_id, path in icon_paths.items():
+        try:
+            pcoll.load(icon_id, path, 'IMAGE')
+        except Exception:
+            log.debug("Failed to load icon '%s' from %s", icon_id, path, exc_info=True)
+
+    log.debug("Loaded %d icons", len(pcoll))
+
+    paths = sorted(icon_paths.values())
+    _loaded_signature = (_get_mtimes(paths), _get_content_hash(paths))
+
     # Store the preview collection
     preview_collections["main"] = pcoll
+    _icon_generation += 1
+
+
+def reload_icons_if_changed():
+    """Reload the icons if their files changed since they were loaded"""
+    global _loaded_signature
+
+    if "main" not in preview_collections or _loaded_signature is None:
+        return False
+
+    paths = sorted(_resolve_icon_paths().values())
+    mtimes, content_hash = _loaded_signature
+
+    if _get_mtimes(paths) == mtimes:
+        return False
+
+    # Touched but identical files don't need a reload
+    new_hash = _get_content_hash(paths)
+    if new_hash == content_hash:
+        _loaded_signature = (_get_mtimes(paths), content_hash)
+        return False
+
+    log.debug("Icon files changed, reloading")
+    load_icons()
+    return True
 
 
 def get_icon(icon_name):
     """
     Get icon ID for use in UI
-    
+
     Args:
         icon_name: Name of the icon (e.g., "gph_move_backward")
-    
+
     Returns:
         Icon ID number for use in layout.operator(..., icon_value=...)
         Returns 0 if icon not found (will use default icon)
     """
-    global preview_collections
-    
     pcoll = preview_collections.get("main")
-    if not pcoll:
-        return 0
-    
+    if pcoll is None:
+        # First request: load the icons now
+        load_icons()
+        pcoll = preview_collections["main"]
+
     icon = pcoll.get(icon_name)
     if icon:
         return icon.icon_id
-    
+
     return 0
 
 
 def unload_icons():
     """Unload all custom icons"""
-    global preview_collections
+    global preview_collections, _icon_generation, _loaded_signature
 
     for pcoll in preview_collections.values():
         try:
             bpy.utils.previews.remove(pcoll)
-        except:
+        except Exception:
             pass
 
     preview_collections.clear()
+    _loaded_signature = None
+    _icon_generation += 1
 
 
 @persistent
 def load_icons_on_file_load(dummy):
-    """Handler to reload icons when opening a file"""
-    load_icons()
\ No newline at end of file
+    """Handler to reload icons when opening a file, if their files changed"""
+    reload_icons_if_changed()
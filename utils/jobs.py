@@ -0,0 +1,227 @@
+"""
+Jobs - Long operations split into time-budgeted chunks run by bpy.app.timers
+
+The work of a job is a generator yielding (done, total) after each unit of
+work (a layer spaced, a marker applied...) and returning its result:
+
+    def space_keys_steps(layers, spacing):
+        for index, layer in enumerate(layers):
+            ...
+            yield index + 1, len(layers)
+        return layers_spaced
+
+start_job() runs it from a timer, CHUNK_BUDGET seconds of work per tick,
+so the UI keeps redrawing in between, and reports the progress through the
+window manager's progress indicator. run_steps() runs the same generator
+to completion in one go, for scripts and background Blender.
+
+Cancelling a job stops it between two units of work; the changes already
+made are rolled back by rollback_job(), which undoes to the last undo step
+without leaving a redo step behind.
+Operators drive all of this through the GPH_JobOperator mixin
+(operators/GPH_jobs.py), which also cancels the job on Esc.
+"""
+
+import time
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .logger import get_logger
+
+log = get_logger(__name__)
+
+# Seconds of work per timer tick
+CHUNK_BUDGET = 0.05
+
+# Seconds between two timer ticks, the UI redraws in between
+TICK_INTERVAL = 0.01
+
+# Running jobs
+_jobs = []
+
+# Rollbacks waiting for their timer
+_rollbacks = []
+
+
+def run_steps(steps):
+    """Run a job generator to completion and get its result"""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+class Job:
+    """A job generator, with its progress and state"""
+
+    def __init__(self, name, steps, budget=CHUNK_BUDGET):
+        self.name = name
+        self.steps = steps
+        self.budget = budget
+        self.done = 0
+        self.total = 0
+        self.state = 'RUNNING'  # 'FINISHED', 'CANCELLED' or 'FAILED'
+        self.result = None
+        self.error = None
+        self._window_manager = None
+        self._timer = None
+
+    @property
+    def running(self):
+        return self.state == 'RUNNING'
+
+    @property
+    def progress(self):
+        """Fraction of the work done, from 0 to 1"""
+        return self.done / self.total if self.total else 0.0
+
+    def run_chunk(self):
+        """Run units of work until the time budget is spent or the job ends"""
+        deadline = time.perf_counter() + self.budget
+
+        try:
+            while self.running:
+                self.done, self.total = next(self.steps)
+                if time.perf_counter() >= deadline:
+                    break
+
+        except StopIteration as stop:
+            self.result = stop.value
+            self.state = 'FINISHED'
+
+        except Exception as error:
+            log.error("Job '%s' failed: %s", self.name, error, exc_info=True)
+            self.error = error
+            self.state = 'FAILED'
+
+        return self.running
+
+
+def _end_progress(job):
+    if job._window_manager is not None:
+        job._window_manager.progress_end()
+        job._window_manager = None
+
+    if job in _jobs:
+        _jobs.remove(job)
+
+
+def _unregister_timer(function):
+    if function is not None and bpy.app.timers.is_registered(function):
+        bpy.app.timers.unregister(function)
+
+
+class _JobTimer:
+    """Timer callback running one chunk of a job per tick"""
+
+    def __init__(self, job):
+        self.job = job
+
+    def __call__(self):
+        job = self.job
+        if job.running:
+            job.run_chunk()
+
+        if not job.running:
+            _end_progress(job)
+            log.debug("Job '%s' %s", job.name, job.state.lower())
+            return None
+
+        if job._window_manager is not None:
+            job._window_manager.progress_update(int(job.progress * 100))
+        return TICK_INTERVAL
+
+
+def start_job(job, window_manager=None):
+    """
+    Run a job in the background, one chunk per timer tick.
+
+    Args:
+        job: Job to run
+        window_manager: Window manager showing the progress, or None
+
+    Returns:
+        Job: The same job
+    """
+    if window_manager is not None:
+        window_manager.progress_begin(0, 100)
+        job._window_manager = window_manager
+
+    _jobs.append(job)
+    job._timer = _JobTimer(job)
+    bpy.app.timers.register(job._timer, first_interval=TICK_INTERVAL)
+
+    return job
+
+
+def cancel_job(job):
+    """Stop a job before its next unit of work"""
+    if not job.running:
+        return
+
+    job.state = 'CANCELLED'
+    job.steps.close()
+    _end_progress(job)
+    _unregister_timer(job._timer)
+
+
+def get_running_jobs():
+    """Get the jobs still running"""
+    return list(_jobs)
+
+
+def cancel_all_jobs():
+    """Stop every running job"""
+    for job in list(_jobs):
+        cancel_job(job)
+
+
+class _Rollback:
+    """Timer callback undoing the changes of a cancelled job"""
+
+    def __init__(self, window, name):
+        self.window = window
+        self.name = name
+
+    def __call__(self):
+        if self in _rollbacks:
+            _rollbacks.remove(self)
+
+        with bpy.context.temp_override(window=self.window):
+            # Store the partial changes as a step and go back before it
+            bpy.ops.ed.undo_push(message=f"{self.name} (cancelled)")
+            bpy.ops.ed.undo()
+            # A new step drops the one above from the stack, so redo can't
+            # apply the partial changes again
+            bpy.ops.ed.undo_push(message=f"Cancel {self.name}")
+        return None
+
+
+def rollback_job(window, name):
+    """
+    Undo the changes of a cancelled job, back to the last undo step.
+
+    The changes are pushed as a step and undone right away, from a timer so
+    the operator that ran the job has ended first. Another step is pushed
+    after the undo to clear the redo step of the partial changes.
+
+    Args:
+        window: Window to run the undo in
+        name: Job name, for the undo history
+    """
+    rollback = _Rollback(window, name)
+    _rollbacks.append(rollback)
+    bpy.app.timers.register(rollback, first_interval=0.0)
+
+
+@persistent
+def cancel_jobs_on_file_load(dummy):
+    """Handler stopping the jobs and rollbacks of the previous file before a new one loads"""
+    cancel_all_jobs()
+
+    # Their window and undo stack go away with the file
+    for rollback in _rollbacks:
+        _unregister_timer(rollback)
+    _rollbacks.clear()
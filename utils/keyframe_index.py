@@ -0,0 +1,126 @@
+"""
+Keyframe index - Cached, sorted GP drawing keyframes for fast navigation
+
+Building the sorted frame list costs one pass over the frames in scope.
+After that, previous/next lookups are a bisect on the cached list. The cache
+is dropped whenever a Grease Pencil data-block is updated (frames moved,
+added or removed, layers hidden...), which does not happen on plain frame
+changes, so flipping through the timeline reuses the same index.
+
+Scopes:
+- ACTIVE_LAYER: drawing frames of the active layer of the active object
+- VISIBLE_LAYERS: drawing frames of every visible layer of the active object
+- ALL_OBJECTS: drawing frames of every visible layer of every GP object in the scene
+"""
+
+from bisect import bisect_left, bisect_right
+
+from bpy.app.handlers import persistent
+
+# (scope, key) -> sorted list of unique frame numbers
+_index_cache = {}
+
+# Grease Pencil ID types across Blender versions (GPv3 was 'GREASEPENCIL_V3' in 4.x)
+GP_ID_TYPES = {'GREASEPENCIL', 'GREASEPENCIL_V3'}
+
+
+def _collect_layer_frames(layer, frames):
+    """Add every drawing frame number of a layer to a set"""
+    for gp_frame in layer.frames:
+        frames.add(gp_frame.frame_number)
+
+
+def _build_index(scene, obj, scope):
+    """Build the sorted frame list for a scope"""
+    frames = set()
+
+    if scope == 'ALL_OBJECTS':
+        for scene_obj in scene.objects:
+            if scene_obj.type != 'GREASEPENCIL' or not scene_obj.data:
+                continue
+            for layer in scene_obj.data.layers:
+                if not layer.hide:
+                    _collect_layer_frames(layer, frames)
+
+    elif obj and obj.type == 'GREASEPENCIL' and obj.data:
+        if scope == 'ACTIVE_LAYER':
+            layer = obj.data.layers.active
+            if layer:
+                _collect_layer_frames(layer, frames)
+        else:
+            for layer in obj.data.layers:
+                if not layer.hide:
+                    _collect_layer_frames(layer, frames)
+
+    return sorted(frames)
+
+
+def get_sorted_keyframes(context, scope='ACTIVE_LAYER'):
+    """
+    Get the cached, sorted drawing keyframes for a scope.
+
+    Args:
+        context: Blender context (uses scene and active object)
+        scope: 'ACTIVE_LAYER', 'VISIBLE_LAYERS' or 'ALL_OBJECTS'
+
+    Returns:
+        list: Sorted list of unique frame numbers
+    """
+    scene = context.scene
+    obj = context.active_object
+
+    if scope == 'ALL_OBJECTS':
+        key = (scope, scene.as_pointer())
+    elif scope == 'ACTIVE_LAYER':
+        layer = obj.data.layers.active if obj and obj.type == 'GREASEPENCIL' else None
+        key = (scope, obj.as_pointer() if obj else 0, layer.name if layer else "")
+    else:
+        key = (scope, obj.as_pointer() if obj else 0)
+
+    keyframes = _index_cache.get(key)
+    if keyframes is None:
+        keyframes = _build_index(scene, obj, scope)
+        _index_cache[key] = keyframes
+
+    return keyframes
+
+
+def find_previous_keyframe(context, frame, scope='ACTIVE_LAYER'):
+    """Find the closest keyframe before frame, or None"""
+    keyframes = get_sorted_keyframes(context, scope)
+    index = bisect_left(keyframes, frame)
+    if index:
+        return keyframes[index - 1]
+    return None
+
+
+def find_next_keyframe(context, frame, scope='ACTIVE_LAYER'):
+    """Find the closest keyframe after frame, or None"""
+    keyframes = get_sorted_keyframes(context, scope)
+    index = bisect_right(keyframes, frame)
+    if index < len(keyframes):
+        return keyframes[index]
+    return None
+
+
+def invalidate_keyframe_index():
+    """Drop every cached index"""
+    _index_cache.clear()
+
+
+@persistent
+def invalidate_keyframe_index_on_update(scene, depsgraph):
+    """Handler to drop the index when Grease Pencil data changes"""
+    if not _index_cache:
+        return
+
+    for update in depsgraph.updates:
+        if update.id.id_type in GP_ID_TYPES:
+            _index_cache.clear()
+            return
+
+
+@persistent
+def invalidate_keyframe_index_on_reload(dummy):
+    """Handler to drop the index when opening a file or stepping undo/redo"""
+    _index_cache.clear()
@@ -0,0 +1,191 @@
+"""
+Layer duplicate - Data-level layer duplication
+
+bpy.ops.grease_pencil.layer_duplicate needs the layer to be active and deep
+copies every drawing of the layer. These helpers build the duplicate
+directly on the GP data instead, so they can:
+
+- copy only the keys inside a frame range
+- COPY drawings, INSTANCE them (a drawing shown on several keys of the source
+  is copied once and instanced on the other keys), or leave the keys EMPTY
+  (same timing, blank drawings: a cleanup pass over a rough)
+- duplicate several layers in one call
+
+Drawings are copied attribute by attribute with foreach_get/foreach_set.
+"""
+
+import numpy as np
+
+from .layer_index import invalidate_layer_index
+
+DRAWING_MODE_ITEMS = [
+    ('COPY', "Copy", "Copy every drawing"),
+    ('INSTANCE', "Instance", "Copy each drawing once and instance it where the source repeats it"),
+    ('EMPTY', "Empty", "Keep the key timing with blank drawings"),
+]
+
+# Layer properties carried over to the duplicate
+LAYER_SETTINGS = (
+    "opacity",
+    "blend_mode",
+    "use_lights",
+    "tint_color",
+    "tint_factor",
+    "radius_offset",
+    "use_masks",
+    "use_onion_skinning",
+    "use_viewlayer_masks",
+    "viewlayer_render",
+    "pass_index",
+    "channel_color",
+    "translation",
+    "rotation",
+    "scale",
+    "hide",
+    "lock",
+)
+
+# Attribute data type -> (foreach key, values per element, dtype)
+_ATTRIBUTE_ACCESS = {
+    'FLOAT': ("value", 1, np.float32),
+    'INT': ("value", 1, np.int32),
+    'INT8': ("value", 1, np.int32),
+    'BOOLEAN': ("value", 1, bool),
+    'FLOAT2': ("vector", 2, np.float32),
+    'FLOAT_VECTOR': ("vector", 3, np.float32),
+    'FLOAT_COLOR': ("color", 4, np.float32),
+    'BYTE_COLOR': ("color", 4, np.float32),
+    'QUATERNION': ("value", 4, np.float32),
+    'INT32_2D': ("value", 2, np.int32),
+}
+
+
+def copy_drawing(source, target):
+    """
+    Copy the strokes of a drawing into an empty drawing.
+
+    Returns:
+        int: Number of strokes copied
+    """
+    offsets = np.empty(len(source.curve_offsets), dtype=np.int32)
+    source.curve_offsets.foreach_get("value", offsets)
+    sizes = np.diff(offsets)
+    if len(sizes) == 0:
+        return 0
+
+    target.add_strokes(sizes.tolist())
+
+    for attribute in source.attributes:
+        access = _ATTRIBUTE_ACCESS.get(attribute.data_type)
+        if access is None or attribute.is_internal:
+            continue
+
+        key, width, dtype = access
+        values = np.empty(len(attribute.data) * width, dtype=dtype)
+        attribute.data.foreach_get(key, values)
+
+        target_attribute = target.attributes.get(attribute.name)
+        if target_attribute is None:
+            target_attribute = target.attributes.new(attribute.name, attribute.data_type, attribute.domain)
+        target_attribute.data.foreach_set(key, values)
+
+    return len(sizes)
+
+
+def _frames_in_range(layer, frame_range):
+    """Get (frame number, frame) pairs to duplicate, sorted by frame number"""
+    frames = sorted(((frame.frame_number, frame) for frame in layer.frames), key=lambda item: item[0])
+    if frame_range is None:
+        return frames
+
+    frame_start, frame_end = frame_range
+    in_range = [(number, frame) for number, frame in frames if frame_start <= number <= frame_end]
+
+    # Keep the drawing held over the start of the range
+    held = [(number, frame) for number, frame in frames if number < frame_start]
+    if held and (not in_range or in_range[0][0] != frame_start):
+        in_range.insert(0, (frame_start, held[-1][1]))
+
+    return in_range
+
+
+def _place_above(gp_data, layer, target):
+    """
+    Move a layer down its group until it sits right above the target.
+
+    The layer stack is walked once to count the nodes of the group between
+    the two (layers, or sub-groups counted once), then the layer moves down
+    that many steps.
+    """
+    layers = list(gp_data.layers)
+    pointers = [item.as_pointer() for item in layers]
+    start = pointers.index(target.as_pointer()) + 1
+    end = pointers.index(layer.as_pointer())
+
+    group = layer.parent_group
+    group_pointer = group.as_pointer() if group else None
+
+    nodes = set()
+    for item in layers[start:end]:
+        # Climb to the node sitting directly in the layer's group
+        node = item
+        while node.parent_group and node.parent_group.as_pointer() != group_pointer:
+            node = node.parent_group
+        nodes.add(node.as_pointer())
+
+    for _ in range(len(nodes)):
+        gp_data.layers.move(layer, 'DOWN')
+
+
+def duplicate_layer(gp_data, source, drawing_mode='INSTANCE', frame_range=None):
+    """
+    Duplicate a layer right above itself.
+
+    Args:
+        gp_data: Grease Pencil data block
+        source: Layer to duplicate
+        drawing_mode: 'COPY', 'INSTANCE' or 'EMPTY'
+        frame_range: Optional (start, end) tuple of the keys to duplicate
+
+    Returns:
+        GreasePencilLayer: The new layer
+    """
+    new_layer = gp_data.layers.new(source.name, set_active=False, layer_group=source.parent_group)
+    _place_above(gp_data, new_layer, source)
+
+    for setting in LAYER_SETTINGS:
+        if hasattr(source, setting):
+            setattr(new_layer, setting, getattr(source, setting))
+
+    # Source drawing pointer -> first frame number it was copied to
+    copied = {}
+
+    for frame_number, frame in _frames_in_range(source, frame_range):
+        drawing_key = frame.drawing.as_pointer() if frame.drawing else None
+
+        if drawing_mode == 'INSTANCE' and drawing_key in copied:
+            new_frame = new_layer.frames.copy(copied[drawing_key], frame_number, instance_drawing=True)
+        else:
+            new_frame = new_layer.frames.new(frame_number)
+            if drawing_mode != 'EMPTY' and drawing_key is not None:
+                copy_drawing(frame.drawing, new_frame.drawing)
+                copied.setdefault(drawing_key, frame_number)
+
+        new_frame.keyframe_type = frame.keyframe_type
+
+    return new_layer
+
+
+def duplicate_layers(gp_data, layers, drawing_mode='INSTANCE', frame_range=None):
+    """
+    Duplicate several layers, each one right above its source.
+
+    Returns:
+        list: The new layers, in the order of the sources
+    """
+    sources = list(layers)
+    new_layers = [duplicate_layer(gp_data, source, drawing_mode, frame_range) for source in sources]
+
+    invalidate_layer_index(gp_data)
+
+    return new_layers
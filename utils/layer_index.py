@@ -0,0 +1,129 @@
+"""
+Layer index - Name to layer lookup for GP data blocks
+
+Operators address layers by name. Rather than scanning gp_data.layers on
+every call, the position of each layer is stored in a dict per GP data block.
+A hit is checked against the layer at that position (layers[i].name == name),
+so renamed or reordered layers fall back to a single rebuild instead of
+returning the wrong layer.
+
+The index also records the GPv3 layer tree: the names of the layers under
+each layer group, nested groups included.
+
+Entries are dropped when their GP data block is updated and on file
+load/undo/redo.
+"""
+
+from collections import namedtuple
+
+from bpy.app.handlers import persistent
+
+from .keyframe_index import GP_ID_TYPES
+
+LayerIndex = namedtuple("LayerIndex", ["positions", "groups"])
+
+# GP data pointer -> LayerIndex
+_layer_index_cache = {}
+
+
+def _build_layer_index(gp_data):
+    """Index layer positions and group membership in one pass"""
+    positions = {}
+    groups = {}
+
+    for index, layer in enumerate(gp_data.layers):
+        positions[layer.name] = index
+
+        group = getattr(layer, "parent_group", None)
+        while group is not None:
+            groups.setdefault(group.name, set()).add(layer.name)
+            group = group.parent_group
+
+    return LayerIndex(positions, {name: frozenset(members) for name, members in groups.items()})
+
+
+def get_layer_index(gp_data):
+    """Get the cached layer index of a GP data block"""
+    pointer = gp_data.as_pointer()
+
+    layer_index = _layer_index_cache.get(pointer)
+    if layer_index is None:
+        layer_index = _build_layer_index(gp_data)
+        _layer_index_cache[pointer] = layer_index
+
+    return layer_index
+
+
+def _lookup(gp_data, layer_index, name):
+    index = layer_index.positions.get(name)
+    if index is None:
+        return None
+
+    layers = gp_data.layers
+    if index < len(layers) and layers[index].name == name:
+        return layers[index]
+
+    return None
+
+
+def find_layer(gp_data, name):
+    """
+    Find a layer by name.
+
+    Args:
+        gp_data: Grease Pencil data block
+        name: Layer name
+
+    Returns:
+        GreasePencilLayer or None
+    """
+    layer = _lookup(gp_data, get_layer_index(gp_data), name)
+    if layer is not None:
+        return layer
+
+    # Missing or stale entry: rebuild once
+    layer_index = _build_layer_index(gp_data)
+    _layer_index_cache[gp_data.as_pointer()] = layer_index
+
+    return _lookup(gp_data, layer_index, name)
+
+
+def find_layers(gp_data, names):
+    """Find several layers by name, skipping names that don't exist"""
+    layers = (find_layer(gp_data, name) for name in names)
+    return [layer for layer in layers if layer is not None]
+
+
+def get_group_layer_names(gp_data, group_name):
+    """Get the names of every layer under a layer group (nested groups included)"""
+    return get_layer_index(gp_data).groups.get(group_name, frozenset())
+
+
+def is_layer_in_group(gp_data, layer_name, group_name):
+    """Check if a layer is under a layer group"""
+    return layer_name in get_group_layer_names(gp_data, group_name)
+
+
+def invalidate_layer_index(gp_data=None):
+    """Drop the cached index of a GP data block, or of all of them"""
+    if gp_data is None:
+        _layer_index_cache.clear()
+    else:
+        _layer_index_cache.pop(gp_data.as_pointer(), None)
+
+
+@persistent
+def invalidate_layer_index_on_update(scene, depsgraph):
+    """Handler to drop the index of updated GP data blocks"""
+    if not _layer_index_cache:
+        return
+
+    for update in depsgraph.updates:
+        if update.id.id_type in GP_ID_TYPES:
+            _layer_index_cache.pop(update.id.original.as_pointer(), None)
+
+
+@persistent
+def invalidate_layer_index_on_reload(dummy):
+    """Handler to drop every index when opening a file or stepping undo/redo"""
+    _layer_index_cache.clear()
@@ -0,0 +1,68 @@
+"""
+Layer sets - Resolve the layers a batch layer operation acts on
+
+A layer set is described by a mode and one argument:
+- SINGLE: one layer, by name
+- SELECTED: the layers selected in the layer tree
+- PATTERN: layers whose name matches a wildcard pattern (fnmatch, case sensitive)
+- GROUP: every layer under a layer group, nested groups included
+
+Each mode resolves in at most one pass over the layers, in layer stack order.
+"""
+
+from fnmatch import fnmatchcase
+
+from .layer_index import find_layer, get_group_layer_names
+
+LAYER_SET_ITEMS = [
+    ('SINGLE', "Layer", "The given layer only"),
+    ('SELECTED', "Selected", "Layers selected in the layer tree"),
+    ('PATTERN', "Name Pattern", "Layers whose name matches a wildcard pattern (e.g. 'Char_*')"),
+    ('GROUP', "Layer Group", "Every layer under a layer group"),
+]
+
+
+def resolve_layer_set(gp_data, mode, layer_name="", pattern="", group_name=""):
+    """
+    Get the layers of a layer set.
+
+    Args:
+        gp_data: Grease Pencil data block
+        mode: Layer set mode from LAYER_SET_ITEMS
+        layer_name: Layer name for SINGLE
+        pattern: Wildcard pattern for PATTERN
+        group_name: Layer group name for GROUP
+
+    Returns:
+        list: Layers of the set, in layer stack order
+    """
+    if mode == 'SINGLE':
+        layer = find_layer(gp_data, layer_name)
+        return [layer] if layer is not None else []
+
+    if mode == 'SELECTED':
+        return [layer for layer in gp_data.layers if getattr(layer, "select", False)]
+
+    if mode == 'PATTERN':
+        if not pattern:
+            return []
+        return [layer for layer in gp_data.layers if fnmatchcase(layer.name, pattern)]
+
+    if mode == 'GROUP':
+        members = get_group_layer_names(gp_data, group_name)
+        if not members:
+            return []
+        return [layer for layer in gp_data.layers if layer.name in members]
+
+    raise ValueError(f"Unknown layer set mode '{mode}'")
+
+
+def describe_layer_set(mode, layer_name="", pattern="", group_name=""):
+    """Get a short description of a layer set for reports"""
+    if mode == 'SINGLE':
+        return f"layer '{layer_name}'"
+    if mode == 'SELECTED':
+        return "selected layers"
+    if mode == 'PATTERN':
+        return f"layers matching '{pattern}'"
+    return f"layers in group '{group_name}'"
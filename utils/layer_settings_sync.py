@@ -0,0 +1,207 @@
+"""
+Layer settings sync - Keep the keyframe mover layer list in step with the GP layers
+
+The keyframe mover keeps one entry per GP layer (name + enabled flag) in
+gph_keyframe_props.layer_settings, in the order of the layers panel (top
+layer first). Instead of clearing and rebuilding the collection, the entries
+are diffed against the layer stack and only the changed rows are touched, so
+the enabled flags survive added, removed, renamed and reordered layers.
+
+Renames are matched by position: when every row whose name changed held a
+removed name and now holds an added one (all other rows unchanged), each of
+those entries takes the name of the layer at its row.
+
+The list belongs to one GP data block, recorded by name and session UID:
+the UID survives renames, the name survives file reloads (which renumber
+UIDs). When the active object switches to another data block, the list is
+rebuilt instead of diffed, so flags never carry over to another object's
+layers.
+
+Every change bumps a generation counter that UI caches can key on, as do
+undo, redo and file loads, which can restore the collection behind the
+sync's back.
+"""
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .keyframe_index import GP_ID_TYPES
+
+# Bumped whenever layer_settings is changed by a sync
+_generation = 0
+
+# Layer names of the settings, rebuilt when the generation changes
+_setting_names = {"key": None, "names": frozenset()}
+
+
+def get_layer_settings_generation():
+    """Get the generation of the layer settings, bumped on every sync change"""
+    return _generation
+
+
+def get_layer_names(gp_data):
+    """Get the layer names in layers panel order (top layer first)"""
+    return [layer.name for layer in reversed(gp_data.layers)]
+
+
+def sync_layer_settings(settings, layer_names):
+    """
+    Update a layer settings collection to match a list of layer names.
+
+    Args:
+        settings: gph_keyframe_props.layer_settings collection
+        layer_names: Layer names in layers panel order
+
+    Returns:
+        bool: True if the collection was changed
+    """
+    global _generation
+
+    current = [setting.layer_name for setting in settings]
+    if current == layer_names:
+        return False
+
+    _generation += 1
+    wanted = set(layer_names)
+
+    # Same stack with only some rows renamed: keep their flags
+    removed = set(current) - wanted
+    added = wanted - set(current)
+    if removed and len(current) == len(layer_names) and all(
+        old == new or (old in removed and new in added) for old, new in zip(current, layer_names)
+    ):
+        for setting, name in zip(settings, layer_names):
+            if setting.layer_name != name:
+                setting.layer_name = name
+        return True
+
+    # Drop entries of removed layers
+    for index in reversed(range(len(current))):
+        if current[index] not in wanted:
+            settings.remove(index)
+
+    # Add entries for new layers (enabled by default)
+    present = {setting.layer_name for setting in settings}
+    for name in layer_names:
+        if name not in present:
+            setting = settings.add()
+            setting.layer_name = name
+            setting.is_enabled = True
+
+    # Reorder to match the layer stack, moving only misplaced rows
+    names = [setting.layer_name for setting in settings]
+    for target, name in enumerate(layer_names):
+        if names[target] != name:
+            index = names.index(name, target)
+            settings.move(index, target)
+            names.insert(target, names.pop(index))
+
+    return True
+
+
+def sync_object_layer_settings(props, gp_data):
+    """
+    Sync the keyframe mover layer settings with the layers of a GP data block.
+
+    Diffs against the current entries when they belong to the same data
+    block, otherwise rebuilds them with every layer enabled.
+
+    Args:
+        props: gph_keyframe_props of the scene
+        gp_data: Grease Pencil data block
+
+    Returns:
+        bool: True if the collection was changed
+    """
+    global _generation
+
+    settings = props.layer_settings
+    same_uid = props.layer_settings_owner_uid == gp_data.session_uid
+    same_name = props.layer_settings_owner == gp_data.name
+    if not (same_uid and same_name):
+        if not (same_uid or same_name) and len(settings):
+            settings.clear()
+            _generation += 1
+        props.layer_settings_owner = gp_data.name
+        props.layer_settings_owner_uid = gp_data.session_uid
+
+    return sync_layer_settings(settings, get_layer_names(gp_data))
+
+
+def sync_active_layer_settings(context):
+    """
+    Sync the keyframe mover layer settings with the active GP object.
+
+    Nothing is changed when the active object isn't a Grease Pencil object,
+    so selecting a camera or light keeps the current list.
+
+    Returns:
+        bool: True if the collection was changed
+    """
+    scene = context.scene
+    obj = context.view_layer.objects.active if context.view_layer else None
+    if not scene or not obj or obj.type != 'GREASEPENCIL' or not obj.data:
+        return False
+
+    return sync_object_layer_settings(scene.gph_keyframe_props, obj.data)
+
+
+def _get_setting_names(settings):
+    """Get the cached set of layer names in a layer settings collection"""
+    key = (settings.id_data.as_pointer(), _generation)
+    if _setting_names["key"] != key:
+        _setting_names["names"] = frozenset(setting.layer_name for setting in settings)
+        _setting_names["key"] = key
+    return _setting_names["names"]
+
+
+def _layers_changed(props, gp_data):
+    """
+    Cheap check for added or removed layers, without walking the layers.
+
+    A different count catches plain adds and removes. A layer removed and
+    another added in the same update leaves the count alone, but the new
+    layer becomes the active one, which the list doesn't know yet.
+    """
+    layers = gp_data.layers
+    if len(props.layer_settings) != len(layers) or props.layer_settings_owner != gp_data.name:
+        return True
+
+    active = layers.active
+    return active is not None and active.name not in _get_setting_names(props.layer_settings)
+
+
+@persistent
+def sync_layer_settings_on_update(scene, depsgraph):
+    """
+    Handler to pick up added or removed layers.
+
+    Layer add/remove isn't published on the message bus, so the layers are
+    checked after GP data updates. That runs for every stroke while
+    painting, so the list is only diffed when _layers_changed() finds a
+    change. Renames and active object changes are handled by the msgbus
+    subscriptions.
+    """
+    obj = depsgraph.view_layer.objects.active
+    if not obj or obj.type != 'GREASEPENCIL' or not obj.data:
+        return
+
+    for update in depsgraph.updates:
+        if update.id.id_type in GP_ID_TYPES:
+            props = scene.gph_keyframe_props
+            if _layers_changed(props, obj.data):
+                sync_object_layer_settings(props, obj.data)
+            return
+
+
+@persistent
+def invalidate_layer_settings_on_reload(dummy):
+    """Handler bumping the generation after undo, redo and file loads"""
+    global _generation
+    _generation += 1
+
+
+@persistent
+def sync_layer_settings_on_file_load(dummy):
+    """Handler to sync the layer settings of the opened file"""
+    sync_active_layer_settings(bpy.context)
@@ -0,0 +1,141 @@
+"""
+Layer solo - Snapshot-based solo with restorable lock/hide state
+
+Before soloing, the lock and hide flags of every layer are packed into two
+bitmasks (bit i = layer i) and stored with the layer names on the GP data
+block. Unsolo restores them exactly, matching layers by name so added,
+removed or reordered layers don't break the restore.
+
+The soloed layer names are cached per GP data block, so checking the solo
+state doesn't walk the layers on every redraw. The cache is dropped whenever
+a layer lock/hide flag changes (see msgbus_subscriptions) and revalidated
+against the layers once on the next read.
+"""
+
+from bpy.app.handlers import persistent
+
+SNAPSHOT_KEY = "gph_solo_snapshot"
+
+# GP data pointer -> frozenset of soloed layer names (empty when nothing is soloed)
+_solo_cache = {}
+
+
+def _pack_flags(layers, attribute):
+    """Pack a boolean layer attribute into an int bitmask"""
+    mask = 0
+    for index, layer in enumerate(layers):
+        if getattr(layer, attribute):
+            mask |= 1 << index
+    return mask
+
+
+def take_snapshot(gp_data, soloed_names, mode):
+    """Store the lock/hide state of every layer on the GP data"""
+    layers = list(gp_data.layers)
+
+    # Bitmasks are stored as hex strings, ID properties only hold 32-bit ints
+    gp_data[SNAPSHOT_KEY] = {
+        "layers": "\n".join(soloed_names),
+        "mode": mode,
+        "names": "\n".join(layer.name for layer in layers),
+        "lock": format(_pack_flags(layers, "lock"), "x"),
+        "hide": format(_pack_flags(layers, "hide"), "x"),
+    }
+
+
+def restore_snapshot(gp_data):
+    """Restore the lock/hide state stored before soloing and drop the snapshot"""
+    snapshot = gp_data.get(SNAPSHOT_KEY)
+    if snapshot is None:
+        return False
+
+    lock_mask = int(snapshot["lock"], 16)
+    hide_mask = int(snapshot["hide"], 16)
+    bits = {name: index for index, name in enumerate(snapshot["names"].split("\n"))}
+
+    for layer in gp_data.layers:
+        index = bits.get(layer.name)
+        if index is None:
+            continue
+        layer.lock = bool(lock_mask >> index & 1)
+        layer.hide = bool(hide_mask >> index & 1)
+
+    del gp_data[SNAPSHOT_KEY]
+    _solo_cache.pop(gp_data.as_pointer(), None)
+
+    return True
+
+
+def solo_layers(gp_data, layer_names, mode='LOCK'):
+    """
+    Solo layers by locking (or hiding) every other layer.
+
+    Any previous solo is restored first, so the snapshot always holds the
+    artist's own setup.
+
+    Args:
+        gp_data: Grease Pencil data block
+        layer_names: Names of the layers to keep editable/visible
+        mode: 'LOCK' to lock other layers, 'HIDE' to hide them
+    """
+    restore_snapshot(gp_data)
+
+    soloed = set(layer_names)
+    take_snapshot(gp_data, sorted(soloed), mode)
+
+    attribute = "lock" if mode == 'LOCK' else "hide"
+    for layer in gp_data.layers:
+        setattr(layer, attribute, layer.name not in soloed)
+
+    _solo_cache[gp_data.as_pointer()] = frozenset(soloed)
+
+
+def _read_solo_state(gp_data):
+    """Read the soloed layers from the snapshot, checking the layers still match it"""
+    snapshot = gp_data.get(SNAPSHOT_KEY)
+    if snapshot is None:
+        return frozenset()
+
+    soloed = frozenset(snapshot["layers"].split("\n"))
+    attribute = "lock" if snapshot["mode"] == 'LOCK' else "hide"
+
+    # The artist changed locks/visibility by hand since soloing
+    for layer in gp_data.layers:
+        if getattr(layer, attribute) == (layer.name in soloed):
+            return frozenset()
+
+    return soloed
+
+
+def get_soloed_layers(gp_data):
+    """Get the names of the soloed layers as a frozenset (cached)"""
+    pointer = gp_data.as_pointer()
+
+    soloed = _solo_cache.get(pointer)
+    if soloed is None:
+        soloed = _read_solo_state(gp_data)
+        _solo_cache[pointer] = soloed
+
+    return soloed
+
+
+def get_solo_mode(gp_data):
+    """Get the mode of the current solo ('LOCK' or 'HIDE'), None if not soloed"""
+    snapshot = gp_data.get(SNAPSHOT_KEY)
+    return snapshot["mode"] if snapshot is not None else None
+
+
+def is_layer_soloed(gp_data, layer):
+    """Check if a layer is currently soloed"""
+    return layer.name in get_soloed_layers(gp_data)
+
+
+def clear_solo_cache():
+    """Drop every cached solo state"""
+    _solo_cache.clear()
+
+
+@persistent
+def clear_solo_cache_on_reload(dummy):
+    """Handler to drop cached solo states when opening a file or stepping undo/redo"""
+    _solo_cache.clear()
@@ -0,0 +1,173 @@
+"""
+Light table - Reference objects showing a GP object locked to a frame
+
+Each source GP object gets a reference object sharing its data, linked to
+the GPH_Light_Table collection, with a Time Offset modifier holding the
+reference frame and an optional Tint modifier. Source and reference point
+at each other through ID custom properties.
+
+These functions only take the scene, not the context, so they run from
+scripts and background Blender as well as from the operators. The look of
+the references comes from the scene's light table settings.
+"""
+
+import bpy
+
+from .logger import get_logger
+
+log = get_logger(__name__)
+
+# Name of the collection holding every light table reference object
+LIGHT_TABLE_COLLECTION = "GPH_Light_Table"
+
+
+def get_reference_object(source_obj):
+    """Get the light table reference object of a source GP object, if any"""
+    ref = source_obj.get("gph_light_table_ref")
+
+    # Older files store the reference by name
+    if isinstance(ref, str):
+        return bpy.data.objects.get(ref)
+
+    return ref
+
+
+def get_light_table_collection(scene, create=False):
+    """Get the collection that holds all reference objects"""
+    collection = bpy.data.collections.get(LIGHT_TABLE_COLLECTION)
+
+    if collection is None and create:
+        collection = bpy.data.collections.new(LIGHT_TABLE_COLLECTION)
+        collection.hide_select = True
+        collection.hide_render = True
+        scene.collection.children.link(collection)
+
+    return collection
+
+
+def disable_light_table(source_obj):
+    """Remove the light table reference of a source GP object"""
+    ref_obj = get_reference_object(source_obj)
+
+    if ref_obj:
+        bpy.data.objects.remove(ref_obj, do_unlink=True)
+
+    if "gph_light_table_ref" in source_obj:
+        del source_obj["gph_light_table_ref"]
+
+
+def disable_all_light_tables():
+    """Remove every reference object in one batch"""
+    collection = bpy.data.collections.get(LIGHT_TABLE_COLLECTION)
+    if collection is None:
+        return 0
+
+    ref_objects = list(collection.objects)
+
+    # Unlink sources through the stored pointer, no name lookups needed
+    for ref_obj in ref_objects:
+        source_obj = ref_obj.get("gph_light_table_source")
+        if source_obj is not None and not isinstance(source_obj, str):
+            if "gph_light_table_ref" in source_obj:
+                del source_obj["gph_light_table_ref"]
+
+    bpy.data.batch_remove(ref_objects + [collection])
+
+    return len(ref_objects)
+
+
+def update_reference_object(ref_obj, props):
+    """Apply the shared light table settings to a reference object"""
+    # Update opacity
+    ref_obj.color[3] = props.opacity
+
+    # Update show in front
+    ref_obj.show_in_front = props.show_in_front
+
+    # Update time offset modifier - use 'offset' attribute
+    for mod in ref_obj.modifiers:
+        if mod.type == 'GREASE_PENCIL_TIME' and mod.name == "Light Table Lock":
+            mod.offset = props.reference_frame
+            log.debug("Updated Time Offset modifier to frame %d", mod.offset)
+
+        # Update tint modifier
+        elif mod.type == 'GREASE_PENCIL_TINT' and mod.name == "Light Table Tint":
+            if props.use_tint:
+                mod.color = props.tint_color
+                mod.show_viewport = True
+            else:
+                mod.show_viewport = False
+
+
+def build_reference_object(scene, source_obj, collection):
+    """Create the reference object of a source GP object, without redrawing"""
+    props = scene.gph_light_table_props
+
+    # Remove old reference if exists
+    disable_light_table(source_obj)
+
+    try:
+        # Duplicate the GP object
+        ref_obj = source_obj.copy()
+        ref_obj.data = source_obj.data  # Link to same data
+        ref_obj.name = f"{source_obj.name}_LIGHT_TABLE_REF"
+
+        # Link to the light table collection
+        collection.objects.link(ref_obj)
+
+        # Clear all modifiers from the duplicate for a clean reference
+        ref_obj.modifiers.clear()
+        log.debug("Cleared %d modifiers from reference object", len(source_obj.modifiers))
+
+        # Add Time Offset modifier
+        try:
+            time_mod = ref_obj.modifiers.new(name="Light Table Lock", type='GREASE_PENCIL_TIME')
+            time_mod.mode = 'FIX'
+
+            # For Grease Pencil v3 Time Offset modifier, use 'offset' attribute
+            time_mod.offset = props.reference_frame
+
+            log.debug("Created Time Offset modifier locked to frame %d", time_mod.offset)
+
+        except Exception as e:
+            log.warning("Could not create Time Offset modifier: %s", e, exc_info=True)
+
+        # Add Tint modifier if enabled
+        if props.use_tint:
+            try:
+                tint_mod = ref_obj.modifiers.new(name="Light Table Tint", type='GREASE_PENCIL_TINT')
+                tint_mod.color = props.tint_color
+                tint_mod.factor = 1.0
+                log.debug("Created Tint modifier")
+            except Exception as e:
+                log.warning("Could not create Tint modifier: %s", e, exc_info=True)
+
+        # Set opacity
+        ref_obj.color[3] = props.opacity
+
+        # Set display properties
+        ref_obj.show_in_front = props.show_in_front
+        ref_obj.hide_render = True
+        ref_obj.hide_select = True
+
+        # Store references both ways as ID pointers
+        source_obj["gph_light_table_ref"] = ref_obj
+        ref_obj["gph_light_table_source"] = source_obj
+
+        return True
+
+    except Exception as e:
+        log.error("Error creating light table reference: %s", e, exc_info=True)
+        return False
+
+
+def create_reference_objects(scene, source_objects):
+    """Create reference objects for several GP objects in one pass"""
+    collection = get_light_table_collection(scene, create=True)
+
+    created = 0
+    for source_obj in source_objects:
+        if build_reference_object(scene, source_obj, collection):
+            created += 1
+
+    return created
@@ -0,0 +1,74 @@
+"""
+Logger - Central leveled logger for GP Helper
+
+Every module logs through a child of the "gp_helper" logger:
+
+    from ..utils.logger import get_logger
+    log = get_logger(__name__)
+    log.debug("Moved %d frames on %s", count, layer.name)
+
+Only warnings and errors are shown by default, so debug messages cost a
+level check: arguments are formatted only when the message is emitted.
+Wrap diagnostics that need extra work to compute in
+log.isEnabledFor(logging.DEBUG).
+
+Set the GP_HELPER_LOG_LEVEL environment variable (DEBUG, INFO, WARNING,
+ERROR) before starting Blender to change the level, or call set_log_level().
+"""
+
+import logging
+import os
+
+LOGGER_NAME = "gp_helper"
+ENV_VAR = "GP_HELPER_LOG_LEVEL"
+DEFAULT_LEVEL = logging.WARNING
+
+log = logging.getLogger(LOGGER_NAME)
+
+
+def _level_from_environment():
+    name = os.environ.get(ENV_VAR, "").strip().upper()
+    level = logging.getLevelName(name) if name else DEFAULT_LEVEL
+    return level if isinstance(level, int) else DEFAULT_LEVEL
+
+
+def _configure():
+    """Give the logger its own console handler (once per session)"""
+    if not log.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("GP Helper %(levelname)s [%(name)s]: %(message)s"))
+        log.addHandler(handler)
+
+    # Blender or other add-ons may configure the root logger
+    log.propagate = False
+    log.setLevel(_level_from_environment())
+
+
+def get_logger(name=None):
+    """
+    Get the GP Helper logger, or a child for a module.
+
+    Args:
+        name: Module __name__ (its last part names the child), or None
+
+    Returns:
+        logging.Logger
+    """
+    if not name:
+        return log
+    return log.getChild(name.rsplit(".", 1)[-1])
+
+
+def set_log_level(level):
+    """
+    Set the GP Helper log level.
+
+    Args:
+        level: logging level number or name ('DEBUG', 'INFO', ...)
+    """
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+    log.setLevel(level)
+
+
+_configure()
@@ -0,0 +1,59 @@
+"""
+Message bus subscriptions - Keep GP Helper caches in sync with layer changes
+
+Subscribing through bpy.msgbus means caches are invalidated only when the
+watched RNA properties actually change, instead of being recomputed on every
+panel redraw. Subscriptions are dropped by Blender when a file is loaded, so
+they are renewed from a load_post handler.
+"""
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .layer_solo import clear_solo_cache
+from .layer_settings_sync import sync_active_layer_settings
+
+# Owner of every subscription made by GP Helper
+_msgbus_owner = object()
+
+
+def _on_layer_state_changed(*args):
+    """A layer lock/hide flag changed"""
+    clear_solo_cache()
+
+
+def _on_layer_stack_changed(*args):
+    """A layer was renamed or another object was made active"""
+    sync_active_layer_settings(bpy.context)
+
+
+def subscribe_layer_updates():
+    """Subscribe to GP layer property changes"""
+    for prop in ("lock", "hide"):
+        bpy.msgbus.subscribe_rna(
+            key=(bpy.types.GreasePencilLayer, prop),
+            owner=_msgbus_owner,
+            args=(),
+            notify=_on_layer_state_changed,
+        )
+
+    # Keyframe mover layer list (layer add/remove is caught by a depsgraph handler)
+    for key in ((bpy.types.GreasePencilLayer, "name"), (bpy.types.LayerObjects, "active")):
+        bpy.msgbus.subscribe_rna(
+            key=key,
+            owner=_msgbus_owner,
+            args=(),
+            notify=_on_layer_stack_changed,
+        )
+
+
+def unsubscribe_layer_updates():
+    """Remove every GP Helper subscription"""
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+
+
+@persistent
+def resubscribe_layer_updates_on_file_load(dummy):
+    """Handler to renew subscriptions when opening a file"""
+    unsubscribe_layer_updates()
+    subscribe_layer_updates()
@@ -0,0 +1,226 @@
+"""
+Profiling - Timing instrumentation for GP Helper operators
+
+instrument_operator() wraps an operator's execute() so every run records:
+- wall time of execute(), up to the end of its modal run when execute()
+  returns RUNNING_MODAL (chunked jobs, see operators/GPH_jobs.py)
+- depsgraph evaluations triggered while it ran (frame_set, view layer
+  updates and nested operators evaluate synchronously; the evaluation
+  Blender does after the operator returns isn't included)
+- GP frames and F-curve keys touched, in the scene's GP objects (opt-in,
+  it snapshots every key before and after the run)
+- whether Blender pushes an undo step for it (UNDO operator that FINISHED)
+
+The last HISTORY_SIZE runs are kept for the Performance panel. With
+"Profile Next Run" enabled, the next operator runs under cProfile and its
+stats are written to a .prof file.
+"""
+
+import cProfile
+import functools
+import os
+import tempfile
+import time
+from collections import deque, namedtuple
+
+import bpy
+from bpy.app.handlers import persistent
+
+HISTORY_SIZE = 20
+
+OperatorTiming = namedtuple(
+    "OperatorTiming",
+    ["idname", "label", "result", "wall_ms", "depsgraph_evals", "keys_touched", "undo_push", "profile_path"],
+)
+
+# Most recent run last
+_history = deque(maxlen=HISTORY_SIZE)
+
+# Total depsgraph evaluations seen by count_depsgraph_update
+_depsgraph_evals = 0
+
+
+def get_operator_history():
+    """Get the recorded operator runs, most recent first"""
+    return list(reversed(_history))
+
+
+def clear_operator_history():
+    """Forget the recorded operator runs"""
+    _history.clear()
+
+
+@persistent
+def count_depsgraph_update(scene, depsgraph):
+    """Handler counting depsgraph evaluations"""
+    global _depsgraph_evals
+    _depsgraph_evals += 1
+
+
+def _snapshot_keys(scene):
+    """Collect every GP frame and F-curve key of the scene's GP objects"""
+    keys = set()
+
+    for obj in scene.objects:
+        if obj.type != 'GREASEPENCIL' or not obj.data:
+            continue
+
+        object_key = obj.name
+        for layer in obj.data.layers:
+            for gp_frame in layer.frames:
+                keys.add((object_key, layer.name, gp_frame.frame_number))
+
+        for id_data in (obj, obj.data):
+            if not id_data.animation_data or not id_data.animation_data.action:
+                continue
+            for fcurve in id_data.animation_data.action.fcurves:
+                points = fcurve.keyframe_points
+                co = [0.0] * (len(points) * 2)
+                points.foreach_get("co", co)
+                curve_key = (object_key, fcurve.data_path, fcurve.array_index)
+                keys.update((curve_key, co[index], co[index + 1]) for index in range(0, len(co), 2))
+
+    return keys
+
+
+def _count_touched(before, after):
+    """Keys added, removed or moved between two snapshots (a move counts once)"""
+    return max(len(before - after), len(after - before))
+
+
+def _profile_path(props, idname):
+    directory = bpy.path.abspath(props.profile_directory) if props.profile_directory else tempfile.gettempdir()
+    os.makedirs(directory, exist_ok=True)
+    filename = f"{idname.replace('.', '_')}_{time.strftime('%Y%m%d_%H%M%S')}.prof"
+    return os.path.join(directory, filename)
+
+
+class _Run:
+    """Measurements of one operator run, from start to end"""
+
+    def __init__(self, context):
+        self.scene = context.scene
+        self.props = getattr(self.scene, "gph_performance_props", None)
+
+        self.profiler = None
+        if self.props and self.props.profile_next_run:
+            self.props.profile_next_run = False
+            self.profiler = cProfile.Profile()
+
+        self.keys_before = _snapshot_keys(self.scene) if self.props and self.props.count_touched_keys else None
+        self.evals_before = _depsgraph_evals
+        self.start = time.perf_counter()
+
+    def call(self, method, operator, context):
+        if not self.profiler:
+            return method(operator, context)
+
+        self.profiler.enable()
+        try:
+            return method(operator, context)
+        finally:
+            self.profiler.disable()
+
+    def resume_profiling(self):
+        """Keep profiling until end(), timer callbacks of a modal run included"""
+        if self.profiler:
+            self.profiler.enable()
+
+    def end(self, operator, result):
+        wall_ms = (time.perf_counter() - self.start) * 1000.0
+        depsgraph_evals = _depsgraph_evals - self.evals_before
+
+        keys_touched = None
+        if self.keys_before is not None:
+            keys_touched = _count_touched(self.keys_before, _snapshot_keys(self.scene))
+
+        profile_path = ""
+        if self.profiler:
+            self.profiler.disable()
+            profile_path = _profile_path(self.props, operator.bl_idname)
+            self.profiler.dump_stats(profile_path)
+
+        finished = bool(result) and 'FINISHED' in result
+        _history.append(OperatorTiming(
+            idname=operator.bl_idname,
+            label=operator.bl_label,
+            result=", ".join(sorted(result)) if result else "ERROR",
+            wall_ms=wall_ms,
+            depsgraph_evals=depsgraph_evals,
+            keys_touched=keys_touched,
+            undo_push=finished and 'UNDO' in getattr(type(operator), "bl_options", set()),
+            profile_path=profile_path,
+        ))
+
+
+def _is_modal(result):
+    return bool(result) and ('RUNNING_MODAL' in result or 'PASS_THROUGH' in result)
+
+
+def _timed_execute(execute):
+    """Wrap an operator execute() with timing"""
+
+    @functools.wraps(execute)
+    def wrapper(self, context):
+        run = _Run(context)
+        result = None
+        try:
+            result = run.call(execute, self, context)
+            return result
+
+        finally:
+            if result and 'RUNNING_MODAL' in result:
+                # Recorded when the modal run ends (see _timed_modal)
+                self._gph_run = run
+                run.resume_profiling()
+            else:
+                run.end(self, result)
+
+    wrapper._gph_timed = True
+    return wrapper
+
+
+def _timed_modal(modal):
+    """Wrap an operator modal() to end the timing of runs started by execute()"""
+
+    @functools.wraps(modal)
+    def wrapper(self, context, event):
+        result = None
+        try:
+            result = modal(self, context, event)
+            return result
+
+        finally:
+            run = getattr(self, "_gph_run", None)
+            if run is not None and not _is_modal(result):
+                self._gph_run = None
+                run.end(self, result)
+
+    wrapper._gph_timed = True
+    return wrapper
+
+
+def instrument_operator(cls):
+    """
+    Record the runs of an operator class (call before registering it).
+
+    Classes setting record_timing = False are left alone.
+
+    Args:
+        cls: Operator class with an execute() method (and modal(), for
+            runs that go on after execute() returns RUNNING_MODAL)
+
+    Returns:
+        The same class
+    """
+    if not getattr(cls, "record_timing", True):
+        return cls
+
+    execute = getattr(cls, "execute", None)
+    if execute and not getattr(execute, "_gph_timed", False):
+        cls.execute = _timed_execute(execute)
+
+    modal = getattr(cls, "modal", None)
+    if execute and modal and not getattr(modal, "_gph_timed", False):
+        cls.modal = _timed_modal(modal)
+    return cls
@@ -0,0 +1,231 @@
+"""
+Timing - Pure planning functions for the retiming operators
+
+The operators decide where keys go (keyframe spacing, the collision-safe
+backward offset, marker spacing) with plain integer arithmetic on frame
+numbers. That planning lives here, free of bpy and context, so it can be
+swept and profiled outside Blender (see benchmarks/fake_bpy.py). The
+operators gather the frame numbers, call these functions and apply the plan.
+
+apply_frame_plan() and shift_frames() only need a layer exposing
+frames.move (or copy/remove) and the frame_number of its frames, which the
+fake data model provides as well.
+"""
+
+# Frames are parked this far away while a plan is applied
+TEMP_FRAME_OFFSET = 100000
+
+# Spacing assumed around a marker when none can be detected
+DEFAULT_MARKER_SPACING = 10
+
+
+def plan_keyframe_spacing(all_frames, selected_frames, spacing):
+    """
+    Plan the new position of every frame of a layer when spacing its selection.
+
+    Selected frames are laid out every `spacing` frames from the first one.
+    Frames before the selection stay, frames after it shift with the last
+    selected frame, and frames in between are placed proportionally between
+    their surrounding selected frames.
+
+    Args:
+        all_frames: Sorted frame numbers of the layer
+        selected_frames: Sorted selected frame numbers (at least 2)
+        spacing: Frame interval between the selected frames
+
+    Returns:
+        dict: Old frame number -> new frame number, for every frame
+    """
+    start_frame = selected_frames[0]
+    selected_new_positions = {
+        old_frame: start_frame + index * spacing
+        for index, old_frame in enumerate(selected_frames)
+    }
+
+    first_selected = selected_frames[0]
+    last_selected = selected_frames[-1]
+    shift_after = selected_new_positions[last_selected] - last_selected
+
+    plan = {}
+    segment = 0
+    for frame_number in all_frames:
+        new_position = selected_new_positions.get(frame_number)
+        if new_position is not None:
+            plan[frame_number] = new_position
+        elif frame_number < first_selected:
+            plan[frame_number] = frame_number
+        elif frame_number > last_selected:
+            plan[frame_number] = frame_number + shift_after
+        else:
+            # all_frames is sorted, so the surrounding selected pair only moves forward
+            while selected_frames[segment + 1] < frame_number:
+                segment += 1
+            prev_selected = selected_frames[segment]
+            next_selected = selected_frames[segment + 1]
+
+            prev_new = selected_new_positions[prev_selected]
+            next_new = selected_new_positions[next_selected]
+            proportion = (frame_number - prev_selected) / (next_selected - prev_selected)
+            plan[frame_number] = round(prev_new + proportion * (next_new - prev_new))
+
+    return plan
+
+
+def move_frame(frames, from_frame_number, to_frame_number):
+    """Move a drawing frame, keeping its drawing instead of copying it"""
+    if hasattr(frames, "move"):
+        frames.move(from_frame_number, to_frame_number)
+    else:
+        frames.copy(from_frame_number, to_frame_number, instance_drawing=True)
+        frames.remove(from_frame_number)
+
+
+def shift_frames(layer, frame_numbers, offset):
+    """
+    Move frames of a layer by the same offset.
+
+    Frames are moved in an order where none of them lands on another moving
+    frame. A frame that isn't moving and sits on a destination is replaced,
+    like the Dope Sheet does.
+
+    Args:
+        layer: GP layer
+        frame_numbers: Frame numbers to move
+        offset: Frames to move by (negative moves left)
+
+    Returns:
+        int: Number of frames moved
+    """
+    moving = set(frame_numbers)
+    if not offset or not moving:
+        return 0
+
+    frames = layer.frames
+    occupied = {gp_frame.frame_number for gp_frame in frames} - moving
+
+    for frame_number in sorted(moving, reverse=offset > 0):
+        target = frame_number + offset
+        if target in occupied:
+            frames.remove(target)
+            occupied.discard(target)
+        move_frame(frames, frame_number, target)
+
+    return len(moving)
+
+
+def apply_frame_plan(layer, plan, temp_offset=TEMP_FRAME_OFFSET):
+    """
+    Move the frames of a layer to their planned positions without losing any.
+
+    Frames are parked at temporary positions, then each frame is moved to
+    its final position. When two frames land on the same position, the
+    later one wins.
+
+    Args:
+        layer: GP layer
+        plan: Old frame number -> new frame number
+        temp_offset: Distance of the temporary positions
+
+    Returns:
+        int: Number of collisions (frames overwritten)
+    """
+    frames = layer.frames
+
+    for old_position in plan:
+        move_frame(frames, old_position, old_position + temp_offset)
+
+    placed = set()
+    collisions = 0
+    for old_position, new_position in plan.items():
+        if new_position in placed:
+            frames.remove(new_position)
+            collisions += 1
+
+        move_frame(frames, old_position + temp_offset, new_position)
+        placed.add(new_position)
+
+    return collisions
+
+
+def calculate_safe_backward_offset(current_frame, desired_offset, affected_keyframes):
+    """
+    Get the largest backward offset that keeps every affected key after the playhead.
+
+    Args:
+        current_frame: Playhead frame
+        desired_offset: Requested offset (positive, towards the left)
+        affected_keyframes: Frame numbers of the keys after the playhead
+
+    Returns:
+        int: Offset to use, 0 if no key can move
+    """
+    if not affected_keyframes:
+        return desired_offset
+
+    min_distance = min(affected_keyframes) - current_frame
+
+    if min_distance <= desired_offset:
+        # The closest key would reach the playhead, stop one frame before it
+        safe_offset = min_distance - 1
+        return safe_offset if safe_offset >= 1 else 0
+
+    return max(1, desired_offset)
+
+
+def detect_spacing_around_marker(keyframes, marker_frame):
+    """
+    Detect the spacing of the keys around a marker.
+
+    Args:
+        keyframes: Sorted, unique frame numbers near the marker
+        marker_frame: Marker frame
+
+    Returns:
+        float: Distance between the keys on each side of the marker, or the
+        average key spacing if the marker isn't surrounded. 0 with fewer
+        than 2 keys.
+    """
+    if len(keyframes) < 2:
+        return 0
+
+    before = [frame for frame in keyframes if frame < marker_frame]
+    after = [frame for frame in keyframes if frame > marker_frame]
+
+    if before and after:
+        return after[0] - before[-1]
+
+    # Average spacing of the sorted keys
+    return (keyframes[-1] - keyframes[0]) / (len(keyframes) - 1)
+
+
+def calculate_spacing_to_add(
+    marker_frame,
+    nearby_keyframes,
+    spacing_method='MULTIPLIER',
+    fixed_spacing=20,
+    spacing_multiplier=2.0,
+    auto_detect_spacing=True,
+):
+    """
+    Get the number of frames to insert at a marker.
+
+    Args:
+        marker_frame: Marker frame
+        nearby_keyframes: Sorted, unique frame numbers near the marker
+        spacing_method: 'FIXED' or 'MULTIPLIER'
+        fixed_spacing: Frames to add with the FIXED method
+        spacing_multiplier: Factor applied to the existing spacing
+        auto_detect_spacing: Detect the existing spacing from the keys
+
+    Returns:
+        int: Frames to add
+    """
+    if spacing_method == 'FIXED':
+        return fixed_spacing
+
+    if auto_detect_spacing:
+        existing_spacing = detect_spacing_around_marker(nearby_keyframes, marker_frame)
+        if existing_spacing > 0:
+            return int(existing_spacing * spacing_multiplier - existing_spacing)
+
+    return int(DEFAULT_MARKER_SPACING * spacing_multiplier - DEFAULT_MARKER_SPACING)